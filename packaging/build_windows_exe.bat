@@ -10,14 +10,26 @@ if "%~1"=="" (
     set "PYTHON=%~1"
 )
 
+echo Processing sounds into build\sounds
+%PYTHON% packaging\process_sounds.py
+set "ERR=%ERRORLEVEL%"
+if not "%ERR%"=="0" (
+    echo.
+    echo Sound processing failed with exit code %ERR%.
+    goto :done
+)
+
+echo.
 echo Packaging Kensho using %PYTHON%
 echo.
+rem SoundManager looks for sounds under src\kensho\resources in the bundle
 %PYTHON% -m PyInstaller ^
     --noconfirm ^
     --clean ^
     --name Kensho ^
     --windowed ^
     --collect-all win10toast ^
+    --add-data "build\sounds;src\kensho\resources\sounds" ^
     src\kensho\app.py
 
 set "ERR=%ERRORLEVEL%"
@@ -26,5 +38,7 @@ if not "%ERR%"=="0" (
     echo PyInstaller failed with exit code %ERR%.
 )
 
+:done
+
 popd
 exit /b %ERR%
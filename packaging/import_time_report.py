@@ -0,0 +1,81 @@
+"""Report import cost of the Kenshō package.
+
+Runs a fresh interpreter with ``-X importtime`` and summarises the result:
+the slowest modules overall (by cumulative time) and every ``kensho.*``
+module. Use it to check that launch-path imports stay lean, e.g.::
+
+    python packaging/import_time_report.py
+    python packaging/import_time_report.py --module kensho.ui.main_window --top 30
+    python packaging/import_time_report.py --json import_time.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SRC_DIR = REPO_ROOT / "src"
+
+
+def measure(module: str) -> List[Dict[str, object]]:
+    """Import `module` in a clean interpreter and parse -X importtime output."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        sys.stderr.write(proc.stderr)
+        raise SystemExit(f"Importing {module} failed")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, _, payload = line.partition(":")
+        self_us, cumulative_us, name = (part.strip() for part in payload.split("|", 2))
+        rows.append({
+            "module": name.strip(),
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000,
+        })
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="kensho.app", help="module to import (default: kensho.app)")
+    parser.add_argument("--top", type=int, default=15, help="how many of the slowest modules to list")
+    parser.add_argument("--json", metavar="PATH", help="also write the full table as JSON")
+    args = parser.parse_args()
+
+    rows = measure(args.module)
+    total = max((row["cumulative_ms"] for row in rows), default=0.0)
+
+    print(f"Importing {args.module}: {total:.1f} ms total, {len(rows)} modules\n")
+    print(f"Slowest {args.top} by cumulative time:")
+    for row in sorted(rows, key=lambda r: r["cumulative_ms"], reverse=True)[: args.top]:
+        print(f"  {row['cumulative_ms']:9.1f} ms  {row['module']}")
+
+    print("\nkensho modules:")
+    for row in rows:
+        if row["module"].startswith("kensho"):
+            print(f"  {row['cumulative_ms']:9.1f} ms  (self {row['self_ms']:.1f})  {row['module']}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({"module": args.module, "total_ms": total, "imports": rows}, indent=2))
+        print(f"\nWrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Benchmark ConcentricRings paint time on the offscreen platform.
+
+Renders the widget repeatedly into an image and reports the time per
+frame. ``cached`` is the normal path (static rings blitted from the cached
+pixmap); ``uncached`` drops the cache before every frame, which is what a
+resize costs and roughly what every frame cost before the cache existed;
+``one ring`` repaints only the innermost ring's annulus, as a tick or pulse
+on that clock does::
+
+    python packaging/paint_benchmark.py
+    python packaging/paint_benchmark.py --clocks 6 --size 600 --scale 2 --frames 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clocks", type=int, default=4, help="number of rings (default: 4)")
+    parser.add_argument("--size", type=int, default=300, help="widget size in pixels (default: 300)")
+    parser.add_argument("--scale", type=float, default=1.0, help="device pixel ratio (default: 1)")
+    parser.add_argument("--frames", type=int, default=300, help="frames per measurement (default: 300)")
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.environ["QT_SCALE_FACTOR"] = str(args.scale)
+
+    from PySide6.QtCore import QPoint, Qt
+    from PySide6.QtGui import QImage
+    from PySide6.QtWidgets import QApplication
+    from kensho.core.models import ClockUnit
+    from kensho.ui.clock_model import ClockListModel
+    from kensho.ui.components.concentric_rings import ConcentricRings
+
+    app = QApplication.instance() or QApplication([])
+    clocks = []
+    for i in range(args.clocks):
+        clock = ClockUnit(f"C{i + 1}", f"Clock {i + 1}", 25)
+        clock._elapsed_seconds = 25 * 60 * (i + 1) / (args.clocks + 1)
+        clock._paused = False  # draw the breathing arc without running timers
+        clocks.append(clock)
+
+    model = ClockListModel()
+    model.set_clocks(clocks)
+    rings = ConcentricRings(model)
+    rings.resize(args.size, args.size)
+    rings.show()
+    app.processEvents()
+
+    dpr = rings.devicePixelRatioF()
+    image = QImage(round(args.size * dpr), round(args.size * dpr), QImage.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(dpr)
+
+    def measure(drop_cache: bool, region=None):
+        samples = []
+        for frame in range(args.frames):
+            rings.set_pulse_frame(frame % len(rings.pulse))
+            if drop_cache:
+                rings._background = None
+            image.fill(Qt.transparent)
+            start = time.perf_counter()
+            if region is None:
+                rings.render(image)
+            else:
+                rings.render(image, QPoint(), region)
+            samples.append((time.perf_counter() - start) * 1000)
+        return samples
+
+    print(f"{args.clocks} rings, {args.size}px at {dpr:g}x, {args.frames} frames\n")
+    inner = rings._rings()[-1].region
+    for name, drop_cache, region in (("cached", False, None), ("uncached", True, None),
+                                     ("one ring", False, inner)):
+        samples = sorted(measure(drop_cache, region))
+        p95 = samples[int(len(samples) * 0.95) - 1]
+        print(f"  {name:9} median {statistics.median(samples):6.3f} ms   p95 {p95:6.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
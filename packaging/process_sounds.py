@@ -0,0 +1,222 @@
+"""Shrink and normalize the bundled notification sounds for release builds.
+
+Reads every WAV in ``src/kensho/resources/sounds`` and writes a processed
+copy to ``build/sounds`` (the originals stay untouched as the masters):
+
+* leading and trailing silence is trimmed (with a short fade-out so the cut
+  never clicks),
+* loudness is normalized to a common RMS level, limited by a peak ceiling,
+* audio is low-pass filtered and down-converted to mono 16-bit at 22050 Hz.
+
+A ``manifest.json`` with durations and formats is written next to the files;
+the sound catalog reads it instead of opening every WAV header. Each
+processed file is then verified against its original (format, duration,
+level and waveform similarity to the original converted the same way). Use it as::
+
+    python packaging/process_sounds.py
+    python packaging/process_sounds.py --rate 32000 --out build/sounds
+    python packaging/process_sounds.py --verify-only
+
+``setup.py`` bundles ``build/sounds`` in place of the originals when it exists.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import wave
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SOURCE_DIR = REPO_ROOT / "src" / "kensho" / "resources" / "sounds"
+OUTPUT_DIR = REPO_ROOT / "build" / "sounds"
+MANIFEST_NAME = "manifest.json"
+
+TARGET_RATE = 22050
+# Quieter than this relative to the sound's own peak counts as silence
+SILENCE_DB = -48.0
+TARGET_RMS_DB = -18.0
+PEAK_CEILING_DB = -1.0
+FADE_MS = 10.0
+# Processed audio must still match the original this closely once both are
+# band-limited to the new rate
+MIN_CORRELATION = 0.98
+
+
+def db(value: float) -> float:
+    return 20.0 * np.log10(max(value, 1e-10))
+
+
+def read_wav(path: Path) -> Tuple[np.ndarray, int]:
+    """Mono float64 samples in [-1, 1] and the sample rate."""
+    with wave.open(str(path), "rb") as handle:
+        channels = handle.getnchannels()
+        width = handle.getsampwidth()
+        rate = handle.getframerate()
+        raw = handle.readframes(handle.getnframes())
+    if width == 1:
+        samples = (np.frombuffer(raw, dtype=np.uint8).astype(np.float64) - 128.0) / 128.0
+    elif width == 2:
+        samples = np.frombuffer(raw, dtype="<i2") / 32768.0
+    elif width == 4:
+        samples = np.frombuffer(raw, dtype="<i4") / 2147483648.0
+    else:
+        raise ValueError(f"{path.name}: unsupported sample width {width}")
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    return samples, rate
+
+
+def write_wav(path: Path, samples: np.ndarray, rate: int) -> None:
+    pcm = np.round(np.clip(samples, -1.0, 1.0) * 32767.0).astype("<i2")
+    with wave.open(str(path), "wb") as handle:
+        handle.setnchannels(1)
+        handle.setsampwidth(2)
+        handle.setframerate(rate)
+        handle.writeframes(pcm.tobytes())
+
+
+def trim_silence(samples: np.ndarray, rate: int, threshold_db: float = SILENCE_DB) -> Tuple[np.ndarray, int]:
+    """Cut everything before the first and after the last sample above the threshold."""
+    if not len(samples):
+        return samples, 0
+    level = np.abs(samples)
+    loud = np.nonzero(level > level.max() * 10 ** (threshold_db / 20.0))[0]
+    if not len(loud):
+        return samples[:0], 0
+    start, end = int(loud[0]), int(loud[-1]) + 1
+    trimmed = samples[start:end].copy()
+    fade = min(len(trimmed), int(rate * FADE_MS / 1000.0))
+    if fade:
+        trimmed[-fade:] *= np.linspace(1.0, 0.0, fade)
+    return trimmed, start
+
+
+def normalize(samples: np.ndarray) -> np.ndarray:
+    """Scale to TARGET_RMS_DB unless that would push peaks over the ceiling."""
+    if not len(samples):
+        return samples
+    rms = float(np.sqrt(np.mean(samples ** 2)))
+    peak = float(np.max(np.abs(samples)))
+    gain = min(10 ** (TARGET_RMS_DB / 20.0) / max(rms, 1e-10),
+               10 ** (PEAK_CEILING_DB / 20.0) / max(peak, 1e-10))
+    return samples * gain
+
+
+def lowpass(samples: np.ndarray, rate: int, cutoff: float, taps: int = 101) -> np.ndarray:
+    """Windowed-sinc FIR low-pass (zero phase, same length)."""
+    n = np.arange(taps) - (taps - 1) / 2.0
+    kernel = np.sinc(2.0 * cutoff / rate * n) * np.blackman(taps)
+    kernel /= kernel.sum()
+    return np.convolve(samples, kernel, mode="same")
+
+
+def resample(samples: np.ndarray, rate: int, target: int) -> np.ndarray:
+    if rate == target or not len(samples):
+        return samples
+    if target < rate:
+        samples = lowpass(samples, rate, 0.45 * target)
+    duration = len(samples) / rate
+    positions = np.arange(int(round(duration * target))) * (rate / target)
+    return np.interp(positions, np.arange(len(samples)), samples)
+
+
+def process(source: Path, dest: Path, rate: int) -> Dict[str, object]:
+    samples, source_rate = read_wav(source)
+    trimmed, trim_start = trim_silence(samples, source_rate)
+    processed = resample(normalize(trimmed), source_rate, rate)
+    write_wav(dest, processed, rate)
+    return {
+        "file": dest.name,
+        "duration": round(len(processed) / rate, 3),
+        "sample_rate": rate,
+        "channels": 1,
+        "sample_width": 2,
+        "trim_start": round(trim_start / source_rate, 4),
+        "peak_db": round(db(float(np.max(np.abs(processed)))) if len(processed) else -200.0, 2),
+        "rms_db": round(db(float(np.sqrt(np.mean(processed ** 2)))) if len(processed) else -200.0, 2),
+        "source_bytes": source.stat().st_size,
+        "bytes": dest.stat().st_size,
+    }
+
+
+def verify(source: Path, entry: Dict[str, object], out_dir: Path) -> List[str]:
+    """Compare one processed file against its original; return problems found."""
+    problems = []
+    path = out_dir / str(entry["file"])
+    with wave.open(str(path), "rb") as handle:
+        if (handle.getnchannels(), handle.getsampwidth(), handle.getframerate()) != \
+                (1, 2, entry["sample_rate"]):
+            problems.append("format does not match manifest")
+        frames = handle.getnframes()
+    processed, rate = read_wav(path)
+    original, source_rate = read_wav(source)
+
+    if abs(frames / rate - float(entry["duration"])) > 0.002:
+        problems.append("duration does not match manifest")
+    if frames / rate > len(original) / source_rate + 0.002:
+        problems.append("longer than the original")
+    if len(processed) and db(float(np.max(np.abs(processed)))) > PEAK_CEILING_DB + 0.1:
+        problems.append("peak above ceiling")
+
+    # Convert the original the same way, minus trimming and gain; the shapes
+    # must match up to a gain.
+    start = int(round(float(entry["trim_start"]) * source_rate))
+    reference = resample(original[start:], source_rate, rate)
+    n = min(len(reference), len(processed))
+    if n:
+        a, b = reference[:n], processed[:n]
+        correlation = float(np.dot(a, b) / max(np.linalg.norm(a) * np.linalg.norm(b), 1e-12))
+        if correlation < MIN_CORRELATION:
+            problems.append(f"waveform correlation {correlation:.3f} < {MIN_CORRELATION}")
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--source", type=Path, default=SOURCE_DIR, help="directory with the original WAVs")
+    parser.add_argument("--out", type=Path, default=OUTPUT_DIR, help="where to write the processed set")
+    parser.add_argument("--rate", type=int, default=TARGET_RATE, help="output sample rate (default: 22050)")
+    parser.add_argument("--verify-only", action="store_true", help="check an existing processed set")
+    args = parser.parse_args()
+
+    sources = sorted(args.source.glob("*.wav"))
+    manifest_path = args.out / MANIFEST_NAME
+    if args.verify_only:
+        manifest = json.loads(manifest_path.read_text())
+    else:
+        args.out.mkdir(parents=True, exist_ok=True)
+        manifest = {"version": 1, "sounds": {}}
+        for source in sources:
+            manifest["sounds"][source.stem] = process(source, args.out / source.name, args.rate)
+        manifest_path.write_text(json.dumps(manifest, indent=2))
+
+    failures = 0
+    before = after = 0
+    for source in sources:
+        entry = manifest["sounds"].get(source.stem)
+        if entry is None:
+            print(f"  MISSING  {source.name}")
+            failures += 1
+            continue
+        problems = verify(source, entry, args.out)
+        failures += bool(problems)
+        before += int(entry["source_bytes"])
+        after += int(entry["bytes"])
+        status = "FAIL" if problems else "ok"
+        print(f"  {status:4}  {source.name:20} {entry['duration']:6.3f} s  "
+              f"{entry['source_bytes'] / 1024:7.1f} KB -> {entry['bytes'] / 1024:6.1f} KB  "
+              f"rms {entry['rms_db']:6.1f} dB  peak {entry['peak_db']:5.1f} dB"
+              + (f"  ({'; '.join(problems)})" if problems else ""))
+
+    print(f"\n{len(sources)} sounds: {before / 1024:.0f} KB -> {after / 1024:.0f} KB")
+    if failures:
+        raise SystemExit(f"{failures} sound(s) failed verification")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
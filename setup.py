@@ -5,13 +5,24 @@ from cx_Freeze import setup, Executable
 # Add src to path so cx_Freeze can find kensho package
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
+# Ship the trimmed/normalized sounds from packaging/process_sounds.py when
+# they have been built; otherwise fall back to the original WAVs.
+resources = "src/kensho/resources"
+processed_sounds = os.path.join("build", "sounds")
+if os.path.isfile(os.path.join(processed_sounds, "manifest.json")):
+    resource_files = [
+        (os.path.join(resources, name), f"{resources}/{name}")
+        for name in os.listdir(resources)
+        if name != "sounds"
+    ] + [(processed_sounds, f"{resources}/sounds")]
+else:
+    resource_files = [(resources, resources)]
+
 # Dependencies are automatically detected, but it might need fine tuning.
 build_exe_options = {
     "packages": ["os", "sys", "kensho"],
     "includes": ["PySide6.QtCore", "PySide6.QtGui", "PySide6.QtWidgets", "PySide6.QtMultimedia"],
-    "include_files": [
-        ("src/kensho/resources", "src/kensho/resources"),
-    ],
+    "include_files": resource_files,
     "excludes": ["tkinter", "unittest", "email", "http", "xml", "pydoc"],
 }
 
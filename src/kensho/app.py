@@ -1,18 +1,95 @@
 import sys
 import os
-from PySide6.QtWidgets import QApplication
-from .ui.main_window import MainWindow
+import argparse
+from . import profiling
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(prog="kensho", add_help=False)
+    parser.add_argument(
+        "--profile-startup", nargs="?", const="", default=None, metavar="REPORT",
+        help="write startup phase timings as JSON (default: startup_profile.json in the data dir)"
+    )
+    parser.add_argument(
+        "--cprofile", default=None, metavar="PATH",
+        help="with --profile-startup, also dump cProfile stats for the main thread"
+    )
+    parser.add_argument(
+        "--metrics", nargs="?", const="", default=None, metavar="REPORT",
+        help="show the paint/timer overlay and write metrics JSON on exit "
+             "(default: metrics.json in the data dir); also KENSHO_METRICS=1"
+    )
+    # Everything we don't recognise is left for Qt
+    args, rest = parser.parse_known_args(argv[1:])
+    return args, argv[:1] + rest
+
+def _enable_profiling(args):
+    from .storage import DATA_DIR
+    report = args.profile_startup or str(DATA_DIR / "startup_profile.json")
+    profiling.startup.enable(report, args.cprofile)
+
+def _enable_metrics(app, report):
+    """Collect paint and timer metrics; dump them as JSON when the app quits."""
+    from .core.metrics import collector
+    from .storage import DATA_DIR
+    path = report or str(DATA_DIR / "metrics.json")
+    collector.enable()
+
+    def dump():
+        print(f"Metrics written to {collector.dump(path)}")
+
+    app.aboutToQuit.connect(dump)
+
+def _watch_startup(window):
+    """Write the report once the first frame is painted and state is attached."""
+    # State loads in the background, so either event can come last
+    def finish_if_done():
+        if profiling.startup.has("first_paint") and profiling.startup.has("state_load"):
+            path = profiling.startup.finish()
+            if path:
+                print(f"Startup profile written to {path}")
+
+    def on_first_frame(_seconds):
+        profiling.mark("first_paint")
+        finish_if_done()
+
+    def on_state_loaded():
+        profiling.mark("state_load")
+        finish_if_done()
+
+    window.first_frame.connect(on_first_frame)
+    window.state_loaded.connect(on_state_loaded)
 
 def main():
-    app = QApplication(sys.argv)
+    args, qt_argv = _parse_args(sys.argv)
+    if args.profile_startup is not None:
+        _enable_profiling(args)
+    profiling.mark("main_entry")
+
+    from PySide6.QtWidgets import QApplication
+    from .ui.main_window import MainWindow
+    profiling.mark("imports")
+
+    app = QApplication(qt_argv)
+    profiling.mark("qapplication")
+
+    if args.metrics is None and os.environ.get("KENSHO_METRICS", "0") not in ("", "0"):
+        args.metrics = ""
+    if args.metrics is not None:
+        _enable_metrics(app, args.metrics)
     
     # Load Stylesheet
     style_path = os.path.join(os.path.dirname(__file__), "resources", "styles.qss")
     if os.path.exists(style_path):
         with open(style_path, "r") as f:
             app.setStyleSheet(f.read())
+    profiling.mark("stylesheet")
             
     window = MainWindow()
+    profiling.mark("main_window")
+
+    if profiling.startup.enabled:
+        _watch_startup(window)
+
     window.show()
     sys.exit(app.exec())
 
@@ -0,0 +1,31 @@
+"""Wall-clock anchors for clocks that keep running while the app is closed.
+
+A running clock is persisted as the wall time at which it would have
+started had it never been paused (`started_at = now - elapsed`). Restoring
+is then a single subtraction, however long the app was closed.
+"""
+
+import time
+from typing import Optional, Tuple
+
+
+def anchor_for(elapsed_seconds: float, now: Optional[float] = None) -> float:
+    """Return the wall-clock start anchor for a clock running `elapsed_seconds`."""
+    now = time.time() if now is None else now
+    return round(now - elapsed_seconds, 3)
+
+
+def restore_elapsed(started_at: float, saved_elapsed: float, interval_seconds: float,
+                    now: Optional[float] = None) -> Tuple[float, bool]:
+    """Recompute elapsed time for a clock that was running when state was saved.
+
+    Returns `(elapsed_seconds, completed)`. `completed` is True when the
+    interval ran out while the app was closed; however many intervals
+    passed, that counts as one completion. If the wall clock went backwards
+    the saved elapsed value is kept rather than rewinding the clock.
+    """
+    now = time.time() if now is None else now
+    elapsed = max(now - started_at, saved_elapsed, 0.0)
+    if interval_seconds > 0 and elapsed >= interval_seconds:
+        return float(interval_seconds), True
+    return elapsed, False
@@ -0,0 +1,149 @@
+"""Index of the bundled notification sounds.
+
+Built once from the sounds directory: display name <-> file path, plus the
+duration and sample format read from each WAV header. Lookups are dict hits
+and accept the display name, the file stem or any spelling that differs
+only in case and punctuation ("Soft Chime", "soft_chime", "Soft - CHIME").
+
+Processed sound sets (packaging/process_sounds.py) carry a manifest.json;
+when present its entries are used instead of opening each header.
+"""
+
+import json
+import re
+import time
+import wave
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Re-scan at most this often when checking the directory for changes
+CHECK_INTERVAL = 2.0
+MANIFEST_NAME = "manifest.json"
+
+_NOTE = re.compile(r"^[a-g][#b]?\d$", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class SoundInfo:
+    name: str
+    stem: str
+    path: Path
+    duration: float
+    sample_rate: int
+    channels: int
+    sample_width: int
+
+
+def display_name(stem: str) -> str:
+    """ "piano_c4" -> "Piano - C4", "soft_chime" -> "Soft Chime"."""
+    parts = stem.split("_")
+    if len(parts) == 2 and _NOTE.match(parts[1]):
+        return f"{parts[0].capitalize()} - {parts[1].upper()}"
+    return " ".join(part.capitalize() for part in parts if part)
+
+
+def lookup_key(name: str) -> str:
+    """Normalise any spelling of a sound name to one dictionary key."""
+    return re.sub(r"[^a-z0-9#]", "", name.lower())
+
+
+def _read_info(path: Path) -> Optional[SoundInfo]:
+    try:
+        with wave.open(str(path), "rb") as handle:
+            rate = handle.getframerate()
+            frames = handle.getnframes()
+            channels = handle.getnchannels()
+            width = handle.getsampwidth()
+    except (wave.Error, EOFError, OSError):
+        return None
+    duration = frames / rate if rate else 0.0
+    return SoundInfo(display_name(path.stem), path.stem, path, round(duration, 3),
+                     rate, channels, width)
+
+
+def _read_manifest(directory: Path) -> Dict[str, dict]:
+    try:
+        with open(directory / MANIFEST_NAME, "r", encoding="utf-8") as f:
+            sounds = json.load(f).get("sounds", {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+    return sounds if isinstance(sounds, dict) else {}
+
+
+def _info_from_manifest(path: Path, entry) -> Optional[SoundInfo]:
+    try:
+        return SoundInfo(display_name(path.stem), path.stem, path, float(entry["duration"]),
+                         int(entry["sample_rate"]), int(entry["channels"]),
+                         int(entry["sample_width"]))
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class SoundCatalog:
+    def __init__(self, directory: Path, check_interval: float = CHECK_INTERVAL):
+        self.directory = Path(directory)
+        self.check_interval = check_interval
+        self._by_key: Dict[str, SoundInfo] = {}
+        self._by_path: Dict[Path, SoundInfo] = {}
+        self._names: List[str] = []
+        self._signature = None
+        self._built = False
+        self._checked_at = float("-inf")
+
+    def names(self) -> List[str]:
+        """Display names in file order, for combo boxes."""
+        self._refresh_if_changed()
+        return list(self._names)
+
+    def get(self, name: str) -> Optional[SoundInfo]:
+        if not name:
+            return None
+        self._refresh_if_changed()
+        return self._by_key.get(lookup_key(name))
+
+    def for_path(self, path: Path) -> Optional[SoundInfo]:
+        self._refresh_if_changed()
+        return self._by_path.get(Path(path))
+
+    def invalidate(self) -> None:
+        self._built = False
+
+    def _dir_signature(self):
+        try:
+            return self.directory.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _refresh_if_changed(self) -> None:
+        now = time.monotonic()
+        if self._built and now - self._checked_at < self.check_interval:
+            return
+        self._checked_at = now
+        signature = self._dir_signature()
+        if self._built and signature == self._signature:
+            return
+        self._signature = signature
+        self._built = True
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        by_key: Dict[str, SoundInfo] = {}
+        by_path: Dict[Path, SoundInfo] = {}
+        names: List[str] = []
+        paths = sorted(self.directory.glob("*.wav")) if self.directory.exists() else []
+        manifest = _read_manifest(self.directory) if paths else {}
+        for path in paths:
+            entry = manifest.get(path.stem)
+            info = _info_from_manifest(path, entry) if entry else None
+            if info is None:
+                info = _read_info(path)
+            if info is None:
+                continue
+            names.append(info.name)
+            by_path[path] = info
+            by_key[lookup_key(info.name)] = info
+            by_key.setdefault(lookup_key(info.stem), info)
+        self._by_key = by_key
+        self._by_path = by_path
+        self._names = names
@@ -0,0 +1,147 @@
+"""Batching and rate limiting for clock-completion notifications.
+
+Completions arriving within `window` seconds of the first one are merged
+into a single Batch ("3 clocks ready"). Each delivered batch costs a token
+from a token bucket; while the bucket is empty completions keep merging
+into the pending batch instead of producing more notifications. A clock
+that already notified within `dedup_seconds` is ignored, and at most
+`max_pending` completions are kept per batch (the rest are only counted),
+so a storm costs bounded CPU, windows and memory.
+
+The dispatcher holds no timers or threads: callers submit, ask for
+`next_deadline()` and call `flush()` when it passes (a QTimer in the UI, a
+threading.Timer in notifications.py). Time comes from an injectable clock.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+BATCH_WINDOW = 0.4
+RATE = 0.2  # batches per second once the burst is spent
+BURST = 3
+DEDUP_SECONDS = 5.0
+MAX_PENDING = 20
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: int, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self._tokens = float(capacity)
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def take(self) -> bool:
+        self._refill()
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+    def wait_time(self) -> float:
+        """Seconds until a token is available (0 if one is now)."""
+        self._refill()
+        if self._tokens >= 1.0:
+            return 0.0
+        return (1.0 - self._tokens) / self.rate
+
+
+@dataclass
+class Completion:
+    key: Hashable
+    label: str
+    message: str = ""
+    payload: Any = None
+
+
+@dataclass
+class Batch:
+    completions: List[Completion] = field(default_factory=list)
+    # Completions counted but not kept because the batch was full
+    overflow: int = 0
+
+    @property
+    def count(self) -> int:
+        return len(self.completions) + self.overflow
+
+    @property
+    def title(self) -> str:
+        if self.count == 1:
+            return f"{self.completions[0].label} is ready"
+        return f"{self.count} clocks ready"
+
+    @property
+    def message(self) -> str:
+        """Single completion: its own message; otherwise the clock labels."""
+        if self.count == 1:
+            return self.completions[0].message or self.title
+        labels = ", ".join(c.label for c in self.completions)
+        if self.overflow:
+            labels += f" and {self.overflow} more"
+        return f"{self.title}: {labels}"
+
+
+class NotificationDispatcher:
+    def __init__(self, window: float = BATCH_WINDOW, rate: float = RATE, burst: int = BURST,
+                 dedup_seconds: float = DEDUP_SECONDS, max_pending: int = MAX_PENDING,
+                 clock: Callable[[], float] = time.monotonic):
+        self.window = window
+        self.dedup_seconds = dedup_seconds
+        self.max_pending = max_pending
+        self.clock = clock
+        self.bucket = TokenBucket(rate, burst, clock)
+        self._pending: Optional[Batch] = None
+        self._pending_keys: set = set()
+        self._opened_at = 0.0
+        self._last_seen: Dict[Hashable, float] = {}
+
+    @property
+    def pending(self) -> int:
+        return self._pending.count if self._pending else 0
+
+    def submit(self, key: Hashable, label: str, message: str = "", payload: Any = None) -> bool:
+        """Add a completion; False if it was deduplicated."""
+        now = self.clock()
+        last = self._last_seen.get(key)
+        if key in self._pending_keys or (last is not None and now - last < self.dedup_seconds):
+            return False
+        self._last_seen[key] = now
+        self._forget_stale(now)
+
+        if self._pending is None:
+            self._pending = Batch()
+            self._opened_at = now
+        if len(self._pending.completions) < self.max_pending:
+            self._pending.completions.append(Completion(key, label, message, payload))
+            self._pending_keys.add(key)
+        else:
+            self._pending.overflow += 1
+        return True
+
+    def next_deadline(self) -> Optional[float]:
+        """Clock time at which flush() will deliver the pending batch, if any."""
+        if self._pending is None:
+            return None
+        return max(self._opened_at + self.window, self.clock() + self.bucket.wait_time())
+
+    def flush(self) -> Optional[Batch]:
+        """Deliver the pending batch if its window has closed and the rate allows."""
+        if self._pending is None or self.clock() < self._opened_at + self.window:
+            return None
+        if not self.bucket.take():
+            return None
+        batch, self._pending = self._pending, None
+        self._pending_keys.clear()
+        return batch
+
+    def _forget_stale(self, now: float) -> None:
+        # Keeps the dedup table from growing with every clock ever seen
+        if len(self._last_seen) > 4 * self.max_pending:
+            self._last_seen = {k: t for k, t in self._last_seen.items()
+                               if now - t < self.dedup_seconds}
@@ -1,20 +1,43 @@
-import json
-import os
-from pathlib import Path
+import sqlite3
+import threading
 from datetime import datetime, date
-from typing import List, Dict, Any
+from typing import Callable, List, Dict, Any, Optional
+from ..storage import StorageBackend, get_default_backend
+
+HISTORY_KEY = "history"
+
+# Events passed to history listeners
+SESSION_LOGGED = "logged"  # with the new record
+HISTORY_CLEARED = "cleared"  # with None
+
+Listener = Callable[[str, Optional[Dict[str, Any]]], None]
 
 class HistoryManager:
-    def __init__(self):
-        self.app_dir = Path.home() / ".kensho"
-        self.history_file = self.app_dir / "history.json"
-        self._ensure_dir()
+    def __init__(self, backend: Optional[StorageBackend] = None):
+        self.backend = backend or get_default_backend()
+        # Loaded once (possibly on the startup loader thread), then kept in
+        # step with our own writes so views never re-read the file.
+        self._history: Optional[List[Dict[str, Any]]] = None
+        self._lock = threading.Lock()
+        self._listeners: List[Listener] = []
+
+    def add_listener(self, listener: Listener) -> None:
+        """Call `listener(event, record)` after each log_session/clear_history.
 
-    def _ensure_dir(self):
-        if not self.app_dir.exists():
-            self.app_dir.mkdir(parents=True)
+        Listeners run on the thread that made the change, after the write.
+        """
+        self._listeners.append(listener)
 
-    def log_session(self, clock_name: str, duration_minutes: float):
+    def remove_listener(self, listener: Listener) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, event: str, record: Optional[Dict[str, Any]]) -> None:
+        for listener in list(self._listeners):
+            listener(event, record)
+
+    def log_session(self, clock_name: str, duration_minutes: float,
+                    paused_minutes: Optional[float] = None):
         """Logs a completed session."""
         record = {
             "timestamp": datetime.now().isoformat(),
@@ -22,14 +45,19 @@ class HistoryManager:
             "clock_name": clock_name,
             "duration_minutes": duration_minutes
         }
+        if paused_minutes is not None:
+            record["paused_minutes"] = round(paused_minutes, 2)
         
-        history = self._load_history()
-        history.append(record)
-        self._save_history(history)
+        with self._lock:
+            history = self._load_history()
+            history.append(record)
+            self._append_record(record)
+        self._notify(SESSION_LOGGED, record)
 
     def get_today_sessions(self) -> List[Dict[str, Any]]:
         """Returns sessions for the current date."""
-        history = self._load_history()
+        with self._lock:
+            history = self._load_history()
         today_str = date.today().isoformat()
         return [r for r in history if r.get("date") == today_str]
 
@@ -39,25 +67,29 @@ class HistoryManager:
         return sum(s.get("duration_minutes", 0) for s in sessions)
 
     def _load_history(self) -> List[Dict[str, Any]]:
-        if not self.history_file.exists():
-            return []
-        try:
-            with open(self.history_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return []
+        if self._history is None:
+            # Older builds kept the whole history in one document; it is
+            # still read (never rewritten) ahead of the append-only log
+            legacy = self.backend.load(HISTORY_KEY, [])
+            history = list(legacy) if isinstance(legacy, list) else []
+            history.extend(self.backend.read_log(HISTORY_KEY))
+            self._history = history
+        return self._history
 
-    def _save_history(self, history: List[Dict[str, Any]]):
+    def _append_record(self, record: Dict[str, Any]):
+        # One log line per session instead of rewriting the whole history
         try:
-            with open(self.history_file, 'w') as f:
-                json.dump(history, f, indent=4)
-        except IOError as e:
+            self.backend.append(HISTORY_KEY, record)
+        except (OSError, sqlite3.Error) as e:
             print(f"Error saving history: {e}")
 
     def clear_history(self):
         """Clears all history data."""
-        if self.history_file.exists():
+        with self._lock:
+            self._history = []
             try:
-                self.history_file.unlink()
-            except IOError as e:
+                self.backend.delete(HISTORY_KEY)
+                self.backend.clear_log(HISTORY_KEY)
+            except (OSError, sqlite3.Error) as e:
                 print(f"Error clearing history: {e}")
+        self._notify(HISTORY_CLEARED, None)
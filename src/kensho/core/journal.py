@@ -0,0 +1,162 @@
+"""Append-only journal of clock operations.
+
+Every user action on a clock (start, pause, reset, interval/label edits,
+add/remove) is appended as one compact event instead of rewriting the whole
+state file. The saved app state doubles as the snapshot: it records the
+sequence number it covers, and restoring replays only the events after it.
+"""
+
+import sqlite3
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from ..storage import StorageBackend, get_default_backend
+
+JOURNAL_KEY = "journal"
+SNAPSHOT_EVERY = 200
+
+
+def _find_clock(state: Dict[str, Any], clock_id: str) -> Optional[Dict[str, Any]]:
+    for data in state.get("clocks", []):
+        if data.get("identifier") == clock_id:
+            return data
+    return None
+
+
+def apply_event(state: Dict[str, Any], event: Dict[str, Any]) -> None:
+    """Apply a single journal event to a serialized app state in place."""
+    op = event.get("op")
+    clock_id = event.get("c", "")
+    clocks = state.setdefault("clocks", [])
+
+    if op == "sound":
+        state["sound"] = event.get("v")
+        return
+    if op == "add":
+        if _find_clock(state, clock_id) is None:
+            clocks.append(dict(event.get("d", {}), identifier=clock_id))
+        return
+    if op == "remove":
+        state["clocks"] = [d for d in clocks if d.get("identifier") != clock_id]
+        return
+
+    data = _find_clock(state, clock_id)
+    if data is None:
+        return
+
+    if op == "start":
+        data["paused"] = False
+        data["elapsed_seconds"] = event.get("e", data.get("elapsed_seconds", 0.0))
+        if "t" in event:
+            data["started_at"] = event["t"] - data["elapsed_seconds"]
+    elif op == "pause":
+        data["paused"] = True
+        data["elapsed_seconds"] = event.get("e", data.get("elapsed_seconds", 0.0))
+        data["started_at"] = None
+    elif op == "reset":
+        data["paused"] = True
+        data["elapsed_seconds"] = 0.0
+        data["due"] = False
+        data["started_at"] = None
+    elif op == "finish":
+        data["paused"] = True
+        data["due"] = True
+        data["elapsed_seconds"] = float(data.get("interval_minutes", 0)) * 60
+        data["started_at"] = None
+    elif op == "interval":
+        data["interval_minutes"] = event.get("v")
+        data["paused"] = True
+        data["elapsed_seconds"] = 0.0
+        data["due"] = False
+        data["started_at"] = None
+    elif op == "label":
+        data["label"] = event.get("v")
+    elif op == "message":
+        data["completion_message"] = event.get("v")
+
+
+class ClockJournal:
+    def __init__(self, backend: Optional[StorageBackend] = None,
+                 snapshot_every: int = SNAPSHOT_EVERY):
+        self.backend = backend or get_default_backend()
+        self.snapshot_every = snapshot_every
+        self.seq = 0
+        self._since_snapshot = 0
+        # Called when enough events piled up that a snapshot should be taken
+        self.on_snapshot_due: Optional[Callable[[], None]] = None
+        # clock id -> list of [paused_at, resumed_at] wall times for the current run
+        self._pauses: Dict[str, List[List[Optional[float]]]] = {}
+
+    def record(self, clock_id: str, op: str, fields: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Append one event and return it."""
+        self.seq += 1
+        event = {
+            "s": self.seq,
+            "t": round(time.time(), 3),
+            "m": round(time.monotonic(), 3),
+            "c": clock_id,
+            "op": op,
+        }
+        if fields:
+            event.update(fields)
+
+        try:
+            self.backend.append(JOURNAL_KEY, event)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Error writing journal: {e}")
+        self._track_pauses(event)
+
+        self._since_snapshot += 1
+        if self._since_snapshot >= self.snapshot_every and self.on_snapshot_due:
+            # Count afresh whether or not the snapshot succeeds, so a failed
+            # save doesn't turn every later event into a full rewrite
+            self._since_snapshot = 0
+            self.on_snapshot_due()
+        return event
+
+    def replay(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Bring a loaded snapshot up to date with the events logged after it."""
+        base_seq = int(state.get("journal_seq", 0))
+        self.seq = base_seq
+        self._since_snapshot = 0
+        for event in self.backend.read_log(JOURNAL_KEY):
+            seq = int(event.get("s", 0))
+            if seq <= base_seq:
+                continue
+            apply_event(state, event)
+            self._track_pauses(event)
+            self.seq = max(self.seq, seq)
+            self._since_snapshot += 1
+        state["journal_seq"] = self.seq
+        return state
+
+    def compact(self, snapshot_seq: int) -> None:
+        """Drop the log once a snapshot covering `snapshot_seq` is on disk."""
+        if snapshot_seq < self.seq:
+            # Events arrived while the snapshot was written; keep the log.
+            return
+        self.backend.clear_log(JOURNAL_KEY)
+        self._since_snapshot = 0
+
+    def pause_segments(self, clock_id: str) -> List[Tuple[float, Optional[float]]]:
+        """Wall-clock (paused_at, resumed_at) pairs for the clock's current run.
+
+        An open pause has `resumed_at` of None.
+        """
+        return [tuple(segment) for segment in self._pauses.get(clock_id, [])]
+
+    def paused_seconds(self, clock_id: str, now: Optional[float] = None) -> float:
+        now = time.time() if now is None else now
+        return sum((end if end is not None else now) - start
+                   for start, end in self.pause_segments(clock_id))
+
+    def _track_pauses(self, event: Dict[str, Any]) -> None:
+        op = event.get("op")
+        clock_id = event.get("c", "")
+        if op in ("reset", "interval", "remove", "add"):
+            self._pauses.pop(clock_id, None)
+        elif op == "pause":
+            self._pauses.setdefault(clock_id, []).append([event["t"], None])
+        elif op == "start":
+            segments = self._pauses.get(clock_id)
+            if segments and segments[-1][1] is None:
+                segments[-1][1] = event["t"]
@@ -0,0 +1,46 @@
+import threading
+from PySide6.QtCore import QObject, Signal
+from .. import profiling
+from .state import AppState
+from .journal import ClockJournal
+from .history import HistoryManager
+
+class StateLoader(QObject):
+    """Reads persisted state and today's history off the GUI thread.
+
+    `loaded` is delivered on the thread that owns the loader (queued), so
+    slots can build widgets and ClockUnits directly.
+    """
+    loaded = Signal(dict, list)  # (app state after journal replay, today's sessions)
+
+    def __init__(self, app_state: AppState, journal: ClockJournal,
+                 history_manager: HistoryManager, parent=None):
+        super().__init__(parent)
+        self.app_state = app_state
+        self.journal = journal
+        self.history_manager = history_manager
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="kensho-state-loader", daemon=True)
+        self._thread.start()
+
+    def wait(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        # `loaded` must always fire: the window waits for it to show clocks.
+        # Anything that goes wrong falls back to an empty state/history.
+        try:
+            state = self.journal.replay(self.app_state.load_state())
+        except Exception as e:
+            print(f"Error loading state: {e}")
+            state = {}
+        try:
+            sessions = self.history_manager.get_today_sessions()
+        except Exception as e:
+            print(f"Error loading history: {e}")
+            sessions = []
+        profiling.mark("state_read")
+        self.loaded.emit(state, sessions)
@@ -0,0 +1,212 @@
+"""Frame-time and timer metrics for the UI.
+
+Widgets time their paints with ``collector.paint(name)`` and periodic
+timers report each tick with ``collector.timer_tick(name, interval_ms)``.
+Both are a single flag check while metrics are off, which is the default;
+``kensho --metrics`` (or ``KENSHO_METRICS=1``) turns them on, shows the
+live overlay and writes ``report()`` as JSON on exit.
+
+Durations go into fixed-bucket histograms, so memory stays constant no
+matter how long the app runs. A paint is late when it takes longer than
+one frame at 60 Hz; a timer tick is late when it fires more than a frame
+after it was due, and every whole interval it slipped by counts as a
+dropped frame. No Qt dependencies.
+"""
+
+import json
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+FRAME_BUDGET_MS = 1000 / 60
+# Upper bucket bounds in ms; anything slower lands in the overflow bucket
+BUCKET_BOUNDS_MS: Tuple[float, ...] = (0.25, 0.5, 1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+FPS_WINDOW = 1.0
+
+_NULL_CONTEXT = nullcontext()
+
+
+class Histogram:
+    def __init__(self, bounds: Tuple[float, ...] = BUCKET_BOUNDS_MS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Estimate the q-th percentile (0-100), interpolating inside its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            if bucket and seen + bucket >= rank:
+                low = self.bounds[index - 1] if index else 0.0
+                high = self.bounds[index] if index < len(self.bounds) else self.max
+                return min(low + (high - low) * (rank - seen) / bucket, self.max)
+            seen += bucket
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": round(self.mean, 3),
+            "p50": round(self.percentile(50), 3),
+            "p95": round(self.percentile(95), 3),
+            "p99": round(self.percentile(99), 3),
+            "max": round(self.max, 3),
+            "buckets": {("inf" if i == len(self.bounds) else str(self.bounds[i])): n
+                        for i, n in enumerate(self.counts) if n},
+        }
+
+
+class PaintStats:
+    def __init__(self, budget_ms: float = FRAME_BUDGET_MS):
+        self.budget_ms = budget_ms
+        self.durations = Histogram()
+        self.late = 0
+        self._recent: Deque[float] = deque()
+
+    def record(self, duration_ms: float, at: float) -> None:
+        self.durations.record(duration_ms)
+        if duration_ms > self.budget_ms:
+            self.late += 1
+        self._recent.append(at)
+        self._trim(at)
+
+    def fps(self, now: float) -> float:
+        """Paints during the last FPS_WINDOW seconds, per second."""
+        self._trim(now)
+        return len(self._recent) / FPS_WINDOW
+
+    def _trim(self, now: float) -> None:
+        while self._recent and now - self._recent[0] > FPS_WINDOW:
+            self._recent.popleft()
+
+    def to_dict(self, now: float) -> Dict[str, Any]:
+        return {"paints": self.durations.count, "fps": self.fps(now), "late": self.late,
+                "paint_ms": self.durations.to_dict()}
+
+
+class TimerStats:
+    def __init__(self, budget_ms: float = FRAME_BUDGET_MS):
+        self.budget_ms = budget_ms
+        self.lateness = Histogram()
+        self.ticks = 0
+        self.late = 0
+        self.dropped = 0
+        self._last: Optional[float] = None
+
+    def tick(self, interval_ms: float, at: float) -> None:
+        self.ticks += 1
+        if self._last is not None and interval_ms > 0:
+            actual_ms = (at - self._last) * 1000
+            lateness = max(0.0, actual_ms - interval_ms)
+            self.lateness.record(lateness)
+            if lateness > self.budget_ms:
+                self.late += 1
+            self.dropped += int(lateness // interval_ms)
+        self._last = at
+
+    def restart(self) -> None:
+        """Forget the previous tick (the timer was stopped, not late)."""
+        self._last = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"ticks": self.ticks, "late": self.late, "dropped": self.dropped,
+                "lateness_ms": self.lateness.to_dict()}
+
+
+class MetricsCollector:
+    def __init__(self, budget_ms: float = FRAME_BUDGET_MS,
+                 clock: Callable[[], float] = time.perf_counter):
+        self.enabled = False
+        self.budget_ms = budget_ms
+        self.clock = clock
+        self.paints: Dict[str, PaintStats] = {}
+        self.timers: Dict[str, TimerStats] = {}
+        self._started = clock()
+
+    def enable(self) -> None:
+        self.enabled = True
+        self.reset()
+
+    def reset(self) -> None:
+        self.paints.clear()
+        self.timers.clear()
+        self._started = self.clock()
+
+    def paint(self, name: str):
+        """Context manager timing one paint of `name` (no-op while disabled)."""
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return _PaintTimer(self, name)
+
+    def record_paint(self, name: str, duration_ms: float) -> None:
+        stats = self.paints.get(name)
+        if stats is None:
+            stats = self.paints[name] = PaintStats(self.budget_ms)
+        stats.record(duration_ms, self.clock())
+
+    def timer_tick(self, name: str, interval_ms: float) -> None:
+        if not self.enabled:
+            return
+        stats = self.timers.get(name)
+        if stats is None:
+            stats = self.timers[name] = TimerStats(self.budget_ms)
+        stats.tick(interval_ms, self.clock())
+
+    def timer_restarted(self, name: str) -> None:
+        stats = self.timers.get(name)
+        if stats is not None:
+            stats.restart()
+
+    def report(self) -> Dict[str, Any]:
+        now = self.clock()
+        return {
+            "timestamp": time.time(),
+            "duration_s": round(now - self._started, 3),
+            "frame_budget_ms": round(self.budget_ms, 3),
+            "widgets": {name: stats.to_dict(now) for name, stats in sorted(self.paints.items())},
+            "timers": {name: stats.to_dict() for name, stats in sorted(self.timers.items())},
+        }
+
+    def dump(self, path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as handle:
+            json.dump(self.report(), handle, indent=2)
+        return path
+
+
+class _PaintTimer:
+    __slots__ = ("collector", "name", "start")
+
+    def __init__(self, collector: MetricsCollector, name: str):
+        self.collector = collector
+        self.name = name
+
+    def __enter__(self):
+        self.start = self.collector.clock()
+        return self
+
+    def __exit__(self, *exc):
+        self.collector.record_paint(self.name, (self.collector.clock() - self.start) * 1000)
+        return False
+
+
+collector = MetricsCollector()
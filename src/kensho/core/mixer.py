@@ -0,0 +1,190 @@
+"""Software mixer for notification sounds.
+
+WAVs are decoded once (stdlib `wave`) into float32 NumPy arrays. Playing a
+sound only adds a voice pointing into that array; each render slices the
+buffers without copying, sums the active voices and applies a gain picked
+from a table precomputed per voice count. The result is fed to one audio
+output, or rendered into a buffer for offline tests and benchmarks.
+"""
+
+import threading
+import time
+import wave
+from collections import deque
+from pathlib import Path
+from typing import Callable, Dict, Hashable, List, Optional, Union
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - numpy is optional, QSoundEffect is the fallback
+    np = None
+
+SAMPLE_RATE = 44100
+MAX_VOICES = 8
+
+
+def decode_wav(path: Path, sample_rate: int = SAMPLE_RATE) -> "np.ndarray":
+    """Decode a PCM WAV to mono float32 in [-1, 1] at `sample_rate`.
+
+    Raises ValueError for files this decoder does not handle (float or
+    compressed WAVs, odd sample widths, truncated headers).
+    """
+    try:
+        with wave.open(str(path), "rb") as handle:
+            channels = handle.getnchannels()
+            width = handle.getsampwidth()
+            rate = handle.getframerate()
+            raw = handle.readframes(handle.getnframes())
+    except (wave.Error, EOFError) as e:
+        raise ValueError(f"Unsupported WAV file {path}: {e}") from e
+
+    if width == 1:
+        samples = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif width == 2:
+        samples = np.frombuffer(raw, dtype="<i2").astype(np.float32) / 32768.0
+    elif width == 4:
+        samples = np.frombuffer(raw, dtype="<i4").astype(np.float32) / 2147483648.0
+    else:
+        raise ValueError(f"Unsupported sample width: {width} bytes")
+
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    if rate != sample_rate and len(samples):
+        duration = len(samples) / rate
+        target = np.linspace(0.0, duration, int(round(duration * sample_rate)), endpoint=False)
+        source = np.arange(len(samples)) / rate
+        samples = np.interp(target, source, samples)
+    return np.ascontiguousarray(samples, dtype=np.float32)
+
+
+class _Voice:
+    __slots__ = ("buffer", "position", "gain", "requested", "started")
+
+    def __init__(self, buffer, gain, requested):
+        self.buffer = buffer
+        self.position = 0
+        self.gain = gain
+        self.requested = requested
+        self.started = False
+
+
+class Mixer:
+    def __init__(self, sample_rate: int = SAMPLE_RATE, max_voices: int = MAX_VOICES):
+        if np is None:
+            raise RuntimeError("The software mixer needs numpy")
+        self.sample_rate = sample_rate
+        self.max_voices = max_voices
+        # Overlapping chimes are mostly uncorrelated, so scale the sum by
+        # 1/sqrt(n) rather than 1/n to keep single chimes at full level.
+        self._gain_table = [1.0] + [1.0 / np.sqrt(n) for n in range(1, max_voices + 1)]
+        self._buffers: Dict[Hashable, "np.ndarray"] = {}
+        self._voices: List[_Voice] = []
+        self._scratch = np.zeros(0, dtype=np.float32)
+        self._lock = threading.Lock()
+        # Serializes loading so a key is decoded once; render() never waits on it
+        self._load_lock = threading.Lock()
+        # Keys whose source could not be decoded, with the reason
+        self._unsupported: Dict[Hashable, str] = {}
+        # Milliseconds from play() to the first rendered block containing the voice
+        self.latencies_ms = deque(maxlen=100)
+
+    @property
+    def active_voices(self) -> int:
+        return len(self._voices)
+
+    def load(self, key: Hashable, source: Union[Path, Callable[[], "np.ndarray"]]) -> "np.ndarray":
+        """Decode `source` once and keep it under `key`.
+
+        `source` is a WAV path or a callable returning samples (synthesized
+        tones). Safe to call from several threads: the first caller decodes,
+        the others wait and get the same buffer. Raises ValueError, every
+        time, for a source that cannot be decoded.
+        """
+        with self._load_lock:
+            with self._lock:
+                buffer = self._buffers.get(key)
+            if buffer is not None:
+                return buffer
+            if key in self._unsupported:
+                raise ValueError(self._unsupported[key])
+            try:
+                # Decoded outside the render lock so the audio thread never waits
+                samples = source() if callable(source) else decode_wav(source, self.sample_rate)
+            except ValueError as e:
+                self._unsupported[key] = str(e)
+                raise
+            buffer = np.ascontiguousarray(samples, dtype=np.float32)
+            with self._lock:
+                self._buffers[key] = buffer
+        return buffer
+
+    def add_buffer(self, key: Hashable, samples: "np.ndarray") -> None:
+        """Register already rendered mono float32 samples (e.g. synthesized tones)."""
+        buffer = np.ascontiguousarray(samples, dtype=np.float32)
+        with self._lock:
+            self._buffers[key] = buffer
+
+    def has(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._buffers
+
+    def play(self, key: Hashable, gain: float = 1.0, retrigger: bool = False) -> None:
+        """Start a voice on a loaded buffer.
+
+        With `retrigger`, voices already playing this buffer are cut first.
+        """
+        with self._lock:
+            buffer = self._buffers[key]
+            if retrigger:
+                self._voices = [v for v in self._voices if v.buffer is not buffer]
+            if len(self._voices) >= self.max_voices:
+                # Steal the voice that has been playing longest
+                self._voices.pop(0)
+            self._voices.append(_Voice(buffer, float(gain), time.perf_counter()))
+
+    def stop_all(self) -> None:
+        with self._lock:
+            self._voices.clear()
+
+    def render(self, frames: int) -> "np.ndarray":
+        """Mix the next `frames` samples as float32 in [-1, 1]."""
+        out = np.zeros(frames, dtype=np.float32)
+        if len(self._scratch) < frames:
+            self._scratch = np.zeros(frames, dtype=np.float32)
+
+        with self._lock:
+            voices = self._voices
+            count = len(voices)
+            now = time.perf_counter()
+            for voice in voices:
+                chunk = voice.buffer[voice.position:voice.position + frames]
+                n = len(chunk)
+                if voice.gain == 1.0:
+                    out[:n] += chunk
+                else:
+                    scaled = self._scratch[:n]
+                    np.multiply(chunk, voice.gain, out=scaled)
+                    out[:n] += scaled
+                voice.position += n
+                if not voice.started:
+                    voice.started = True
+                    self.latencies_ms.append((now - voice.requested) * 1000)
+            self._voices = [v for v in voices if v.position < len(v.buffer)]
+
+        if count > 1:
+            out *= self._gain_table[min(count, self.max_voices)]
+        np.clip(out, -1.0, 1.0, out=out)
+        return out
+
+    def render_int16(self, frames: int) -> bytes:
+        """Mix the next `frames` samples as little-endian 16-bit PCM."""
+        return (self.render(frames) * 32767.0).astype("<i2").tobytes()
+
+    def render_offline(self, frames: int, block: int = 512) -> "np.ndarray":
+        """Render `frames` samples in `block`-sized steps, like an audio device would."""
+        blocks = [self.render(min(block, frames - start)) for start in range(0, frames, block)]
+        return np.concatenate(blocks) if blocks else np.zeros(0, dtype=np.float32)
+
+
+def available() -> bool:
+    return np is not None
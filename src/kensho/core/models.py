@@ -1,10 +1,13 @@
+import time
 from PySide6.QtCore import QObject, Signal, QTimer, Property
+from .anchors import anchor_for, restore_elapsed
 
 class ClockUnit(QObject):
     # Signals
     ticked = Signal(float)  # Emits progress (0.0 to 1.0)
     finished = Signal()     # Emits when timer completes
     paused_changed = Signal(bool) # Emits when paused state changes
+    operation = Signal(str, str, dict) # Emits (identifier, op, fields) for the journal
     
     def __init__(self, identifier: str, label: str, interval_minutes: int, parent=None):
         super().__init__(parent)
@@ -15,6 +18,11 @@ class ClockUnit(QObject):
         self._elapsed_seconds = 0.0
         self._paused = True
         self._due = False
+        # Elapsed time and monotonic clock reading when the current run started
+        self._run_base = 0.0
+        self._run_start = 0.0
+        # Set when the interval ran out while the app was closed
+        self._missed_completion = False
         
         # Internal Timer
         self._timer = QTimer(self)
@@ -31,7 +39,9 @@ class ClockUnit(QObject):
     
     @label.setter
     def label(self, value):
-        self._label = value
+        if value != self._label:
+            self._label = value
+            self.operation.emit(self._identifier, "label", {"v": value})
 
     @Property(str)
     def completion_message(self):
@@ -39,7 +49,9 @@ class ClockUnit(QObject):
     
     @completion_message.setter
     def completion_message(self, value):
-        self._completion_message = value
+        if value != self._completion_message:
+            self._completion_message = value
+            self.operation.emit(self._identifier, "message", {"v": value})
 
     @Property(float)
     def progress(self):
@@ -58,17 +70,36 @@ class ClockUnit(QObject):
     def start(self):
         if self._paused and not self._due:
             self._paused = False
+            self._run_base = self._elapsed_seconds
+            self._run_start = time.monotonic()
             self._timer.start()
             self.paused_changed.emit(False)
+            self.operation.emit(self._identifier, "start", {"e": round(self._elapsed_seconds, 3)})
 
     def pause(self):
-        if not self._paused:
-            self._paused = True
-            self._timer.stop()
-            self.paused_changed.emit(True)
+        if self._stop():
+            self.operation.emit(self._identifier, "pause", {"e": round(self._elapsed_seconds, 3)})
+
+    def _stop(self) -> bool:
+        """Stop a running clock without journaling it; True if it was running."""
+        if self._paused:
+            return False
+        self._sync_elapsed()
+        self._halt()
+        return True
+
+    def _halt(self):
+        self._paused = True
+        self._timer.stop()
+        self.paused_changed.emit(True)
 
     def reset(self):
-        self.pause()
+        # One "reset" event covers the stop; no separate "pause" is journaled
+        self._clear()
+        self.operation.emit(self._identifier, "reset", {})
+
+    def _clear(self):
+        self._stop()
         self._elapsed_seconds = 0.0
         self._due = False
         self.ticked.emit(0.0)
@@ -80,21 +111,25 @@ class ClockUnit(QObject):
             self.pause()
 
     def update_interval(self, minutes: float):
-        self.pause()
+        self._stop()
         self._interval_minutes = float(minutes)
-        self.reset()
-        # Force UI update
-        self.ticked.emit(0.0)
+        self._clear()
+        self.operation.emit(self._identifier, "interval", {"v": self._interval_minutes})
+
+    def _sync_elapsed(self):
+        # Derived from the run's start rather than summed ticks, so timer
+        # jitter and stalls never make the clock drift.
+        self._elapsed_seconds = self._run_base + (time.monotonic() - self._run_start)
 
     def _on_tick(self):
-        # Add 0.1s
-        self._elapsed_seconds += 0.1
+        self._sync_elapsed()
         
         total_seconds = self._interval_minutes * 60
         if self._elapsed_seconds >= total_seconds:
             self._elapsed_seconds = total_seconds
             self._due = True
-            self.pause()
+            self._halt()
+            self.operation.emit(self._identifier, "finish", {})
             self.finished.emit()
             self.ticked.emit(1.0)
         else:
@@ -108,9 +143,29 @@ class ClockUnit(QObject):
             "completion_message": self._completion_message,
             "elapsed_seconds": self._elapsed_seconds,
             "paused": self._paused,
-            "due": self._due
+            "due": self._due,
+            "started_at": None if self._paused else anchor_for(self._current_elapsed())
         }
 
+    def _current_elapsed(self):
+        if not self._paused:
+            self._sync_elapsed()
+        return self._elapsed_seconds
+
+    def take_missed_completion(self) -> bool:
+        """Report a completion that happened while the app was closed, once.
+
+        Emits a single `finished` (journaled as a catch-up) however many
+        intervals elapsed during the downtime.
+        """
+        if not self._missed_completion:
+            return False
+        self._missed_completion = False
+        self.operation.emit(self._identifier, "finish", {"catchup": True})
+        self.finished.emit()
+        self.ticked.emit(1.0)
+        return True
+
     @classmethod
     def from_dict(cls, data):
         clock = cls(
@@ -120,6 +175,19 @@ class ClockUnit(QObject):
         )
         clock._completion_message = data.get("completion_message", "Time's up!")
         clock._elapsed_seconds = data.get("elapsed_seconds", 0.0)
-        clock._paused = data.get("paused", True)
         clock._due = data.get("due", False)
+
+        if not data.get("paused", True) and not clock._due:
+            # Was running when saved: recompute from the anchor in one step
+            started_at = data.get("started_at")
+            if started_at is not None:
+                elapsed, completed = restore_elapsed(
+                    started_at, clock._elapsed_seconds, clock._interval_minutes * 60
+                )
+                clock._elapsed_seconds = elapsed
+                if completed:
+                    clock._due = True
+                    clock._missed_completion = True
+            if not clock._due:
+                clock.start()
         return clock
@@ -0,0 +1,59 @@
+"""Precomputed "breathing" stroke widths for running clocks.
+
+The pulse is one smooth swell and release per period. Instead of
+evaluating the easing for every ring on every frame, a small table of
+stroke widths is built once per (base width, extra width, period, frame
+count) and playback just indexes into it. Shared by the Qt rings and the
+legacy tkinter timers; no GUI dependencies.
+"""
+
+import math
+from functools import lru_cache
+from typing import Tuple
+
+FRAMES = 24
+PERIOD = 2.0
+
+
+class PulseFrames:
+    def __init__(self, base_width: float, extra: float, period: float = PERIOD,
+                 frames: int = FRAMES):
+        if frames < 1 or period <= 0:
+            raise ValueError("Pulse needs at least one frame and a positive period")
+        self.base_width = base_width
+        self.extra = extra
+        self.period = period
+        # sin^2 rises from 0 to 1 and back with zero slope at both ends
+        self.widths: Tuple[float, ...] = tuple(
+            base_width + extra * math.sin(math.pi * k / frames) ** 2 for k in range(frames)
+        )
+
+    def __len__(self) -> int:
+        return len(self.widths)
+
+    def __getitem__(self, index: int) -> float:
+        return self.widths[index]
+
+    @property
+    def max_width(self) -> float:
+        return self.base_width + self.extra
+
+    @property
+    def frame_interval(self) -> float:
+        """Seconds each frame is shown for."""
+        return self.period / len(self.widths)
+
+    def index_at(self, seconds: float) -> int:
+        """Frame showing at `seconds` on any continuous clock."""
+        phase = (seconds % self.period) / self.period
+        return min(int(phase * len(self.widths)), len(self.widths) - 1)
+
+    def width_at(self, seconds: float) -> float:
+        return self.widths[self.index_at(seconds)]
+
+
+@lru_cache(maxsize=16)
+def pulse_frames(base_width: float, extra: float, period: float = PERIOD,
+                 frames: int = FRAMES) -> PulseFrames:
+    """Shared, cached frame table for a given pulse shape."""
+    return PulseFrames(base_width, extra, period, frames)
@@ -1,12 +1,56 @@
+import importlib.util
 import os
 import sys
+import tempfile
+import threading
+import time
+from collections import deque
 from pathlib import Path
-from typing import List
-from PySide6.QtCore import QUrl
-from PySide6.QtMultimedia import QSoundEffect
+from typing import Dict, List, Optional
+from PySide6.QtCore import Qt, QUrl, QTimer, QIODevice
+from .voices import VoicePool
+from .catalog import SoundCatalog, display_name, lookup_key
+
+class _MixerDevice(QIODevice):
+    """Pull-mode source that renders the mixer on demand for a QAudioSink."""
+
+    def __init__(self, mixer):
+        super().__init__()
+        self.mixer = mixer
+        self.open(QIODevice.ReadOnly)
+
+    def isSequential(self):
+        return True
+
+    def bytesAvailable(self):
+        return 4096 + super().bytesAvailable()
+
+    def readData(self, maxlen):
+        return self.mixer.render_int16(max(maxlen // 2, 0))
+
+    def writeData(self, data):
+        return -1
 
 class SoundManager:
-    _effect = None
+    # Effect objects kept alive (each caches one decoded file) and how many
+    # may sound at once; bursts beyond that steal the oldest voice.
+    POOL_SIZE = 6
+    POLYPHONY = 4
+    _pool: Optional[VoicePool] = None
+    _catalog: Optional[SoundCatalog] = None
+    # Pentatonic steps (semitones) so synthesized chimes tell clocks apart
+    CLOCK_PITCHES = (0, 2, 4, 7, 9)
+    # Milliseconds from play_sound() to playback actually starting
+    _latencies_ms = deque(maxlen=100)
+    # Software mixer path (numpy + one QAudioSink); QSoundEffect voices otherwise
+    _mixer = None
+    _mixer_lock = threading.Lock()
+    _sink = None
+    _device = None
+    _idle_timer = None
+    # Set while there is no audio output, until the device list changes
+    _no_output = False
+    _media_devices = None
     
     # Handle Frozen path (cx_Freeze or PyInstaller)
     if getattr(sys, 'frozen', False):
@@ -23,42 +67,258 @@ class SoundManager:
         
     _sounds_dir = _base_path / "sounds"
 
+    @classmethod
+    def catalog(cls) -> SoundCatalog:
+        if cls._catalog is None:
+            cls._catalog = SoundCatalog(cls._sounds_dir)
+        return cls._catalog
+
     @classmethod
     def get_available_sounds(cls) -> List[str]:
-        if not cls._sounds_dir.exists():
+        return cls.catalog().names() + cls._synth_names()
+
+    @classmethod
+    def canonical_name(cls, sound_name: str) -> str:
+        """Map a stored preference (any spelling) to its current display name."""
+        info = cls.catalog().get(sound_name)
+        if info:
+            return info.name
+        preset = cls._synth_preset(sound_name)
+        if preset:
+            from . import synth
+            return display_name(synth.sound_stem(preset))
+        return sound_name
+
+    @classmethod
+    def clock_pitch(cls, index: int) -> int:
+        return cls.CLOCK_PITCHES[index % len(cls.CLOCK_PITCHES)]
+
+    @classmethod
+    def _synth_names(cls) -> List[str]:
+        from . import synth
+        if not synth.available():
             return []
-        
-        files = [f.stem for f in cls._sounds_dir.glob("*.wav")]
-        files.sort()
-        
-        # Format names: "piano_c4" -> "Piano - C4"
-        formatted = []
-        for f in files:
-            parts = f.split('_')
-            if len(parts) >= 2:
-                category = parts[0].capitalize()
-                note = parts[1].upper()
-                formatted.append(f"{category} - {note}")
-            else:
-                formatted.append(f.replace('_', ' ').title())
-                
-        return formatted
-
-    @classmethod
-    def play_sound(cls, sound_name: str):
+        return [display_name(synth.sound_stem(preset)) for preset in synth.PRESETS]
+
+    @classmethod
+    def _synth_preset(cls, sound_name: str) -> Optional[str]:
+        """Preset behind a synthesized sound name ("Synth Bell" -> "bell")."""
         if not sound_name:
+            return None
+        from . import synth
+        if not synth.available():
+            return None
+        key = lookup_key(sound_name)
+        for preset in synth.PRESETS:
+            if lookup_key(synth.sound_stem(preset)) == key:
+                return preset
+        return None
+
+    @classmethod
+    def _resolve(cls, sound_name: str) -> Optional[Path]:
+        info = cls.catalog().get(sound_name)
+        return info.path if info else None
+
+    @classmethod
+    def _voices(cls) -> VoicePool:
+        if cls._pool is None:
+            # QtMultimedia is slow to load; only pay for it on first use
+            from PySide6.QtMultimedia import QSoundEffect
+
+            def load(effect, file_path):
+                # QSoundEffect decodes on Qt's own thread, so this returns at once
+                effect.setSource(QUrl.fromLocalFile(str(file_path)))
+
+            cls._pool = VoicePool(QSoundEffect, load, cls.POOL_SIZE, cls.POLYPHONY)
+        return cls._pool
+
+    @classmethod
+    def _mixer_wanted(cls) -> bool:
+        """Whether the mixer path is configured and numpy is installed (cheap check)."""
+        if os.getenv("KENSHO_AUDIO", "mixer").lower() != "mixer":
+            return False
+        return importlib.util.find_spec("numpy") is not None
+
+    @classmethod
+    def _software_mixer(cls):
+        """The Mixer, created on first use from whichever thread gets there first."""
+        with cls._mixer_lock:
+            if cls._mixer is None:
+                # Imported here so numpy stays off the startup path
+                from . import mixer as software_mixer
+                if not software_mixer.available():
+                    return None
+                cls._mixer = software_mixer.Mixer()
+            return cls._mixer
+
+    @classmethod
+    def _use_mixer(cls) -> bool:
+        return (cls._mixer_wanted() and cls._software_mixer() is not None
+                and cls._mixer_output() is not None)
+
+    @classmethod
+    def _mixer_output(cls):
+        if cls._sink is None:
+            if cls._no_output:
+                return None
+            from . import mixer as software_mixer
+            from PySide6.QtMultimedia import QAudioFormat, QAudioSink, QMediaDevices
+            device = QMediaDevices.defaultAudioOutput()
+            if device is None or device.isNull():
+                # Don't query the devices again on every chime; look again
+                # once an output is plugged in
+                cls._no_output = True
+                if cls._media_devices is None:
+                    cls._media_devices = QMediaDevices()
+                    cls._media_devices.audioOutputsChanged.connect(cls._on_outputs_changed)
+                return None
+            fmt = QAudioFormat()
+            fmt.setSampleRate(software_mixer.SAMPLE_RATE)
+            fmt.setChannelCount(1)
+            fmt.setSampleFormat(QAudioFormat.Int16)
+            cls._device = _MixerDevice(cls._mixer)
+            cls._sink = QAudioSink(device, fmt)
+            # Release the output a moment after the last chime ends
+            cls._idle_timer = QTimer()
+            cls._idle_timer.setInterval(2000)
+            cls._idle_timer.timeout.connect(cls._stop_if_idle)
+        return cls._sink
+
+    @classmethod
+    def _on_outputs_changed(cls):
+        cls._no_output = False
+
+    @classmethod
+    def _stop_if_idle(cls):
+        if cls._mixer.active_voices == 0:
+            cls._sink.stop()
+            cls._idle_timer.stop()
+
+    @classmethod
+    def _source(cls, sound_name: str, pitch: float):
+        """(key, source) for a sound, or None if unknown.
+
+        The source is what Mixer.load decodes: the WAV path for file-backed
+        sounds (also their key), or a callable rendering a synthesized sound,
+        keyed by preset and pitch. Pitch is ignored for sample files.
+        """
+        preset = cls._synth_preset(sound_name)
+        if preset is not None:
+            from . import synth
+            return (preset, pitch), lambda: synth.render(preset, semitones=pitch)
+        file_path = cls._resolve(sound_name)
+        if file_path is None:
+            return None
+        return file_path, file_path
+
+    @classmethod
+    def _synth_file(cls, key) -> Path:
+        """Render a synthesized sound to a cached WAV for QSoundEffect."""
+        from . import synth
+        preset, pitch = key
+        path = Path(tempfile.gettempdir()) / "kensho-synth" / f"{preset}_{pitch:+g}.wav"
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Render to a private temp name and swap it in, so another
+            # instance (or a crash mid-write) never leaves a torn WAV
+            handle, tmp_name = tempfile.mkstemp(suffix=".tmp", dir=path.parent)
+            os.close(handle)
+            try:
+                synth.write_wav(Path(tmp_name), synth.render(preset, semitones=pitch))
+                os.replace(tmp_name, path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        return path
+
+    @classmethod
+    def _effect_source(cls, key) -> Path:
+        return cls._synth_file(key) if isinstance(key, tuple) else key
+
+    @classmethod
+    def _mixer_load(cls, key, source) -> bool:
+        """Make sure the mixer has `key`; False if it can't decode the sound."""
+        try:
+            cls._mixer.load(key, source)
+        except ValueError as e:
+            print(f"Playing {key} without the mixer: {e}")
+            return False
+        return True
+
+    @classmethod
+    def preload(cls, sound_name: str, pitch: float = 0):
+        """Decode (or render) a sound ahead of time."""
+        found = cls._source(sound_name, pitch)
+        if found is None:
+            return None
+        key, source = found
+        if cls._use_mixer() and cls._mixer_load(key, source):
+            return None
+        return cls._voices().preload(cls._effect_source(key))
+
+    @classmethod
+    def warm(cls, sound_name: str, pitch: float = 0):
+        """Preload a sound without blocking the GUI (e.g. after startup).
+
+        On the mixer path the sound is looked up (importing numpy for the
+        synthesizer) and decoded on a worker thread; the audio device is
+        only opened by the first play_sound().
+        """
+        if cls._mixer_wanted():
+            threading.Thread(target=cls._warm_mixer, args=(sound_name, pitch),
+                             name="kensho-sound-warm", daemon=True).start()
             return
-            
-        # Convert "Piano - C4" back to "piano_c4"
-        filename = sound_name.lower().replace(' - ', '_').replace(' ', '_')
-        
-        file_path = cls._sounds_dir / f"{filename}.wav"
-        if not file_path.exists():
+        QTimer.singleShot(0, lambda: cls.preload(sound_name, pitch))
+
+    @classmethod
+    def _warm_mixer(cls, sound_name: str, pitch: float):
+        found = cls._source(sound_name, pitch)
+        if found is not None and cls._software_mixer() is not None:
+            cls._mixer_load(*found)
+
+    @classmethod
+    def play_sound(cls, sound_name: str, volume: float = 1.0, retrigger: bool = False,
+                   pitch: float = 0):
+        """Play a sound; `pitch` (semitones) shifts synthesized sounds only."""
+        requested = time.perf_counter()
+        found = cls._source(sound_name, pitch)
+        if found is None:
+            return
+        key, source = found
+
+        if cls._use_mixer() and cls._mixer_load(key, source):
+            cls._mixer.play(key, volume, retrigger)
+            from PySide6.QtMultimedia import QAudio
+            if cls._sink.state() == QAudio.StoppedState:
+                cls._sink.start(cls._device)
+            cls._idle_timer.start()
             return
-            
-        if cls._effect is None:
-            cls._effect = QSoundEffect()
-            
-        cls._effect.setSource(QUrl.fromLocalFile(str(file_path)))
-        cls._effect.setVolume(1.0)
-        cls._effect.play()
+
+        voice = cls._voices().play(cls._effect_source(key), volume, retrigger)
+        effect = voice.effect
+
+        def on_playing_changed():
+            if effect.isPlaying():
+                cls._latencies_ms.append((time.perf_counter() - requested) * 1000)
+
+        if effect.isPlaying():
+            on_playing_changed()
+        else:
+            effect.playingChanged.connect(on_playing_changed, Qt.SingleShotConnection)
+
+    @classmethod
+    def latency_stats(cls) -> Dict[str, float]:
+        """Summary of recent request-to-playback latencies in milliseconds."""
+        if cls._mixer is not None and cls._mixer.latencies_ms:
+            recent = cls._mixer.latencies_ms
+        else:
+            recent = cls._latencies_ms
+        samples = sorted(recent)
+        if not samples:
+            return {"count": 0}
+        return {
+            "count": len(samples),
+            "last": round(recent[-1], 2),
+            "median": round(samples[len(samples) // 2], 2),
+            "max": round(samples[-1], 2),
+        }
@@ -1,47 +1,43 @@
-import json
-import os
-from pathlib import Path
-from typing import List, Dict, Any
+import sqlite3
+from typing import List, Dict, Any, Optional
 from .models import ClockUnit
+from ..storage import StorageBackend, get_default_backend
 
-class AppState:
-    def __init__(self):
-        self.app_dir = Path.home() / ".kensho"
-        self.state_file = self.app_dir / "state.json"
-        self._ensure_dir()
+STATE_KEY = "state"
 
-    def _ensure_dir(self):
-        if not self.app_dir.exists():
-            self.app_dir.mkdir(parents=True)
+class AppState:
+    def __init__(self, backend: Optional[StorageBackend] = None):
+        self.backend = backend or get_default_backend()
 
     def load_state(self) -> Dict[str, Any]:
-        """Loads app state from JSON file."""
-        if not self.state_file.exists():
-            return {"clocks": [], "sound": "System Exclamation"}
-        
-        try:
-            with open(self.state_file, 'r') as f:
-                data = json.load(f)
-                # Ensure defaults
-                if "sound" not in data:
-                    data["sound"] = "System Exclamation"
-                return data
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error loading state: {e}")
+        """Loads app state from the storage backend."""
+        data = self.backend.load(STATE_KEY)
+        if not isinstance(data, dict):
             return {"clocks": [], "sound": "System Exclamation"}
 
-    def save_state(self, clocks: List[ClockUnit], sound_preference: str):
-        """Saves app state to JSON file."""
+        # Ensure defaults
+        if "sound" not in data:
+            data["sound"] = "System Exclamation"
+        return data
+
+    def save_state(self, clocks: List[ClockUnit], sound_preference: str,
+                   journal_seq: int = 0) -> bool:
+        """Saves app state to the storage backend.
+
+        `journal_seq` is the last journal event the snapshot covers.
+        """
         data = {
             "clocks": [clock.to_dict() for clock in clocks],
-            "sound": sound_preference
+            "sound": sound_preference,
+            "journal_seq": journal_seq
         }
         
         try:
-            with open(self.state_file, 'w') as f:
-                json.dump(data, f, indent=4)
-        except IOError as e:
+            self.backend.save(STATE_KEY, data)
+        except (OSError, sqlite3.Error) as e:
             print(f"Error saving state: {e}")
+            return False
+        return True
 
     def get_state_path(self) -> str:
-        return str(self.state_file)
+        return self.backend.location(STATE_KEY)
@@ -0,0 +1,126 @@
+"""Procedural notification tones.
+
+Bell, kalimba and chime sounds are rendered from a handful of parameters
+instead of read from disk: a sum of sine partials (frequency ratio,
+amplitude, decay time) under a short attack and exponential decays, all
+computed as one NumPy array operation. Rendered buffers are cached per
+(preset, frequency), so re-pitching a sound for each clock costs one render
+the first time and nothing after.
+"""
+
+import wave
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - numpy is optional, bundled WAVs still work
+    np = None
+
+SAMPLE_RATE = 44100
+PEAK = 0.89  # about -1 dBFS
+RELEASE = 0.005  # seconds of fade at the end so the cut never clicks
+
+
+@dataclass(frozen=True)
+class Partial:
+    ratio: float  # multiple of the fundamental
+    amplitude: float
+    decay: float  # seconds for the partial to fall to 1/e
+
+
+@dataclass(frozen=True)
+class Preset:
+    frequency: float
+    duration: float
+    attack: float
+    partials: Tuple[Partial, ...]
+
+
+PRESETS: Dict[str, Preset] = {
+    # Inharmonic partials of a struck bell; the upper ones die away quickly
+    "bell": Preset(440.0, 2.0, 0.002, (
+        Partial(0.5, 0.35, 1.6),
+        Partial(1.0, 1.0, 1.2),
+        Partial(1.19, 0.45, 0.9),
+        Partial(1.56, 0.3, 0.7),
+        Partial(2.0, 0.35, 0.5),
+        Partial(2.74, 0.2, 0.35),
+        Partial(3.76, 0.12, 0.25),
+    )),
+    # Plucked metal tine: strong fundamental, sparse high partials, fast decay
+    "kalimba": Preset(523.25, 1.2, 0.001, (
+        Partial(1.0, 1.0, 0.45),
+        Partial(5.4, 0.18, 0.06),
+        Partial(8.9, 0.08, 0.03),
+    )),
+    # Light tubular chime with a long shimmer
+    "chime": Preset(880.0, 1.8, 0.004, (
+        Partial(1.0, 1.0, 0.8),
+        Partial(2.76, 0.4, 0.4),
+        Partial(5.4, 0.2, 0.2),
+        Partial(8.93, 0.08, 0.1),
+    )),
+}
+
+
+def available() -> bool:
+    return np is not None
+
+
+def sound_stem(preset: str) -> str:
+    """Name used for a preset alongside the bundled files ("bell" -> "synth_bell")."""
+    return f"synth_{preset}"
+
+
+def transpose(frequency: float, semitones: float) -> float:
+    return frequency * 2.0 ** (semitones / 12.0)
+
+
+def render(preset: str, frequency: Optional[float] = None, semitones: float = 0.0,
+           sample_rate: int = SAMPLE_RATE) -> "np.ndarray":
+    """Render `preset` as mono float32 peaking at PEAK.
+
+    The result is cached and read-only; copy it before modifying.
+    """
+    spec = PRESETS[preset]
+    base = spec.frequency if frequency is None else frequency
+    # Round so nearby requests share one cache entry
+    return _render(preset, round(transpose(base, semitones), 2), sample_rate)
+
+
+@lru_cache(maxsize=64)
+def _render(preset: str, frequency: float, sample_rate: int) -> "np.ndarray":
+    spec = PRESETS[preset]
+    partials = [p for p in spec.partials if frequency * p.ratio < sample_rate / 2]
+    freqs = np.array([frequency * p.ratio for p in partials])[:, None]
+    amps = np.array([p.amplitude for p in partials])[:, None]
+    decays = np.array([p.decay for p in partials])[:, None]
+
+    t = np.arange(int(spec.duration * sample_rate)) / sample_rate
+    samples = (amps * np.exp(-t / decays) * np.sin(2.0 * np.pi * freqs * t)).sum(axis=0)
+
+    envelope = np.ones_like(t)
+    attack = max(1, int(spec.attack * sample_rate))
+    envelope[:attack] = np.linspace(0.0, 1.0, attack)
+    release = max(1, int(RELEASE * sample_rate))
+    envelope[-release:] *= np.linspace(1.0, 0.0, release)
+    samples *= envelope
+
+    samples *= PEAK / max(float(np.abs(samples).max()), 1e-9)
+    out = samples.astype(np.float32)
+    out.setflags(write=False)
+    return out
+
+
+def write_wav(path: Path, samples: "np.ndarray", sample_rate: int = SAMPLE_RATE) -> Path:
+    """Store rendered samples as 16-bit PCM (for players that need a file)."""
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767.0).astype("<i2")
+    with wave.open(str(path), "wb") as handle:
+        handle.setnchannels(1)
+        handle.setsampwidth(2)
+        handle.setframerate(sample_rate)
+        handle.writeframes(pcm.tobytes())
+    return path
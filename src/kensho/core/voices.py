@@ -0,0 +1,116 @@
+"""Fixed-size pool of sound-effect voices.
+
+Each voice wraps one effect object (a QSoundEffect in the app) and keeps
+the source it last decoded, so replaying a recently used sound costs no
+decode. The pool never grows past `size`; beyond `polyphony` simultaneous
+sounds the oldest playing voice is stolen.
+
+The pool is Qt-agnostic: effects come from `factory()` and sources are
+attached with `load(effect, source)`.
+"""
+
+import time
+from typing import Any, Callable, Hashable, List, Optional
+
+
+class Voice:
+    __slots__ = ("effect", "source", "started", "last_used")
+
+    def __init__(self, effect: Any):
+        self.effect = effect
+        self.source: Optional[Hashable] = None
+        self.started = 0.0
+        self.last_used = 0.0
+
+    def is_playing(self) -> bool:
+        return bool(self.effect.isPlaying())
+
+
+class VoicePool:
+    def __init__(self, factory: Callable[[], Any], load: Callable[[Any, Hashable], None],
+                 size: int = 6, polyphony: int = 4,
+                 clock: Callable[[], float] = time.monotonic):
+        if size < 1 or polyphony < 1:
+            raise ValueError("Voice pool needs at least one voice")
+        self.factory = factory
+        self.load = load
+        self.size = size
+        self.polyphony = min(polyphony, size)
+        self.clock = clock
+        self.voices: List[Voice] = []
+
+    def playing_count(self) -> int:
+        return sum(1 for voice in self.voices if voice.is_playing())
+
+    def preload(self, source: Hashable) -> Optional[Voice]:
+        """Make sure an idle voice has `source` decoded. Never interrupts playback."""
+        for voice in self.voices:
+            if voice.source == source:
+                voice.last_used = self.clock()
+                return voice
+        voice = self._new_voice() or self._least_recent_idle()
+        if voice is not None:
+            self._assign(voice, source)
+            voice.last_used = self.clock()
+        return voice
+
+    def play(self, source: Hashable, volume: float = 1.0, retrigger: bool = False) -> Voice:
+        """Start `source` on a voice and return it.
+
+        With `retrigger`, a voice already playing this source is restarted
+        instead of layering another copy on top (e.g. repeated test clicks).
+        """
+        voice = self._acquire(source, retrigger)
+        if voice.source != source:
+            self._assign(voice, source)
+        if voice.is_playing():
+            voice.effect.stop()
+        voice.effect.setVolume(max(0.0, min(float(volume), 1.0)))
+        voice.effect.play()
+        now = self.clock()
+        voice.started = now
+        voice.last_used = now
+        return voice
+
+    def _acquire(self, source: Hashable, retrigger: bool) -> Voice:
+        playing = [v for v in self.voices if v.is_playing()]
+
+        if retrigger:
+            for voice in playing:
+                if voice.source == source:
+                    return voice
+
+        if len(playing) >= self.polyphony:
+            return self._steal(playing, source)
+
+        idle = [v for v in self.voices if not v.is_playing()]
+        same = [v for v in idle if v.source == source]
+        if same:
+            return max(same, key=lambda v: v.last_used)
+
+        voice = self._new_voice() or self._least_recent_idle()
+        if voice is not None:
+            return voice
+        return self._steal(playing, source)
+
+    def _steal(self, playing: List[Voice], source: Hashable) -> Voice:
+        # Oldest first; among equally old voices prefer one that already has
+        # the source decoded.
+        return min(playing, key=lambda v: (v.started, v.source != source))
+
+    def _new_voice(self) -> Optional[Voice]:
+        if len(self.voices) >= self.size:
+            return None
+        voice = Voice(self.factory())
+        self.voices.append(voice)
+        return voice
+
+    def _least_recent_idle(self) -> Optional[Voice]:
+        idle = [v for v in self.voices if not v.is_playing()]
+        if not idle:
+            return None
+        return min(idle, key=lambda v: v.last_used)
+
+    def _assign(self, voice: Voice, source: Hashable) -> None:
+        self.load(voice.effect, source)
+        voice.source = source
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import queue
 import threading
-from typing import Optional
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from .core.dispatcher import Batch, NotificationDispatcher
 
 try:
     from win10toast import ToastNotifier
@@ -15,8 +18,84 @@ try:
 except Exception:  # pragma: no cover - winsound is Windows-only
     winsound = None
 
+# (frequency Hz, duration ms) steps per sound id; anything else is a soft chime
+BEEP_PATTERNS: Dict[str, Tuple[Tuple[int, int], ...]] = {
+    "metronome": ((880, 150), (660, 150)),
+}
+DEFAULT_PATTERN = ((880, 300),)
+AUDIO_QUEUE_SIZE = 4
+
 _toast_instance: Optional["ToastNotifier"] = None
 _toast_lock = threading.Lock()
+_audio_worker: Optional["AudioWorker"] = None
+_audio_lock = threading.Lock()
+_dispatcher = NotificationDispatcher()
+_dispatch_lock = threading.Lock()
+_dispatch_timer: Optional[threading.Timer] = None
+
+
+class AudioWorker:
+    """Plays beep patterns on a background thread so callers never block.
+
+    Requests go through a bounded queue. A sound id that is already waiting
+    is not queued again, so many clocks finishing together produce one beep
+    pattern, and when the queue is full new requests are dropped rather than
+    piling up. `backend(frequency, duration_ms)` does the actual (blocking)
+    beep; it is `winsound.Beep` in the app and a stub in tests.
+    """
+
+    _STOP = object()
+
+    def __init__(self, backend: Callable[[int, int], None], maxsize: int = AUDIO_QUEUE_SIZE):
+        self.backend = backend
+        self._queue: "queue.Queue" = queue.Queue(maxsize)
+        self._pending: Set[str] = set()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, sound_id: str) -> bool:
+        """Queue `sound_id`; False if it was coalesced or dropped."""
+        with self._lock:
+            if sound_id in self._pending:
+                return False
+            try:
+                self._queue.put_nowait(sound_id)
+            except queue.Full:
+                return False
+            self._pending.add(sound_id)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="kensho-audio", daemon=True)
+                self._thread.start()
+        return True
+
+    def wait_idle(self) -> None:
+        """Block until everything queued so far has played."""
+        self._queue.join()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is not None:
+            self._queue.put(self._STOP)
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            sound_id = self._queue.get()
+            try:
+                if sound_id is self._STOP:
+                    return
+                with self._lock:
+                    self._pending.discard(sound_id)
+                for frequency, duration in BEEP_PATTERNS.get(sound_id, DEFAULT_PATTERN):
+                    try:
+                        self.backend(frequency, duration)
+                    except Exception:
+                        # A failing audio device must not kill the worker
+                        break
+            finally:
+                self._queue.task_done()
 
 
 def _get_toast() -> Optional["ToastNotifier"]:
@@ -29,17 +108,22 @@ def _get_toast() -> Optional["ToastNotifier"]:
     return _toast_instance
 
 
-def play_sound(sound_id: str) -> None:
-    """Play a short notification tone."""
+def _get_audio_worker() -> Optional[AudioWorker]:
+    global _audio_worker
     if winsound is None:
-        return
+        return None
+    with _audio_lock:
+        if _audio_worker is None:
+            _audio_worker = AudioWorker(winsound.Beep)
+    return _audio_worker
+
 
-    if sound_id == "metronome":
-        winsound.Beep(880, 150)
-        winsound.Beep(660, 150)
-    else:
-        # Default to a single soft chime.
-        winsound.Beep(880, 300)
+def play_sound(sound_id: str) -> None:
+    """Queue a short notification tone; returns without waiting for it."""
+    worker = _get_audio_worker()
+    if worker is None:
+        return
+    worker.submit(sound_id)
 
 
 def show_toast(title: str, message: str) -> None:
@@ -49,10 +133,44 @@ def show_toast(title: str, message: str) -> None:
     notifier.show_toast(title, message, duration=3, threaded=True)
 
 
-def notify_clock_due(clock_label: str, sound_id: str) -> None:
-    """Send a combined toast + sound notification when a clock completes."""
-    play_sound(sound_id)
-    show_toast("Kenshō", f"{clock_label} is ready for a check-in.")
+def notify_clock_due(clock_label: str, sound_id: str, clock_id: Optional[str] = None) -> None:
+    """Send a combined toast + sound notification when a clock completes.
+
+    Clocks finishing close together are batched into one notification and
+    the overall rate is limited; see core.dispatcher. Repeats are dropped
+    per `clock_id`, so two clocks sharing a label both notify (the label
+    is the key only for callers that don't pass an id).
+    """
+    key = clock_id if clock_id is not None else clock_label
+    with _dispatch_lock:
+        _dispatcher.submit(key, clock_label, f"{clock_label} is ready for a check-in.",
+                           payload=sound_id)
+        _schedule_dispatch()
+
+
+def _schedule_dispatch() -> None:
+    global _dispatch_timer
+    deadline = _dispatcher.next_deadline()
+    if deadline is None or (_dispatch_timer is not None and _dispatch_timer.is_alive()):
+        return
+    _dispatch_timer = threading.Timer(max(0.0, deadline - _dispatcher.clock()), _dispatch)
+    _dispatch_timer.daemon = True
+    _dispatch_timer.start()
+
+
+def _dispatch() -> None:
+    global _dispatch_timer
+    with _dispatch_lock:
+        batch = _dispatcher.flush()
+        _dispatch_timer = None
+        _schedule_dispatch()
+    if batch is not None:
+        _deliver(batch)
+
+
+def _deliver(batch: Batch) -> None:
+    play_sound(batch.completions[0].payload)
+    show_toast("Kenshō", batch.message)
 
 
-__all__ = ["notify_clock_due", "play_sound", "show_toast"]
+__all__ = ["AudioWorker", "notify_clock_due", "play_sound", "show_toast"]
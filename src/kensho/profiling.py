@@ -0,0 +1,118 @@
+"""Startup timing for Kenshō.
+
+Phases are marked unconditionally (a list append each), and only written
+out when the app runs with ``--profile-startup``. All times are relative
+to the moment this module was first imported, which is the first Kenshō
+code to run for both ``run.py`` and ``python -m kensho.app``.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+_ORIGIN = time.perf_counter()
+_ORIGIN_WALL = time.time()
+
+
+def _interpreter_start_ms() -> Optional[float]:
+    """Process creation time relative to the origin, when it can be known.
+
+    psutil is optional and imported here, only when a report is built,
+    so normal launches do not pay for the import.
+    """
+    try:
+        import psutil
+    except Exception:  # pragma: no cover - optional, only sharpens interpreter start
+        return None
+    try:
+        created = psutil.Process().create_time()
+    except Exception:
+        return None
+    return round((created - _ORIGIN_WALL) * 1000, 3)
+
+
+class StartupProfiler:
+    def __init__(self) -> None:
+        self.marks: List[Tuple[str, float]] = []
+        self.enabled = False
+        self.report_path: Optional[Path] = None
+        self.cprofile_path: Optional[Path] = None
+        self._profile = None
+        self._written = False
+        self._lock = threading.Lock()
+
+    def enable(self, report_path: Path, cprofile_path: Optional[Path] = None) -> None:
+        self.enabled = True
+        self.report_path = Path(report_path)
+        if cprofile_path is not None:
+            import cProfile
+
+            self.cprofile_path = Path(cprofile_path)
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+    def mark(self, phase: str) -> None:
+        """Record that `phase` just finished. Safe to call from any thread."""
+        with self._lock:
+            self.marks.append((phase, time.perf_counter()))
+
+    def has(self, phase: str) -> bool:
+        with self._lock:
+            return any(name == phase for name, _ in self.marks)
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            marks = list(self.marks)
+        phases = []
+        previous = _ORIGIN
+        for name, at in marks:
+            phases.append({
+                "phase": name,
+                "at_ms": round((at - _ORIGIN) * 1000, 3),
+                "delta_ms": round((at - previous) * 1000, 3),
+            })
+            previous = at
+        return {
+            "timestamp": _ORIGIN_WALL,
+            "python": platform.python_version(),
+            "platform": sys.platform,
+            "frozen": bool(getattr(sys, "frozen", False)),
+            "interpreter_start_ms": _interpreter_start_ms(),
+            "phases": phases,
+            "total_ms": phases[-1]["at_ms"] if phases else 0.0,
+        }
+
+    def finish(self) -> Optional[Path]:
+        """Write the JSON report (and cProfile dump) once. Returns the report path."""
+        if not self.enabled or self._written:
+            return None
+        self._written = True
+
+        if self._profile is not None:
+            self._profile.disable()
+            self.cprofile_path.parent.mkdir(parents=True, exist_ok=True)
+            self._profile.dump_stats(str(self.cprofile_path))
+
+        report = self.report()
+        if self.cprofile_path is not None:
+            report["cprofile"] = str(self.cprofile_path)
+        self.report_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.report_path.open("w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+        return self.report_path
+
+
+startup = StartupProfiler()
+
+
+def mark(phase: str) -> None:
+    startup.mark(phase)
+
+
+__all__ = ["StartupProfiler", "mark", "startup"]
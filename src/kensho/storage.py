@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import abc
+import copy
 import json
 import os
+import sqlite3
 import sys
+import threading
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 APP_NAME = "Kensho"
-APP_STATE_FILENAME = "app_state.json"
+SQLITE_FILENAME = "kensho.db"
+DEFAULT_BACKEND = "json"
 
 
 def _default_data_dir() -> Path:
@@ -28,7 +33,8 @@ def _default_data_dir() -> Path:
 
 
 DATA_DIR = _default_data_dir()
-APP_STATE_FILE = DATA_DIR / APP_STATE_FILENAME
+# Older builds wrote state and history here regardless of platform.
+LEGACY_DATA_DIR = Path.home() / f".{APP_NAME.lower()}"
 
 
 def ensure_data_dir() -> None:
@@ -36,33 +42,297 @@ def ensure_data_dir() -> None:
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def load_app_state() -> Dict[str, Any]:
-    """Read persisted application state from disk."""
-    ensure_data_dir()
-    if not APP_STATE_FILE.exists():
-        return {}
+def _write_json_atomic(path: Path, data: Any) -> None:
+    """Write JSON to a sibling temp file and swap it into place."""
+    tmp_path = path.with_suffix(".tmp")
+    with tmp_path.open("w", encoding="utf-8") as handle:
+        json.dump(data, handle, indent=2)
+    tmp_path.replace(path)
 
-    try:
-        with APP_STATE_FILE.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
-    except (json.JSONDecodeError, OSError):
-        # If the file is corrupted or unreadable we return a clean state
-        return {}
 
+class StorageBackend(abc.ABC):
+    """Key/value document store shared by every persisted subsystem.
 
-def save_app_state(state: Dict[str, Any]) -> None:
-    """Persist application state atomically."""
-    ensure_data_dir()
-    tmp_path = APP_STATE_FILE.with_suffix(".tmp")
-    with tmp_path.open("w", encoding="utf-8") as handle:
-        json.dump(state, handle, indent=2)
-    tmp_path.replace(APP_STATE_FILE)
+    Values are JSON-compatible objects. Implementations must hand out
+    copies so callers can mutate what they load without touching the store.
+    """
+
+    name = "base"
+
+    @abc.abstractmethod
+    def load(self, key: str, default: Any = None) -> Any:
+        """Return the document stored under `key`, or `default`."""
+
+    @abc.abstractmethod
+    def save(self, key: str, value: Any) -> None:
+        """Replace the document stored under `key`."""
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove `key`; missing keys are ignored."""
+
+    @abc.abstractmethod
+    def append(self, key: str, record: Dict[str, Any]) -> None:
+        """Add one record to the append-only log named `key`."""
+
+    @abc.abstractmethod
+    def read_log(self, key: str) -> List[Dict[str, Any]]:
+        """Return every record in the log, oldest first."""
+
+    @abc.abstractmethod
+    def clear_log(self, key: str) -> None:
+        """Drop every record in the log named `key`."""
+
+    def location(self, key: str) -> str:
+        """Describe where `key` lives, for logs and the settings UI."""
+        return f"{self.name}:{key}"
+
+
+class MemoryBackend(StorageBackend):
+    """Keeps everything in RAM. Used by tests and benchmarks."""
+
+    name = "memory"
+
+    def __init__(self) -> None:
+        self._documents: Dict[str, Any] = {}
+        self._logs: Dict[str, List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._documents:
+                return default
+            return copy.deepcopy(self._documents[key])
+
+    def save(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._documents[key] = copy.deepcopy(value)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._documents.pop(key, None)
+
+    def append(self, key: str, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self._logs.setdefault(key, []).append(copy.deepcopy(record))
+
+    def read_log(self, key: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            return copy.deepcopy(self._logs.get(key, []))
+
+    def clear_log(self, key: str) -> None:
+        with self._lock:
+            self._logs.pop(key, None)
+
+
+class JsonFileBackend(StorageBackend):
+    """One `<key>.json` file per document, written atomically.
+
+    Logs are JSON Lines files (`<key>.jsonl`) so appending never rewrites
+    what is already on disk.
+    """
+
+    name = "json"
+
+    def __init__(self, root: Path, legacy_root: Optional[Path] = None) -> None:
+        self.root = Path(root)
+        self.legacy_root = Path(legacy_root) if legacy_root else None
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def load(self, key: str, default: Any = None) -> Any:
+        path = self._path(key)
+        if not path.exists() and self.legacy_root is not None:
+            legacy_path = self.legacy_root / path.name
+            if legacy_path.exists():
+                path = legacy_path
+        if not path.exists():
+            return default
+        try:
+            with path.open("r", encoding="utf-8") as handle:
+                return json.load(handle)
+        except (json.JSONDecodeError, OSError):
+            return default
+
+    def save(self, key: str, value: Any) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        _write_json_atomic(self._path(key), value)
+
+    def delete(self, key: str) -> None:
+        for root in (self.root, self.legacy_root):
+            if root is None:
+                continue
+            path = root / f"{key}.json"
+            if path.exists():
+                path.unlink()
+
+    def _log_path(self, key: str) -> Path:
+        return self.root / f"{key}.jsonl"
+
+    def append(self, key: str, record: Dict[str, Any]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        line = json.dumps(record, separators=(",", ":"))
+        with self._log_path(key).open("a", encoding="utf-8") as handle:
+            handle.write(line + "\n")
+
+    def read_log(self, key: str) -> List[Dict[str, Any]]:
+        path = self._log_path(key)
+        if not path.exists():
+            return []
+        records = []
+        try:
+            with path.open("r", encoding="utf-8") as handle:
+                for line in handle:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        # A crash mid-append leaves a torn last line
+                        continue
+        except (OSError, ValueError):
+            # Unreadable file or bytes that are not UTF-8
+            return []
+        return records
+
+    def clear_log(self, key: str) -> None:
+        path = self._log_path(key)
+        if path.exists():
+            path.unlink()
+
+    def location(self, key: str) -> str:
+        return str(self._path(key))
+
+
+class SqliteBackend(StorageBackend):
+    """All documents in a single SQLite database."""
+
+    name = "sqlite"
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        if str(self.path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        # State is loaded off the GUI thread, so share one guarded connection.
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS documents "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS logs "
+                "(id INTEGER PRIMARY KEY AUTOINCREMENT, key TEXT NOT NULL, value TEXT NOT NULL)"
+            )
+
+    def load(self, key: str, default: Any = None) -> Any:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value FROM documents WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            return default
+        if row is None:
+            return default
+        try:
+            return json.loads(row[0])
+        except json.JSONDecodeError:
+            return default
+
+    def save(self, key: str, value: Any) -> None:
+        payload = json.dumps(value)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO documents (key, value) VALUES (?, ?)",
+                (key, payload),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM documents WHERE key = ?", (key,))
+
+    def append(self, key: str, record: Dict[str, Any]) -> None:
+        payload = json.dumps(record, separators=(",", ":"))
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO logs (key, value) VALUES (?, ?)", (key, payload)
+            )
+
+    def read_log(self, key: str) -> List[Dict[str, Any]]:
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT value FROM logs WHERE key = ? ORDER BY id", (key,)
+                ).fetchall()
+        except sqlite3.Error:
+            return []
+        records = []
+        for row in rows:
+            try:
+                records.append(json.loads(row[0]))
+            except ValueError:
+                continue
+        return records
+
+    def clear_log(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM logs WHERE key = ?", (key,))
+
+    def location(self, key: str) -> str:
+        return f"{self.path}#{key}"
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def create_backend(kind: Optional[str] = None, root: Optional[Path] = None) -> StorageBackend:
+    """Build a backend by name: "json", "sqlite" or "memory".
+
+    The kind defaults to `KENSHO_STORAGE`, the root to the data directory.
+    """
+    kind = (kind or os.getenv("KENSHO_STORAGE") or DEFAULT_BACKEND).lower()
+    root = Path(root) if root is not None else DATA_DIR
+
+    if kind == "memory":
+        return MemoryBackend()
+    if kind == "sqlite":
+        return SqliteBackend(root / SQLITE_FILENAME)
+    if kind == "json":
+        legacy = LEGACY_DATA_DIR if root == DATA_DIR and root != LEGACY_DATA_DIR else None
+        return JsonFileBackend(root, legacy_root=legacy)
+    raise ValueError(f"Unknown storage backend: {kind!r}")
+
+
+_default_backend: Optional[StorageBackend] = None
+_default_lock = threading.Lock()
+
+
+def get_default_backend() -> StorageBackend:
+    """Return the process-wide backend, creating it from config on first use."""
+    global _default_backend
+    with _default_lock:
+        if _default_backend is None:
+            _default_backend = create_backend()
+    return _default_backend
+
+
+def set_default_backend(backend: Optional[StorageBackend]) -> None:
+    """Swap the process-wide backend (tests, benchmarks, tmpfs runs)."""
+    global _default_backend
+    with _default_lock:
+        _default_backend = backend
 
 
 __all__ = [
-    "APP_STATE_FILE",
     "DATA_DIR",
+    "JsonFileBackend",
+    "MemoryBackend",
+    "SqliteBackend",
+    "StorageBackend",
+    "create_backend",
     "ensure_data_dir",
-    "load_app_state",
-    "save_app_state",
+    "get_default_backend",
+    "set_default_backend",
 ]
@@ -0,0 +1,191 @@
+"""One Qt list model of the clocks, shared by every clock view.
+
+The model is the only thing connected to each ClockUnit's signals. Views
+(dashboard grid, widget-mode rings, widget-mode notifications) connect to
+the model once, so the number of connections per clock stays constant no
+matter how many views come and go.
+
+Ticks and state changes are not forwarded one by one: the model marks the
+row and role dirty and, once per frame, emits one dataChanged per run of
+adjacent dirty rows carrying just the roles that changed. Completions are
+forwarded immediately through `clock_finished`.
+"""
+
+from functools import partial
+from typing import Dict, List, Set
+
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QTimer, Signal
+
+from ..core.models import ClockUnit
+
+ClockRole = Qt.UserRole + 1
+IdentifierRole = Qt.UserRole + 2
+ProgressRole = Qt.UserRole + 3
+TimeTextRole = Qt.UserRole + 4
+RunningRole = Qt.UserRole + 5
+DueRole = Qt.UserRole + 6
+
+# Role groups views check against dataChanged's role list
+TICK_ROLES = (ProgressRole, TimeTextRole)
+STATE_ROLES = (RunningRole, DueRole)
+TEXT_ROLES = (Qt.DisplayRole,)
+
+FRAME_MS = 16
+
+# ClockUnit operations that change what a view shows besides ticks
+_OPERATION_ROLES = {
+    "label": TEXT_ROLES,
+    "interval": TICK_ROLES + STATE_ROLES,  # also resets, like "reset"
+    "reset": STATE_ROLES,  # clears "due" without a paused_changed
+}
+
+
+class ClockListModel(QAbstractListModel):
+    clock_finished = Signal(object, int)  # (ClockUnit, row)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._clocks: List[ClockUnit] = []
+        # Keyed by the clock object: identifiers from older saves may repeat
+        self._rows: Dict[ClockUnit, int] = {}
+        self._slots: Dict[ClockUnit, tuple] = {}
+        self._dirty_rows: Set[int] = set()
+        self._dirty_roles: Set[int] = set()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(FRAME_MS)
+        self._flush_timer.timeout.connect(self.flush)
+
+    @property
+    def clocks(self) -> List[ClockUnit]:
+        """The clocks in row order (read-only; change them through the model)."""
+        return self._clocks
+
+    def clock(self, row: int) -> ClockUnit:
+        return self._clocks[row]
+
+    def row_of(self, clock: ClockUnit) -> int:
+        return self._rows.get(clock, -1)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._clocks)
+
+    def roleNames(self):
+        return {
+            Qt.DisplayRole: b"label",
+            ClockRole: b"clock",
+            IdentifierRole: b"identifier",
+            ProgressRole: b"progress",
+            TimeTextRole: b"timeText",
+            RunningRole: b"running",
+            DueRole: b"due",
+        }
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        clock = self._clocks[index.row()]
+        if role == Qt.DisplayRole:
+            return clock.label
+        if role == ClockRole:
+            return clock
+        if role == IdentifierRole:
+            return clock.identifier
+        if role == ProgressRole:
+            return clock.progress
+        if role == TimeTextRole:
+            return clock.time_text
+        if role == RunningRole:
+            return not clock._paused and not clock._due
+        if role == DueRole:
+            return clock._due
+        return None
+
+    def set_clocks(self, clocks: List[ClockUnit]):
+        self.beginResetModel()
+        for clock in self._clocks:
+            self._disconnect(clock)
+        self._clocks = list(clocks)
+        for clock in self._clocks:
+            self._connect(clock)
+        self._reindex()
+        self._flush_timer.stop()
+        self._dirty_rows.clear()
+        self._dirty_roles.clear()
+        self.endResetModel()
+
+    def append_clock(self, clock: ClockUnit):
+        row = len(self._clocks)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._clocks.append(clock)
+        self._rows[clock] = row
+        self._connect(clock)
+        self.endInsertRows()
+
+    def remove_clock(self, clock: ClockUnit) -> bool:
+        row = self.row_of(clock)
+        if row < 0 or self._clocks[row] is not clock:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._disconnect(clock)
+        del self._clocks[row]
+        self._reindex()
+        # Pending rows below the removed one move up with it
+        self._dirty_rows = {r if r < row else r - 1 for r in self._dirty_rows if r != row}
+        self.endRemoveRows()
+        return True
+
+    def flush(self):
+        """Emit the pending changes now (normally once per frame)."""
+        self._flush_timer.stop()
+        if not self._dirty_rows:
+            return
+        rows = sorted(self._dirty_rows)
+        roles = sorted(self._dirty_roles)
+        self._dirty_rows.clear()
+        self._dirty_roles.clear()
+        start = previous = rows[0]
+        for row in rows[1:] + [None]:
+            if row is not None and row == previous + 1:
+                previous = row
+                continue
+            self.dataChanged.emit(self.index(start), self.index(previous), roles)
+            if row is not None:
+                start = previous = row
+
+    def _mark(self, clock: ClockUnit, roles, *_):
+        row = self._rows.get(clock)
+        if row is None:
+            return
+        self._dirty_rows.add(row)
+        self._dirty_roles.update(roles)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _on_operation(self, clock: ClockUnit, _identifier, op, _fields):
+        roles = _OPERATION_ROLES.get(op)
+        if roles:
+            self._mark(clock, roles)
+
+    def _on_finished(self, clock: ClockUnit):
+        row = self._rows.get(clock)
+        if row is not None:
+            self.clock_finished.emit(clock, row)
+
+    def _connect(self, clock: ClockUnit):
+        slots = (
+            (clock.ticked, partial(self._mark, clock, TICK_ROLES)),
+            (clock.paused_changed, partial(self._mark, clock, STATE_ROLES)),
+            (clock.operation, partial(self._on_operation, clock)),
+            (clock.finished, partial(self._on_finished, clock)),
+        )
+        for signal, slot in slots:
+            signal.connect(slot)
+        self._slots[clock] = slots
+
+    def _disconnect(self, clock: ClockUnit):
+        for signal, slot in self._slots.pop(clock, ()):
+            signal.disconnect(slot)
+
+    def _reindex(self):
+        self._rows = {clock: row for row, clock in enumerate(self._clocks)}
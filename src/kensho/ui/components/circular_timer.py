@@ -1,6 +1,8 @@
 import customtkinter as ctk
 import math
+import time
 from typing import Callable, Optional
+from ...core.pulse import pulse_frames
 
 class CircularTimer(ctk.CTkCanvas):
     def __init__(
@@ -20,7 +22,10 @@ class CircularTimer(ctk.CTkCanvas):
         self._value = initial_value
         self._is_dragging = False
         self._pulsing = False
+        self._pulse_scheduled = False
         self._current_stroke_width = stroke_width
+        # Stroke width (base to base+4) per breathing frame, one breath per pi seconds
+        self._pulse = pulse_frames(stroke_width, 4.0, period=math.pi)
         
         # Colors (can be made configurable)
         self.bg_color = "#2b2b2b" # Track color
@@ -36,6 +41,7 @@ class CircularTimer(ctk.CTkCanvas):
         self.bind("<Button-1>", self._on_click)
         self.bind("<B1-Motion>", self._on_drag)
         self.bind("<ButtonRelease-1>", self._on_release)
+        self.bind("<Map>", self._on_map)
         
         self._draw()
 
@@ -142,25 +148,23 @@ class CircularTimer(ctk.CTkCanvas):
             self._pulse_start_time = 0
             self._animate_pulse()
 
+    def _on_map(self, event):
+        # The pulse loop stops while unmapped; catch up and resume on show
+        if self._pulsing and not self._pulse_scheduled:
+            self._animate_pulse()
+
     def stop_pulse(self):
         self._pulsing = False
         # Reset stroke width
         self._draw()
 
     def _animate_pulse(self):
+        self._pulse_scheduled = False
         if not self._pulsing:
             return
             
-        # Simple sine wave breathing
-        import time
-        import math
-        
-        t = time.time() * 2 # Speed
-        # Oscillate stroke width between base and base+4
-        base_width = self.stroke_width
-        extra = (math.sin(t) + 1) * 2 # 0 to 4
-        
-        current_width = base_width + extra
+        # Breathing: look the width up in the precomputed frames
+        current_width = self._pulse.width_at(time.time())
         
         # Redraw only the arc with new width? 
         # Full redraw is safer for now to keep handles aligned, 
@@ -173,7 +177,9 @@ class CircularTimer(ctk.CTkCanvas):
         self._current_stroke_width = current_width
         self._draw(pulse_width=current_width)
         
-        self.after(50, self._animate_pulse)
+        if self.winfo_viewable():
+            self._pulse_scheduled = True
+            self.after(round(self._pulse.frame_interval * 1000), self._animate_pulse)
 
     def _draw(self, pulse_width=None):
         self.delete("all")
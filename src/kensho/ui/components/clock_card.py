@@ -1,24 +1,34 @@
 from PySide6.QtWidgets import (QFrame, QVBoxLayout, QHBoxLayout, QLabel, 
                                QPushButton, QProgressBar, QWidget)
 from PySide6.QtCore import Qt, Signal
+from ...core.metrics import collector as metrics
 from ...core.models import ClockUnit
+from ..clock_model import STATE_ROLES, TEXT_ROLES, TICK_ROLES
+from ..scheduler import scheduler
 
 class ClockCard(QFrame):
     delete_requested = Signal(object) # Emits the ClockUnit
 
+    CARD_WIDTH = 300
+    CARD_HEIGHT = 180
+
     def __init__(self, clock: ClockUnit, parent=None):
         super().__init__(parent)
-        self.clock = clock
+        self.clock = None
         self.setObjectName("ClockCard")
-        self.setFixedSize(300, 180)
+        self.setFixedSize(self.CARD_WIDTH, self.CARD_HEIGHT)
         
-        # Styles
+        # Styles (the running highlight is a property selector, so toggling
+        # it or rebinding the card never re-parses the sheet)
         self.setStyleSheet("""
             QFrame#ClockCard {
                 background-color: #2b2b2b;
                 border-radius: 15px;
                 border: 1px solid #333;
             }
+            QFrame#ClockCard[running="true"] {
+                border-color: #3b8ed0;
+            }
             QLabel#TimeLabel {
                 font-size: 32px;
                 font-weight: bold;
@@ -44,12 +54,12 @@ class ClockCard(QFrame):
         layout.setContentsMargins(20, 20, 20, 20)
         
         # Header
-        self.title_label = QLabel(clock.label)
+        self.title_label = QLabel()
         self.title_label.setObjectName("TitleLabel")
         layout.addWidget(self.title_label)
         
         # Time Display
-        self.time_label = QLabel(clock.time_text)
+        self.time_label = QLabel()
         self.time_label.setObjectName("TimeLabel")
         self.time_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.time_label)
@@ -58,7 +68,6 @@ class ClockCard(QFrame):
         self.progress_bar = QProgressBar()
         self.progress_bar.setTextVisible(False)
         self.progress_bar.setRange(0, 1000)
-        self.progress_bar.setValue(int(clock.progress * 1000))
         layout.addWidget(self.progress_bar)
         
         # Controls
@@ -66,7 +75,7 @@ class ClockCard(QFrame):
         
         self.btn_toggle = QPushButton("Start")
         self.btn_toggle.setCursor(Qt.PointingHandCursor)
-        self.btn_toggle.clicked.connect(self.clock.toggle)
+        self.btn_toggle.clicked.connect(lambda: self.clock.toggle())
         
         self.btn_edit = QPushButton("Edit")
         self.btn_edit.setCursor(Qt.PointingHandCursor)
@@ -81,7 +90,7 @@ class ClockCard(QFrame):
         
         self.btn_reset = QPushButton("Reset")
         self.btn_reset.setCursor(Qt.PointingHandCursor)
-        self.btn_reset.clicked.connect(self.clock.reset)
+        self.btn_reset.clicked.connect(lambda: self.clock.reset())
         
         controls_layout.addWidget(self.btn_toggle)
         controls_layout.addWidget(self.btn_edit)
@@ -89,13 +98,39 @@ class ClockCard(QFrame):
         controls_layout.addWidget(self.btn_delete)
         layout.addLayout(controls_layout)
         
-        # Connect Signals
-        self.clock.ticked.connect(self._on_tick)
-        self.clock.paused_changed.connect(self._on_paused_changed)
-        self.clock.finished.connect(self._on_finished)
-        
-        # Initial State
-        self._on_paused_changed(True)
+        # Ticks while hidden collapse into one update on show
+        self.display_job = scheduler().register(self, self._refresh_display)
+        self.bind(clock)
+
+    def bind(self, clock: ClockUnit):
+        """Show `clock` on this card (cards are recycled between clocks).
+
+        The card holds no clock connections: its grid forwards the
+        ClockListModel's dataChanged roles to refresh().
+        """
+        self.clock = clock
+        self.title_label.setText(clock.label)
+        self._refresh_display()
+        self._on_paused_changed(clock._paused)
+
+    def detach(self):
+        """Forget the clock; an unused card ignores refreshes."""
+        self.clock = None
+
+    def refresh(self, roles):
+        """Update the parts of the card the model reported as changed."""
+        if self.clock is None:
+            return
+        if not roles or any(role in roles for role in TICK_ROLES):
+            self.display_job.request()
+        if not roles or any(role in roles for role in STATE_ROLES):
+            self._on_paused_changed(self.clock._paused)
+        if not roles or any(role in roles for role in TEXT_ROLES):
+            self.title_label.setText(self.clock.label)
+
+    def paintEvent(self, event):
+        with metrics.paint("Card"):
+            super().paintEvent(event)
 
     def _on_edit(self):
         from PySide6.QtWidgets import QDialog, QVBoxLayout, QFormLayout, QDoubleSpinBox, QLineEdit, QDialogButtonBox
@@ -134,18 +169,16 @@ class ClockCard(QFrame):
             self.clock.update_interval(spin_minutes.value())
             self.clock.completion_message = edit_message.text()
 
-    def _on_tick(self, progress):
+    def _refresh_display(self):
+        if self.clock is None:
+            return
         self.time_label.setText(self.clock.time_text)
-        self.progress_bar.setValue(int(progress * 1000))
+        self.progress_bar.setValue(int(self.clock.progress * 1000))
 
     def _on_paused_changed(self, paused):
         self.btn_toggle.setText("Start" if paused else "Pause")
-        # Update style for active state?
-        if not paused:
-            self.setStyleSheet(self.styleSheet().replace("#333;", "#3b8ed0;")) # Hacky highlight
-        else:
-            self.setStyleSheet(self.styleSheet().replace("#3b8ed0;", "#333;"))
-
-    def _on_finished(self):
-        self.btn_toggle.setText("Start")
-        # Maybe play sound?
+        # Highlight the border while running
+        if self.property("running") != (not paused):
+            self.setProperty("running", not paused)
+            self.style().unpolish(self)
+            self.style().polish(self)
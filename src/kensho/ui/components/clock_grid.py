@@ -0,0 +1,137 @@
+from PySide6.QtWidgets import QAbstractScrollArea, QFrame
+from PySide6.QtCore import Signal
+from typing import Dict, List
+from ...core.models import ClockUnit
+from ..clock_model import ClockListModel
+from .clock_card import ClockCard
+
+class ClockGrid(QAbstractScrollArea):
+    """Two-column grid of ClockCards that only builds the cards it shows.
+
+    Cards exist for the rows in the viewport plus OVERSCAN_ROWS above and
+    below; scrolling hands cards that leave that band to the clocks that
+    enter it (ClockCard.bind), so the number of live cards depends on the
+    window height, not the number of clocks. Off-screen clocks have no
+    card and therefore no per-tick UI work.
+
+    Clock changes arrive as the shared ClockListModel's batched dataChanged
+    and are passed to the cards in the changed rows.
+    """
+
+    delete_requested = Signal(object)  # Re-emits ClockCard.delete_requested
+
+    COLUMNS = 2
+    MARGIN = 20
+    SPACING = 20
+    OVERSCAN_ROWS = 1
+
+    def __init__(self, model: ClockListModel, parent=None):
+        super().__init__(parent)
+        self.model = model
+        self.setFrameShape(QFrame.NoFrame)
+        self.setStyleSheet("background: transparent;")
+        self.viewport().setStyleSheet("background: transparent;")
+        self.verticalScrollBar().setSingleStep(40)
+
+        # Cards in use, keyed by the clock they show, and cards kept for reuse
+        self._cards: Dict[ClockUnit, ClockCard] = {}
+        self._spare: List[ClockCard] = []
+        self._laying_out = False
+
+        model.dataChanged.connect(self._on_data_changed)
+        model.rowsInserted.connect(self.relayout)
+        model.rowsRemoved.connect(self.relayout)
+        model.modelReset.connect(self.relayout)
+        self.relayout()
+
+    @property
+    def clocks(self) -> List[ClockUnit]:
+        return self.model.clocks
+
+    def card_for(self, clock: ClockUnit):
+        """The card showing `clock`, or None while it is scrolled away."""
+        return self._cards.get(clock)
+
+    def ensure_visible(self, index: int):
+        height = ClockCard.CARD_HEIGHT
+        top = self.MARGIN + (index // self.COLUMNS) * (height + self.SPACING)
+        bar = self.verticalScrollBar()
+        if top < bar.value():
+            bar.setValue(top)
+        elif top + height > bar.value() + self.viewport().height():
+            bar.setValue(top + height - self.viewport().height())
+
+    def relayout(self):
+        """Update the scroll range and (re)place cards for the visible band."""
+        if self._laying_out:
+            # setRange() below can move the scroll bars and call back in
+            return
+        self._laying_out = True
+        try:
+            self._relayout()
+        finally:
+            self._laying_out = False
+
+    def _relayout(self):
+        width, height = ClockCard.CARD_WIDTH, ClockCard.CARD_HEIGHT
+        rows = -(-len(self.clocks) // self.COLUMNS)
+        content_w = 2 * self.MARGIN + self.COLUMNS * width + (self.COLUMNS - 1) * self.SPACING
+        content_h = 2 * self.MARGIN + rows * height + max(rows - 1, 0) * self.SPACING
+        viewport = self.viewport()
+        for bar, content, page in ((self.horizontalScrollBar(), content_w, viewport.width()),
+                                   (self.verticalScrollBar(), content_h, viewport.height())):
+            bar.setPageStep(page)
+            bar.setRange(0, max(0, content - page))
+
+        dx = self.horizontalScrollBar().value()
+        dy = self.verticalScrollBar().value()
+        pitch = height + self.SPACING
+        first_row = max(0, (dy - self.MARGIN) // pitch - self.OVERSCAN_ROWS)
+        last_row = min(rows - 1, (dy + viewport.height() - self.MARGIN) // pitch + self.OVERSCAN_ROWS)
+        shown = self.clocks[first_row * self.COLUMNS:(last_row + 1) * self.COLUMNS]
+
+        # Release cards whose clock scrolled away (or was removed/replaced)
+        wanted = set(shown)
+        for clock, card in list(self._cards.items()):
+            if clock not in wanted:
+                del self._cards[clock]
+                card.detach()
+                card.hide()
+                self._spare.append(card)
+
+        for offset, clock in enumerate(shown):
+            index = first_row * self.COLUMNS + offset
+            card = self._cards.get(clock)
+            if card is None:
+                card = self._acquire(clock)
+                self._cards[clock] = card
+            row, col = divmod(index, self.COLUMNS)
+            card.move(self.MARGIN + col * (width + self.SPACING) - dx,
+                      self.MARGIN + row * pitch - dy)
+            if card.isHidden():
+                card.show()
+
+    def _on_data_changed(self, top, bottom, roles=()):
+        # Walk the handful of cards, not the (possibly long) changed range
+        for card in self._cards.values():
+            if top.row() <= self.model.row_of(card.clock) <= bottom.row():
+                card.refresh(roles)
+
+    def _acquire(self, clock: ClockUnit) -> ClockCard:
+        if self._spare:
+            card = self._spare.pop()
+            card.bind(clock)
+            return card
+        card = ClockCard(clock, self.viewport())
+        card.delete_requested.connect(self.delete_requested)
+        return card
+
+    def live_cards(self) -> int:
+        return len(self._cards) + len(self._spare)
+
+    def scrollContentsBy(self, dx, dy):
+        self.relayout()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.relayout()
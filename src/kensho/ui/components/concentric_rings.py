@@ -1,32 +1,60 @@
 from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import Qt, QTimer, QRectF, Property, QPropertyAnimation, QEasingCurve
-from PySide6.QtGui import QPainter, QPen, QColor, QConicalGradient, QBrush
-from typing import List
+from PySide6.QtCore import Qt, QRect, QRectF
+from PySide6.QtGui import QPainter, QPen, QColor, QConicalGradient, QBrush, QPixmap, QRegion
+from typing import List, NamedTuple, Tuple
 from ...core.models import ClockUnit
+from ...core.metrics import collector as metrics
+from ...core.pulse import pulse_frames
+from ..clock_model import ClockListModel, STATE_ROLES, TICK_ROLES
+from ..scheduler import scheduler
 import math
 
+# Extra stroke width at the top of a breath (2 s per breath)
+PULSE_WIDTH = 3.0
+# Rectangles used to approximate each ring's annulus for partial repaints
+ANNULUS_SEGMENTS = 24
+
+class RingGeometry(NamedTuple):
+    radius: float
+    rect: QRectF
+    pen: QPen  # progress arc at rest
+    pulse_pens: Tuple[QPen, ...]  # progress arc per breathing frame
+    region: QRegion  # annulus the ring can touch, including a full breath
+
 class ConcentricRings(QWidget):
-    def __init__(self, clocks: List[ClockUnit], parent=None):
+    """Concentric progress rings, one per clock (outermost first).
+
+    Repaints are driven by the shared ClockListModel's per-frame dataChanged:
+    a tick repaints only when some ring's drawn arc grows by a device
+    pixel, and the breathing timer runs only while at least one clock is
+    running. With everything paused the widget
+    does no periodic work at all, and the same holds while the widget is
+    hidden, minimized or covered (see ui.scheduler); ticks missed meanwhile
+    are caught up in one step when it shows again.
+
+    Ring geometry and pens (one per breathing frame, from core.pulse) are
+    computed once per size, and the static background rings are cached in
+    a pixmap, so a frame is a table lookup, one blit and the progress arcs.
+
+    Invalidation is per ring: only the annuli of rings whose arc or pulse
+    changed are passed to update(), so repaint and compositing work scale
+    with what moved rather than with the widget size.
+    """
+
+    stroke_width = 8
+    gap = 5
+
+    def __init__(self, model: ClockListModel, parent=None):
         super().__init__(parent)
-        self.clocks = clocks
+        self.model = model
         self.setMinimumSize(50, 50)
         
-        # Pulse Property
-        self._pulse_factor = 0.0
-        
-        # Animation
-        self.anim = QPropertyAnimation(self, b"pulse_factor")
-        self.anim.setDuration(2000) # 2 seconds per breath
-        self.anim.setStartValue(0.0)
-        self.anim.setEndValue(1.0)
-        self.anim.setLoopCount(-1) # Infinite
-        self.anim.setEasingCurve(QEasingCurve.InOutSine)
-        self.anim.start()
-        
-        # Update Timer (for progress)
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update)
-        self.timer.start(16) # 60 FPS
+        # Breathing: step through precomputed frames (only while a clock runs)
+        self.pulse = pulse_frames(self.stroke_width, PULSE_WIDTH)
+        self._pulse_index = 0
+        self.pulse_job = scheduler().register(
+            self, self._next_pulse_frame, round(self.pulse.frame_interval * 1000), name="Rings.pulse")
+        self.progress_job = scheduler().register(self, self._refresh_spans)
         
         # Colors
         self.colors = [
@@ -39,86 +67,195 @@ class ConcentricRings(QWidget):
         ]
         self.bg_color = QColor("#2b2b2b")
 
-    def get_pulse_factor(self):
-        return self._pulse_factor
+        self._geometry: List[RingGeometry] = []
+        self._geometry_key = None
+        self._background = None
+
+        self._spans = []  # Drawn arc length per ring, in whole device pixels
+        self._running = []
+        self._on_rows_changed()
+        model.dataChanged.connect(self._on_data_changed)
+        model.rowsInserted.connect(self._on_rows_changed)
+        model.rowsRemoved.connect(self._on_rows_changed)
+        model.modelReset.connect(self._on_rows_changed)
 
-    def set_pulse_factor(self, value):
-        self._pulse_factor = value
+    @property
+    def clocks(self) -> List[ClockUnit]:
+        return self.model.clocks
+
+    def detach(self):
+        """Stop following the model (the widget-mode window is closing)."""
+        self.model.dataChanged.disconnect(self._on_data_changed)
+        self.model.rowsInserted.disconnect(self._on_rows_changed)
+        self.model.rowsRemoved.disconnect(self._on_rows_changed)
+        self.model.modelReset.disconnect(self._on_rows_changed)
+        self.pulse_job.set_enabled(False)
+
+    def _on_data_changed(self, top, bottom, roles=()):
+        if not roles or any(role in roles for role in STATE_ROLES):
+            self._on_running_changed()
+        if not roles or any(role in roles for role in TICK_ROLES):
+            self._on_progress()
+
+    def _on_rows_changed(self, *_):
+        self._spans = self._measure_spans()
+        self._running = [self._is_running(clock) for clock in self.clocks]
+        self._update_animation()
         self.update()
 
-    pulse_factor = Property(float, get_pulse_factor, set_pulse_factor)
+    def _next_pulse_frame(self):
+        self.set_pulse_frame((self._pulse_index + 1) % len(self.pulse))
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        width = self.width()
-        height = self.height()
-        center_x = width / 2
-        center_y = height / 2
-        
-        min_dim = min(width, height)
-        stroke_width = 8
-        gap = 5
-        max_radius = (min_dim - stroke_width) / 2
-        
-        for i, clock in enumerate(self.clocks):
-            radius = max_radius - (i * (stroke_width + gap))
-            if radius <= 0: break
-            
-            color = self.colors[i % len(self.colors)]
-            
-            # Draw Background Ring
+    def set_pulse_frame(self, index: int):
+        if index != self._pulse_index:
+            self._pulse_index = index
+            self._update_rings(i for i, clock in enumerate(self.clocks)
+                               if self._is_running(clock) and clock.progress > 0)
+
+    def _is_running(self, clock) -> bool:
+        return not clock._paused and not clock._due
+
+    def _rings(self) -> List[RingGeometry]:
+        """Per-ring geometry for the current size and clock count (cached)."""
+        key = (self.width(), self.height(), self.devicePixelRatioF(), len(self.clocks))
+        if key != self._geometry_key:
+            self._geometry_key = key
+            self._geometry = self._layout()
+            self._background = None
+        return self._geometry
+
+    def _layout(self) -> List[RingGeometry]:
+        center_x = self.width() / 2
+        center_y = self.height() / 2
+        max_radius = (min(self.width(), self.height()) - self.stroke_width) / 2
+        rings = []
+        for i in range(len(self.clocks)):
+            radius = max_radius - (i * (self.stroke_width + self.gap))
+            if radius <= 0:
+                break
+            rect = QRectF(center_x - radius, center_y - radius, radius * 2, radius * 2)
+            pen = QPen(self.colors[i % len(self.colors)])
+            pen.setWidth(self.stroke_width)
+            pen.setCapStyle(Qt.RoundCap)
+            pulse_pens = []
+            for width in self.pulse.widths:
+                pulse_pen = QPen(pen)
+                pulse_pen.setWidthF(width)
+                pulse_pens.append(pulse_pen)
+            rings.append(RingGeometry(radius, rect, pen, tuple(pulse_pens),
+                                      self._annulus(center_x, center_y, radius)))
+        return rings
+
+    def _annulus(self, center_x, center_y, radius) -> QRegion:
+        """Cover the ring with the bounding boxes of ANNULUS_SEGMENTS arcs.
+
+        A handful of rectangles keeps clipping cheap; an exact ellipse
+        region has a rectangle per scanline and costs more to clip against
+        than it saves.
+        """
+        # Half the widest stroke plus a pixel for antialiasing
+        reach = self.pulse.max_width / 2 + 1
+        outer = radius + reach
+        inner = max(radius - reach, 0.0)
+        region = QRegion()
+        step = 2 * math.pi / ANNULUS_SEGMENTS
+        for k in range(ANNULUS_SEGMENTS):
+            angles = [k * step, (k + 1) * step]
+            # Axis extremes inside the segment also bound it
+            angles += [q * math.pi / 2 for q in range(5) if angles[0] < q * math.pi / 2 < angles[1]]
+            xs, ys = [], []
+            for angle in angles:
+                for r in (inner, outer):
+                    xs.append(center_x + r * math.cos(angle))
+                    ys.append(center_y + r * math.sin(angle))
+            left, top = math.floor(min(xs)), math.floor(min(ys))
+            region += QRect(left, top, math.ceil(max(xs)) - left + 1, math.ceil(max(ys)) - top + 1)
+        return region
+
+    def _update_rings(self, indices):
+        """Schedule a repaint of just the given rings."""
+        rings = self._rings()
+        region = QRegion()
+        for i in indices:
+            if i < len(rings):
+                region += rings[i].region
+        if not region.isEmpty():
+            self.update(region)
+
+    def _background_pixmap(self) -> QPixmap:
+        """Background rings drawn once at device resolution."""
+        rings = self._rings()
+        if self._background is None:
+            dpr = self.devicePixelRatioF()
+            pixmap = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
             pen = QPen(self.bg_color)
-            pen.setWidth(stroke_width)
+            pen.setWidth(self.stroke_width)
             pen.setCapStyle(Qt.RoundCap)
             painter.setPen(pen)
-            painter.drawEllipse(
-                center_x - radius, 
-                center_y - radius, 
-                radius * 2, 
-                radius * 2
-            )
-            
-            # Draw Progress Arc
+            for ring in rings:
+                painter.drawEllipse(ring.rect)
+            painter.end()
+            self._background = pixmap
+        return self._background
+
+    def _measure_spans(self):
+        dpr = self.devicePixelRatioF()
+        return [int(2 * math.pi * ring.radius * clock.progress * dpr)
+                for clock, ring in zip(self.clocks, self._rings())]
+
+    def _on_progress(self, _progress=None):
+        self.progress_job.request()
+
+    def _refresh_spans(self):
+        spans = self._measure_spans()
+        if spans != self._spans:
+            changed = [i for i, span in enumerate(spans)
+                       if i >= len(self._spans) or span != self._spans[i]]
+            self._spans = spans
+            self._update_rings(changed)
+
+    def _on_running_changed(self, _paused=None):
+        running = [self._is_running(clock) for clock in self.clocks]
+        changed = [i for i, state in enumerate(running) if state != self._running[i]]
+        self._running = running
+        self._update_animation()
+        self._update_rings(changed)
+
+    def _update_animation(self):
+        running = any(self._is_running(clock) for clock in self.clocks)
+        if running != self.pulse_job.enabled:
+            self.pulse_job.set_enabled(running)
+            if not running:
+                self._pulse_index = 0
+
+    def resizeEvent(self, event):
+        self._spans = self._measure_spans()
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        with metrics.paint("Rings"):
+            self._paint(event)
+
+    def _paint(self, event):
+        rings = self._rings()
+        dirty = event.region()
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._background_pixmap())
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        frame = self._pulse_index
+        # Qt draws arcs in 1/16th of a degree
+        # 0 is 3 o'clock. We want 12 o'clock (90 deg)
+        start_angle = 90 * 16
+
+        for clock, ring in zip(self.clocks, rings):
             progress = clock.progress
-            if progress > 0:
-                pen.setColor(color)
-                
-                # Pulse Effect (Thicken line if active)
-                if not clock._paused and not clock._due:
-                    # Use animated property
-                    # Oscillate between 0 and 3px extra width
-                    # pulse_factor goes 0->1. We want 0->1->0? 
-                    # Or InOutSine handles the ease, but we need to map 0-1 to width.
-                    # Let's say we want it to breathe in and out.
-                    # If anim is 0->1, we can map it directly.
-                    # But for breathing we usually want 0->1->0.
-                    # Let's use sin of the factor? Or just configure animation to reverse?
-                    # For now, let's map 0..1 to a sine wave shape here or just use it directly.
-                    # If we use KeyValueAt in animation it's better.
-                    # But simple approach:
-                    pulse = self._pulse_factor * 3.0
-                    if self.anim.direction() == QPropertyAnimation.Forward:
-                         # We need it to go back down.
-                         # Actually, let's just use sin(factor * pi)
-                         pulse = math.sin(self._pulse_factor * math.pi) * 3.0
-                    
-                    pen.setWidthF(stroke_width + pulse)
-                else:
-                    pen.setWidth(stroke_width)
-
-                painter.setPen(pen)
-                
-                # Qt draws arcs in 1/16th of a degree
-                # 0 is 3 o'clock. We want 12 o'clock (90 deg)
-                start_angle = 90 * 16
-                span_angle = -360 * progress * 16
-                
-                rect = QRectF(
-                    center_x - radius, 
-                    center_y - radius, 
-                    radius * 2, 
-                    radius * 2
-                )
-                painter.drawArc(rect, start_angle, span_angle)
+            if progress <= 0 or not dirty.intersects(ring.region):
+                continue
+            # Pulse Effect (Thicken line while running)
+            painter.setPen(ring.pulse_pens[frame] if self._is_running(clock) else ring.pen)
+            painter.drawArc(ring.rect, start_angle, int(-360 * progress * 16))
@@ -3,6 +3,7 @@ import math
 import time
 from typing import List, Optional, Callable
 from ...models import ClockUnit
+from ...core.pulse import pulse_frames
 
 class ConcentricTimer(ctk.CTkCanvas):
     def __init__(
@@ -33,9 +34,14 @@ class ConcentricTimer(ctk.CTkCanvas):
         
         self._pulsing = False
         self._pulse_start_time = 0
+        # Extra stroke width (0 to 3) per breathing frame, one breath per pi seconds
+        self._pulse = pulse_frames(0, 3.0, period=math.pi)
         
         if self.on_click:
             self.bind("<Button-1>", lambda e: self.on_click())
+        # Animation stops while unmapped (hidden/minimized) and resumes on map
+        self._animating = False
+        self.bind("<Map>", lambda e: self._start_animation())
         
         self._draw()
         self._start_animation()
@@ -45,19 +51,24 @@ class ConcentricTimer(ctk.CTkCanvas):
         self._draw()
 
     def _start_animation(self):
-        self._animate()
+        if not self._animating:
+            self._animating = True
+            self._animate()
 
     def _animate(self):
-        # We need continuous animation for pulsing
+        # We need continuous animation for pulsing; redraw once per pulse frame
         self._draw()
-        self.after(50, self._animate)
+        if not self.winfo_viewable():
+            # Nothing on screen to update; <Map> restarts the loop
+            self._animating = False
+            return
+        self.after(round(self._pulse.frame_interval * 1000), self._animate)
 
     def _draw(self):
         self.delete("all")
         
-        # Pulse calculation
-        t = time.time() * 2
-        pulse_extra = (math.sin(t) + 1) * 1.5 # 0 to 3
+        # Pulse lookup
+        pulse_extra = self._pulse.width_at(time.time())
         
         for i, clock in enumerate(self.clocks):
             # Outer to Inner
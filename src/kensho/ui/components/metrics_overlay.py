@@ -0,0 +1,52 @@
+from PySide6.QtWidgets import QLabel
+from PySide6.QtCore import Qt
+from ...core.metrics import collector as metrics
+from ..scheduler import scheduler
+
+
+class MetricsOverlay(QLabel):
+    """Live paint and timer numbers in the corner of a window (``--metrics``).
+
+    One line per instrumented widget (fps, median/p95 paint ms, late
+    paints) and per periodic timer (p95 lateness, late ticks, dropped
+    frames), kept short enough for the widget-mode window. Refreshes
+    twice a second while its window is on screen.
+    """
+
+    REFRESH_MS = 500
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setTextFormat(Qt.PlainText)
+        self.setStyleSheet("""
+            QLabel {
+                background-color: rgba(0, 0, 0, 0.7);
+                color: #9fe870;
+                font-family: Consolas, monospace;
+                font-size: 10px;
+                padding: 4px;
+                border-radius: 4px;
+            }
+        """)
+        self.move(4, 4)
+        self.refresh_job = scheduler().register(self, self.refresh, self.REFRESH_MS,
+                                                name="MetricsOverlay.refresh")
+        self.refresh()
+
+    def refresh(self):
+        report = metrics.report()
+        lines = []
+        for name, stats in report["widgets"].items():
+            paint = stats["paint_ms"]
+            lines.append(f"{name} {stats['fps']:.0f}fps {paint['p50']:.1f}/{paint['p95']:.1f}ms"
+                         f" late {stats['late']}")
+        for name, stats in report["timers"].items():
+            if name == "MetricsOverlay.refresh":
+                continue
+            lateness = stats["lateness_ms"]
+            lines.append(f"{name} +{lateness['p95']:.1f}ms late {stats['late']}"
+                         f" drop {stats['dropped']}")
+        self.setText("\n".join(lines) or "no frames yet")
+        self.adjustSize()
+        self.raise_()
@@ -1,32 +1,24 @@
-from PySide6.QtWidgets import (QWidget, QVBoxLayout, QScrollArea, QGridLayout, 
-                               QPushButton, QFrame, QMessageBox)
-from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QMessageBox
+from PySide6.QtCore import Qt, Signal
 from ..core.models import ClockUnit
-from .components.clock_card import ClockCard
+from .clock_model import ClockListModel
+from .components.clock_grid import ClockGrid
 
 class DashboardView(QWidget):
-    def __init__(self, clocks=None, parent=None):
+    clock_added = Signal(object)    # Emits the new ClockUnit
+    clock_removed = Signal(object)  # Emits the deleted ClockUnit
+
+    def __init__(self, model: ClockListModel, parent=None):
         super().__init__(parent)
+        self.model = model
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         
-        # Scroll Area
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QFrame.NoFrame)
-        scroll.setStyleSheet("background: transparent;")
-        
-        # Container for Grid
-        self.container = QWidget()
-        self.container.setStyleSheet("background: transparent;")
-        self.grid_layout = QGridLayout(self.container)
-        self.grid_layout.setContentsMargins(20, 20, 20, 20)
-        self.grid_layout.setSpacing(20)
-        self.grid_layout.setAlignment(Qt.AlignTop | Qt.AlignLeft)
-        
-        scroll.setWidget(self.container)
-        layout.addWidget(scroll)
+        # Card grid (cards only for the clocks in view)
+        self.grid = ClockGrid(model)
+        self.grid.delete_requested.connect(self.remove_clock)
+        layout.addWidget(self.grid)
         
         # Add Button (Floating or Bottom?)
         # For now, let's put it at the bottom
@@ -49,34 +41,30 @@ class DashboardView(QWidget):
         """)
         self.btn_add.clicked.connect(self.add_clock)
         layout.addWidget(self.btn_add)
-        
-        # State
-        self.clocks = clocks if clocks is not None else []
-        
-        # Initial Render
-        self.refresh_grid()
 
-    def refresh_grid(self):
-        # Clear existing items
-        for i in reversed(range(self.grid_layout.count())): 
-            widget = self.grid_layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-        
-        # Rebuild Grid
-        for i, clock in enumerate(self.clocks):
-            card = ClockCard(clock)
-            card.delete_requested.connect(self.remove_clock)
-            
-            row = i // 2
-            col = i % 2
-            self.grid_layout.addWidget(card, row, col)
+
+    @property
+    def clocks(self):
+        return self.model.clocks
+
+    def set_clocks(self, clocks):
+        self.model.set_clocks(clocks)
+
+    def _next_index(self):
+        """First free "C<n>" from the clock count up (the count alone can
+        repeat a live identifier after a delete)."""
+        taken = {clock.identifier for clock in self.clocks}
+        n = len(self.clocks) + 1
+        while f"C{n}" in taken:
+            n += 1
+        return n
 
     def add_clock(self, checked=False):
-        idx = len(self.clocks) + 1
+        idx = self._next_index()
         new_clock = ClockUnit(f"C{idx}", f"Session {idx}", 25)
-        self.clocks.append(new_clock)
-        self.refresh_grid()
+        self.model.append_clock(new_clock)
+        self.grid.ensure_visible(len(self.clocks) - 1)
+        self.clock_added.emit(new_clock)
 
     def remove_clock(self, clock):
         reply = QMessageBox.question(
@@ -88,6 +76,5 @@ class DashboardView(QWidget):
         )
 
         if reply == QMessageBox.Yes:
-            if clock in self.clocks:
-                self.clocks.remove(clock)
-                self.refresh_grid()
+            if self.model.remove_clock(clock):
+                self.clock_removed.emit(clock)
@@ -1,17 +1,27 @@
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                                QPushButton, QLabel, QFrame, QStackedWidget)
-from PySide6.QtCore import Qt, QSize
+import time
+from PySide6.QtCore import Qt, QSize, Signal, QTimer
 from .dashboard import DashboardView
+from .clock_model import ClockListModel
+from ..core.metrics import collector as metrics
 from ..core.models import ClockUnit
 from ..core.state import AppState
-
-from .views.settings import SettingsView
-from .views.history import HistoryView
+from ..core.journal import ClockJournal
+from ..core.history import HistoryManager
+from ..core.loader import StateLoader
 from ..core.sound import SoundManager
 
+VIEW_DASHBOARD, VIEW_HISTORY, VIEW_SETTINGS = range(3)
+
 class MainWindow(QMainWindow):
+    first_frame = Signal(float)  # Seconds from construction to the first paint
+    state_loaded = Signal()
+
     def __init__(self):
         super().__init__()
+        self._created_at = time.perf_counter()
+        self._first_frame_seen = False
         self.setWindowTitle("Kenshō")
         self.resize(1000, 700) # Slightly smaller default
         
@@ -21,24 +31,20 @@ class MainWindow(QMainWindow):
         
         # State Management
         self.app_state = AppState()
+        self.journal = ClockJournal(self.app_state.backend)
+        self.history_manager = HistoryManager(self.app_state.backend)
         
-        # Load State
-        state_data = self.app_state.load_state()
-        
-        # Clocks
-        clock_data = state_data.get("clocks", [])
-        if clock_data:
-            self.clocks = [ClockUnit.from_dict(d) for d in clock_data]
-        else:
-            # Default Clocks
-            self.clocks = [
-                ClockUnit("c1", "Deep Work", 45),
-                ClockUnit("c2", "Rest", 15),
-                ClockUnit("c3", "Quick Focus", 25)
-            ]
-            
-        # Settings
-        self.sound_preference = state_data.get("sound", "System Exclamation")
+        # Clocks and settings arrive from the loader thread; the shell below
+        # is built (and painted) without waiting on disk.
+        self.clocks = []
+        # Every clock view (dashboard, widget mode) follows this one model
+        self.clock_model = ClockListModel(self)
+        self.sound_preference = "System Exclamation"
+        self._state_ready = False
+        self._pending_state = None
+        self.loader = StateLoader(self.app_state, self.journal, self.history_manager, self)
+        self.loader.loaded.connect(self._on_state_loaded)
+        self.loader.start()
 
         # Central Widget & Main Layout
         central_widget = QWidget()
@@ -93,15 +99,18 @@ class MainWindow(QMainWindow):
         self.content_area.setObjectName("ContentArea")
         
         # Views
-        self.dashboard_view = DashboardView(self.clocks)
-        
-        self.history_view = HistoryView()
+        self.dashboard_view = DashboardView(self.clock_model)
+        self.dashboard_view.clock_added.connect(self._on_clock_added)
+        self.dashboard_view.clock_removed.connect(self._on_clock_removed)
         
-        self.settings_view = SettingsView(self.sound_preference)
+        # History and Settings are built on first navigation; until then
+        # their stack slots hold empty placeholders.
+        self.history_view = None
+        self.settings_view = None
         
         self.content_area.addWidget(self.dashboard_view)
-        self.content_area.addWidget(self.history_view)
-        self.content_area.addWidget(self.settings_view)
+        self.content_area.addWidget(QWidget())
+        self.content_area.addWidget(QWidget())
         
         # Add to Main Layout
         main_layout.addWidget(self.sidebar)
@@ -127,17 +136,102 @@ class MainWindow(QMainWindow):
         sidebar_layout.addWidget(self.btn_kensho)
         
         # Connect Signals
-        self.nav_dashboard.clicked.connect(lambda: self.switch_view(0))
-        self.nav_history.clicked.connect(lambda: self.switch_view(1))
-        self.nav_settings.clicked.connect(lambda: self.switch_view(2))
+        self.nav_dashboard.clicked.connect(lambda: self.switch_view(VIEW_DASHBOARD))
+        self.nav_history.clicked.connect(lambda: self.switch_view(VIEW_HISTORY))
+        self.nav_settings.clicked.connect(lambda: self.switch_view(VIEW_SETTINGS))
         
         # Default View
         self.nav_dashboard.setChecked(True)
-        self.switch_view(0)
+        self.switch_view(VIEW_DASHBOARD)
         
         # Widget Mode Window
         self.widget_window = None
 
+        if metrics.enabled:
+            from .components.metrics_overlay import MetricsOverlay
+            self.metrics_overlay = MetricsOverlay(self)
+
+    def _ensure_view(self, index):
+        if index == VIEW_HISTORY and self.history_view is None:
+            from .views.history import HistoryView
+            self.history_view = HistoryView(self.history_manager)
+            self._replace_placeholder(index, self.history_view)
+        elif index == VIEW_SETTINGS and self.settings_view is None:
+            from .views.settings import SettingsView
+            self.settings_view = SettingsView(self.sound_preference, self.history_manager)
+            self.settings_view.sound_changed.connect(self._on_sound_changed)
+            self._replace_placeholder(index, self.settings_view)
+
+    def _replace_placeholder(self, index, view):
+        placeholder = self.content_area.widget(index)
+        self.content_area.insertWidget(index, view)
+        self.content_area.removeWidget(placeholder)
+        placeholder.deleteLater()
+
+    def current_sound(self):
+        if self.settings_view is not None:
+            return self.settings_view.current_sound
+        return self.sound_preference
+
+    def _on_state_loaded(self, state_data, sessions):
+        self._pending_state = (state_data, sessions)
+        if self._first_frame_seen or not self.isVisible():
+            self._attach_state()
+        # Otherwise paintEvent attaches it right after the first frame
+
+    def _attach_state(self):
+        if self._pending_state is None:
+            return
+        state_data, sessions = self._pending_state
+        self._pending_state = None
+
+        # Load State (latest snapshot + journal events logged after it)
+        clock_data = state_data.get("clocks", [])
+        if clock_data:
+            self.clocks = [ClockUnit.from_dict(d) for d in clock_data]
+        else:
+            # Default Clocks
+            self.clocks = [
+                ClockUnit("c1", "Deep Work", 45),
+                ClockUnit("c2", "Rest", 15),
+                ClockUnit("c3", "Quick Focus", 25)
+            ]
+            # Journal them like any added clock, so their events replay
+            # even if the app stops before the first snapshot
+            for clock in self.clocks:
+                self.journal.record(clock.identifier, "add", {"d": clock.to_dict()})
+
+        for clock in self.clocks:
+            clock.operation.connect(self.journal.record)
+        self.journal.on_snapshot_due = self.save_snapshot
+            
+        # Settings
+        self.sound_preference = state_data.get("sound", "System Exclamation")
+        if self.settings_view is not None:
+            self.settings_view.set_current_sound(self.sound_preference)
+
+        # Decode the chosen chime now so the first completion plays instantly
+        SoundManager.warm(self.sound_preference)
+
+        self.dashboard_view.set_clocks(self.clocks)
+        if self.history_view is not None:
+            self.history_view.show_sessions(sessions)
+        self._state_ready = True
+        
+        # Clocks that ran out while the app was closed finish once, now that
+        # the views are listening.
+        for clock in self.clocks:
+            clock.take_missed_completion()
+        self.state_loaded.emit()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._first_frame_seen:
+            self._first_frame_seen = True
+            self.first_frame.emit(time.perf_counter() - self._created_at)
+            if self._pending_state is not None:
+                QTimer.singleShot(0, self._attach_state)
+
     def _create_nav_button(self, text):
         btn = QPushButton(text)
         btn.setCheckable(True)
@@ -145,7 +239,32 @@ class MainWindow(QMainWindow):
         btn.setProperty("class", "NavButton") # For stylesheet
         return btn
 
+    def _on_clock_added(self, clock):
+        clock.operation.connect(self.journal.record)
+        self.journal.record(clock.identifier, "add", {"d": clock.to_dict()})
+
+    def _on_clock_removed(self, clock):
+        clock.operation.disconnect(self.journal.record)
+        self.journal.record(clock.identifier, "remove")
+
+    def _on_sound_changed(self, sound):
+        self.sound_preference = sound
+        SoundManager.warm(sound)
+        self.journal.record("", "sound", {"v": sound})
+
+    def save_snapshot(self):
+        """Write the full state and drop the journal events it covers."""
+        if not self._state_ready:
+            # Never overwrite saved state with the empty pre-load shell
+            return
+        clocks = self.dashboard_view.clocks
+        sound = self.current_sound()
+        seq = self.journal.seq
+        if self.app_state.save_state(clocks, sound, journal_seq=seq):
+            self.journal.compact(seq)
+
     def switch_view(self, index):
+        self._ensure_view(index)
         self.content_area.setCurrentIndex(index)
 
     def enter_widget_mode(self):
@@ -153,13 +272,14 @@ class MainWindow(QMainWindow):
         
         # Get clocks from dashboard
         clocks = self.dashboard_view.clocks
-        if not clocks: return
+        if not self._state_ready or not clocks: return
         
         # Update sound preference from settings view
-        self.sound_preference = self.settings_view.current_sound
+        self.sound_preference = self.current_sound()
         
         self.hide()
-        self.widget_window = WidgetMode(clocks, self.sound_preference)
+        self.widget_window = WidgetMode(self.clock_model, self.sound_preference, journal=self.journal,
+                                        history_manager=self.history_manager)
         self.widget_window.restore_requested.connect(self.exit_widget_mode)
         self.widget_window.show()
 
@@ -172,16 +292,8 @@ class MainWindow(QMainWindow):
         self.activateWindow()
 
     def closeEvent(self, event):
-        # Save state on exit
-        # Get latest clocks from dashboard
-        if hasattr(self, 'dashboard_view'):
-            self.clocks = self.dashboard_view.clocks
-            
-        # Get latest sound preference
-        if hasattr(self, 'settings_view'):
-            self.sound_preference = self.settings_view.current_sound
-            
-        self.app_state.save_state(self.clocks, self.sound_preference)
+        # Save a full snapshot on exit so the next start replays nothing
+        self.save_snapshot()
         
         # Close widget window if open
         if self.widget_window:
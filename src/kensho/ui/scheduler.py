@@ -0,0 +1,174 @@
+"""Visibility-aware scheduling for periodic UI work.
+
+Widgets register their periodic jobs (refresh timers, animations, per-tick
+label updates) here instead of running them unconditionally. A job only
+runs while its widget is visible and its window is neither minimized nor
+unexposed (fully covered, or on a locked screen where the platform reports
+it). While suspended nothing runs; on becoming visible again the job runs
+once to catch up, then resumes its normal cadence.
+
+Two kinds of job:
+
+* periodic (`interval_ms` given): the scheduler owns the QTimer.
+* on demand (`interval_ms=None`): the widget calls `request()` whenever
+  its data changes (e.g. on every clock tick); requests made while hidden
+  collapse into a single run on show.
+"""
+
+from typing import Callable, List, Optional, Set
+
+from PySide6.QtCore import QEvent, QObject, QTimer
+from PySide6.QtWidgets import QWidget
+
+from ..core.metrics import collector as metrics
+
+_WATCHED_EVENTS = (QEvent.Show, QEvent.Hide, QEvent.WindowStateChange, QEvent.Expose)
+
+
+class UiJob:
+    def __init__(self, scheduler: "VisibilityScheduler", widget: QWidget,
+                 callback: Callable[[], None], interval_ms: Optional[int] = None,
+                 name: Optional[str] = None):
+        self.scheduler = scheduler
+        self.widget = widget
+        self.callback = callback
+        self.interval_ms = interval_ms
+        # Key for timer lateness in core.metrics
+        self.name = name or f"{type(widget).__name__}.{getattr(callback, '__name__', 'job')}"
+        self._enabled = True
+        self._visible = False
+        self._stale = False
+        self._timer: Optional[QTimer] = None
+        if interval_ms is not None:
+            self._timer = QTimer(widget)
+            self._timer.setInterval(interval_ms)
+            self._timer.timeout.connect(self._on_timeout)
+
+    @property
+    def active(self) -> bool:
+        return self._enabled and self._visible
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def set_enabled(self, enabled: bool) -> None:
+        """Turn the job on or off independently of visibility (e.g. nothing running)."""
+        if enabled != self._enabled:
+            was_active = self.active
+            self._enabled = enabled
+            self._apply(was_active, catch_up=False)
+
+    def request(self) -> None:
+        """Run now if the widget can be seen, otherwise once when it can."""
+        if self.active:
+            self._stale = False
+            self.callback()
+        else:
+            self._stale = True
+
+    def _on_timeout(self) -> None:
+        metrics.timer_tick(self.name, self.interval_ms)
+        self.callback()
+
+    def _set_visible(self, visible: bool) -> None:
+        if visible != self._visible:
+            was_active = self.active
+            self._visible = visible
+            self._apply(was_active, catch_up=True)
+
+    def _apply(self, was_active: bool, catch_up: bool) -> None:
+        if self.active == was_active:
+            return
+        if not self.active:
+            if self._timer is not None:
+                self._timer.stop()
+            return
+        if self._timer is not None:
+            if catch_up:
+                self.callback()
+            metrics.timer_restarted(self.name)
+            self._timer.start()
+        elif self._stale:
+            self._stale = False
+            self.callback()
+
+    def cancel(self) -> None:
+        self.scheduler.unregister(self)
+
+
+class VisibilityScheduler(QObject):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._jobs: List[UiJob] = []
+        # Widgets and windows whose visibility events we filter
+        self._watched: Set[QObject] = set()
+        self._pending = False
+
+    def register(self, widget: QWidget, callback: Callable[[], None],
+                 interval_ms: Optional[int] = None, name: Optional[str] = None) -> UiJob:
+        job = UiJob(self, widget, callback, interval_ms, name)
+        self._jobs.append(job)
+        self._watch(widget)
+        widget.destroyed.connect(lambda *_: self._forget_widget(job))
+        job._set_visible(self.is_visible(widget))
+        return job
+
+    def unregister(self, job: UiJob) -> None:
+        if job in self._jobs:
+            job._set_visible(False)
+            self._jobs.remove(job)
+
+    def is_visible(self, widget: QWidget) -> bool:
+        if not widget.isVisible():
+            return False
+        window = widget.window()
+        if window.isMinimized():
+            return False
+        handle = window.windowHandle()
+        return handle is None or handle.isExposed()
+
+    def refresh(self) -> None:
+        """Re-check every job now (also called after visibility events)."""
+        self._pending = False
+        for job in list(self._jobs):
+            try:
+                visible = self.is_visible(job.widget)
+            except RuntimeError:
+                # Widget already deleted on the C++ side
+                self._jobs.remove(job)
+                continue
+            job._set_visible(visible)
+            self._watch(job.widget)
+
+    def eventFilter(self, obj, event):
+        if event.type() in _WATCHED_EVENTS and not self._pending:
+            # Coalesce bursts (a hide reaches every child) into one pass
+            self._pending = True
+            QTimer.singleShot(0, self.refresh)
+        return False
+
+    def _watch(self, widget: QWidget) -> None:
+        window = widget.window()
+        for obj in (widget, window, window.windowHandle()):
+            if obj is not None and obj not in self._watched:
+                self._watched.add(obj)
+                obj.installEventFilter(self)
+                obj.destroyed.connect(lambda *_, o=obj: self._watched.discard(o))
+
+    def _forget_widget(self, job: UiJob) -> None:
+        # Signals may still call request() on a job whose widget is gone
+        job._visible = False
+        if job in self._jobs:
+            self._jobs.remove(job)
+
+
+_scheduler: Optional[VisibilityScheduler] = None
+
+
+def scheduler() -> VisibilityScheduler:
+    """The application-wide scheduler."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = VisibilityScheduler()
+    return _scheduler
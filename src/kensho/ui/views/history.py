@@ -1,24 +1,129 @@
-from PySide6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QScrollArea, 
-                               QFrame, QHBoxLayout)
-from PySide6.QtCore import Qt, QTimer
-from datetime import datetime
-from ...core.history import HistoryManager
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QListView, QFrame,
+                               QStyledItemDelegate, QAbstractItemView)
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QRectF, QSize
+from PySide6.QtGui import QColor, QFont, QPainter
+from bisect import bisect_right
+from datetime import date, datetime
+from ...core.history import HistoryManager, SESSION_LOGGED, HISTORY_CLEARED
+from ..scheduler import scheduler
+
+SessionRole = Qt.UserRole + 1
+TimeTextRole = Qt.UserRole + 2
+DurationTextRole = Qt.UserRole + 3
+
+class SessionListModel(QAbstractListModel):
+    """Today's sessions, newest first.
+
+    Kept in step with HistoryManager through its listener: a logged session
+    is one rowsInserted, clearing is one reset. Rows are stored oldest
+    first so the usual case (a new session) is an append.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.day = None
+        self.total_minutes = 0.0
+        self._sessions = []
+        self._timestamps = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._sessions)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        session = self._sessions[len(self._sessions) - 1 - index.row()]
+        if role == Qt.DisplayRole:
+            return session.get("clock_name", "")
+        if role == TimeTextRole:
+            return datetime.fromisoformat(session["timestamp"]).strftime("%H:%M")
+        if role == DurationTextRole:
+            return f"{int(session.get('duration_minutes', 0))} min"
+        if role == SessionRole:
+            return session
+        return None
+
+    def set_sessions(self, sessions, day=None):
+        self.beginResetModel()
+        self.day = day or date.today().isoformat()
+        self._sessions = sorted(sessions, key=lambda s: s["timestamp"])
+        self._timestamps = [s["timestamp"] for s in self._sessions]
+        self.total_minutes = sum(s.get("duration_minutes", 0) for s in self._sessions)
+        self.endResetModel()
+
+    def add_session(self, session):
+        if session.get("date") != self.day:
+            return
+        position = bisect_right(self._timestamps, session["timestamp"])
+        row = len(self._sessions) - position
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._sessions.insert(position, session)
+        self._timestamps.insert(position, session["timestamp"])
+        self.total_minutes += session.get("duration_minutes", 0)
+        self.endInsertRows()
+
+    def on_history_event(self, event, record):
+        """HistoryManager listener."""
+        if event == SESSION_LOGGED:
+            self.add_session(record)
+        elif event == HISTORY_CLEARED:
+            self.set_sessions([], self.day)
+
+class SessionDelegate(QStyledItemDelegate):
+    """Paints a session row directly: time, clock name, duration."""
+
+    ROW_HEIGHT = 40
 
-class HistoryView(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.history_manager = HistoryManager()
-        
+        self.bg_color = QColor("#333")
+        self.time_color = QColor("#888")
+        self.name_color = QColor("#ddd")
+        self.duration_color = QColor("#8b5cf6")
+        self.name_font = QFont()
+        self.name_font.setBold(True)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        rect = option.rect
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self.bg_color)
+        painter.drawRoundedRect(QRectF(rect), 5, 5)
+
+        text_rect = rect.adjusted(20, 0, -20, 0)
+        painter.setFont(option.font)
+        painter.setPen(self.time_color)
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, index.data(TimeTextRole))
+        painter.setPen(self.duration_color)
+        painter.drawText(text_rect, Qt.AlignRight | Qt.AlignVCenter, index.data(DurationTextRole))
+
+        painter.setFont(self.name_font)
+        painter.setPen(self.name_color)
+        name_rect = text_rect.adjusted(60, 0, -80, 0)
+        name = painter.fontMetrics().elidedText(index.data(Qt.DisplayRole), Qt.ElideRight,
+                                                name_rect.width())
+        painter.drawText(name_rect, Qt.AlignLeft | Qt.AlignVCenter, name)
+        painter.restore()
+
+class HistoryView(QWidget):
+    def __init__(self, history_manager=None, parent=None):
+        super().__init__(parent)
+        self.history_manager = history_manager or HistoryManager()
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(40, 40, 40, 40)
         layout.setSpacing(20)
         layout.setAlignment(Qt.AlignTop)
-        
+
         # Header
         title = QLabel("History")
         title.setStyleSheet("font-size: 24px; font-weight: bold; color: white;")
         layout.addWidget(title)
-        
+
         # Stats Card
         self.stats_card = QFrame()
         self.stats_card.setStyleSheet("""
@@ -32,109 +137,68 @@ class HistoryView(QWidget):
             }
         """)
         stats_layout = QVBoxLayout(self.stats_card)
-        
+
         lbl_today = QLabel("Today's Focus")
         lbl_today.setStyleSheet("font-size: 14px; color: #888;")
         stats_layout.addWidget(lbl_today)
-        
+
         self.lbl_total_time = QLabel("0h 0m")
         self.lbl_total_time.setStyleSheet("font-size: 36px; font-weight: bold; color: #8b5cf6;")
         stats_layout.addWidget(self.lbl_total_time)
-        
+
         layout.addWidget(self.stats_card)
-        
+
         # Sessions List Header
         lbl_sessions = QLabel("Completed Sessions")
         lbl_sessions.setStyleSheet("font-size: 18px; font-weight: bold; color: #ddd; margin-top: 20px;")
         layout.addWidget(lbl_sessions)
-        
-        # Scroll Area for List
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QFrame.NoFrame)
-        scroll.setStyleSheet("background: transparent;")
-        
-        self.list_container = QWidget()
-        self.list_container.setStyleSheet("background: transparent;")
-        self.list_layout = QVBoxLayout(self.list_container)
-        self.list_layout.setContentsMargins(0, 0, 0, 0)
-        self.list_layout.setSpacing(10)
-        self.list_layout.setAlignment(Qt.AlignTop)
-        
-        scroll.setWidget(self.list_container)
-        layout.addWidget(scroll)
-        
-        # Auto-refresh when shown
-        self.refresh_timer = QTimer(self)
-        self.refresh_timer.timeout.connect(self.refresh_data)
-        self.refresh_timer.start(5000) # Refresh every 5s
-        
-        self.refresh_data()
-
-    def showEvent(self, event):
-        self.refresh_data()
-        super().showEvent(event)
+
+        # Session list: one model, rows painted by the delegate (no widget per row)
+        self.model = SessionListModel(self)
+        self.list_view = QListView()
+        self.list_view.setModel(self.model)
+        self.list_view.setItemDelegate(SessionDelegate(self.list_view))
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setSpacing(5)
+        self.list_view.setFrameShape(QFrame.NoFrame)
+        self.list_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.list_view.setFocusPolicy(Qt.NoFocus)
+        self.list_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.list_view.setStyleSheet("background: transparent;")
+        layout.addWidget(self.list_view, 1)
+
+        self.lbl_empty = QLabel("No sessions yet today.")
+        self.lbl_empty.setStyleSheet("color: #666; font-style: italic;")
+        layout.addWidget(self.lbl_empty)
+
+        self.model.modelReset.connect(self._update_summary)
+        self.model.rowsInserted.connect(self._update_summary)
+        listener, manager = self.model.on_history_event, self.history_manager
+        manager.add_listener(listener)
+        self.destroyed.connect(lambda *_: manager.remove_listener(listener))
+        self._update_summary()
+
+        # New sessions arrive through the model; this only reloads after
+        # midnight (checked every minute on screen, and when shown again)
+        self.day_job = scheduler().register(self, self._check_day, 60000,
+                                            name="History.day")
+
+    def _check_day(self):
+        if self.model.day != date.today().isoformat():
+            self.refresh_data()
 
     def refresh_data(self):
-        # Update Total Time
-        total_minutes = self.history_manager.get_total_time_today()
+        self.show_sessions(self.history_manager.get_today_sessions())
+
+    def show_sessions(self, sessions):
+        """Show today's sessions (already loaded, e.g. by the startup loader)."""
+        self.model.set_sessions(sessions)
+
+    def _update_summary(self, *_):
+        total_minutes = self.model.total_minutes
         h = int(total_minutes // 60)
         m = int(total_minutes % 60)
         self.lbl_total_time.setText(f"{h}h {m}m")
-        
-        # Update List
-        # Clear existing
-        while self.list_layout.count():
-            child = self.list_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-                
-        sessions = self.history_manager.get_today_sessions()
-        # Sort by timestamp desc
-        sessions.sort(key=lambda x: x['timestamp'], reverse=True)
-        
-        if not sessions:
-            lbl_empty = QLabel("No sessions yet today.")
-            lbl_empty.setStyleSheet("color: #666; font-style: italic;")
-            self.list_layout.addWidget(lbl_empty)
-        else:
-            for s in sessions:
-                self._add_session_row(s)
-
-    def _add_session_row(self, session):
-        row = QFrame()
-        row.setStyleSheet("""
-            QFrame {
-                background-color: #333;
-                border-radius: 5px;
-                padding: 10px;
-            }
-            QLabel {
-                color: #ddd;
-                background: transparent;
-            }
-        """)
-        row_layout = QHBoxLayout(row)
-        row_layout.setContentsMargins(10, 5, 10, 5)
-        
-        # Time
-        ts = datetime.fromisoformat(session['timestamp'])
-        time_str = ts.strftime("%H:%M")
-        lbl_time = QLabel(time_str)
-        lbl_time.setFixedWidth(60)
-        lbl_time.setStyleSheet("color: #888;")
-        row_layout.addWidget(lbl_time)
-        
-        # Name
-        lbl_name = QLabel(session['clock_name'])
-        lbl_name.setStyleSheet("font-weight: bold;")
-        row_layout.addWidget(lbl_name)
-        
-        # Duration
-        dur = int(session['duration_minutes'])
-        lbl_dur = QLabel(f"{dur} min")
-        lbl_dur.setAlignment(Qt.AlignRight)
-        lbl_dur.setStyleSheet("color: #8b5cf6;")
-        row_layout.addWidget(lbl_dur)
-        
-        self.list_layout.addWidget(row)
+        empty = self.model.rowCount() == 0
+        self.lbl_empty.setVisible(empty)
+        self.list_view.setVisible(not empty)
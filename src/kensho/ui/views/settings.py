@@ -1,12 +1,18 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QComboBox, 
                                QPushButton, QFrame, QHBoxLayout)
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Signal
 from ...core.sound import SoundManager
 
 class SettingsView(QWidget):
-    def __init__(self, current_sound="System Exclamation", parent=None):
+    sound_changed = Signal(str)
+
+    def __init__(self, current_sound="System Exclamation", history_manager=None, parent=None):
         super().__init__(parent)
-        self.current_sound = current_sound
+        self.current_sound = SoundManager.canonical_name(current_sound)
+        if history_manager is None:
+            from ...core.history import HistoryManager
+            history_manager = HistoryManager()
+        self.history_manager = history_manager
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(40, 40, 40, 40)
@@ -114,15 +120,24 @@ class SettingsView(QWidget):
         layout.addWidget(data_frame)
         layout.addStretch()
 
+    def set_current_sound(self, sound):
+        """Apply a loaded preference without reporting it as a user change."""
+        sound = SoundManager.canonical_name(sound)
+        self.current_sound = sound
+        self.combo_sound.blockSignals(True)
+        self.combo_sound.setCurrentText(sound)
+        self.combo_sound.blockSignals(False)
+
     def _on_sound_changed(self, text):
         self.current_sound = text
+        self.sound_changed.emit(text)
 
     def _test_sound(self):
-        SoundManager.play_sound(self.current_sound)
+        # Rapid clicks restart the preview rather than stacking copies
+        SoundManager.play_sound(self.current_sound, retrigger=True)
 
     def _clear_history(self):
         from PySide6.QtWidgets import QMessageBox
-        from ...core.history import HistoryManager
         
         reply = QMessageBox.question(
             self, 
@@ -133,5 +148,5 @@ class SettingsView(QWidget):
         )
         
         if reply == QMessageBox.Yes:
-            HistoryManager().clear_history()
+            self.history_manager.clear_history()
             QMessageBox.information(self, "Success", "History has been cleared.")
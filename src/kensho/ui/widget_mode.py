@@ -1,84 +1,179 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QLabel, QLineEdit
-from PySide6.QtCore import Qt, Signal, QPoint, QTimer
+from PySide6.QtCore import Qt, Signal, QPoint, QTimer, QEvent
 from PySide6.QtGui import QColor
 from typing import List
-from ..core.models import ClockUnit
+from ..core.metrics import collector as metrics
+from .clock_model import ClockListModel
 from .components.concentric_rings import ConcentricRings
 
+_NOTIFICATION_STYLE = """
+    QWidget {{
+        background-color: rgba(20, 20, 20, 0.95);
+        border: 1px solid {color};
+        border-radius: 8px;
+    }}
+    QLabel {{
+        color: {color};
+        font-size: 14px;
+        font-weight: bold;
+        border: none;
+        background: transparent;
+    }}
+    QPushButton {{
+        background-color: {color};
+        color: black;
+        border: none;
+        border-radius: 4px;
+        padding: 4px 12px;
+        font-weight: bold;
+        font-size: 16px;
+    }}
+    QPushButton:hover {{
+        background-color: white;
+    }}
+"""
+
 class NotificationWindow(QWidget):
-    def __init__(self, message: str, color: QColor, parent_pos: QPoint, parent_width: int, on_restart):
+    """Reusable completion popup; `present()` fills it, hiding returns it to the pool."""
+    dismissed = Signal()
+
+    def __init__(self, dismiss_ms: int = 0):
         super().__init__()
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
         self.setAttribute(Qt.WA_TranslucentBackground)
-        
+        self._on_restart = None
+        self._color = None
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
-        
+
         # Container for styling
-        container = QWidget()
-        container.setStyleSheet(f"""
-            QWidget {{
-                background-color: rgba(20, 20, 20, 0.95);
-                border: 1px solid {color.name()};
-                border-radius: 8px;
-            }}
-            QLabel {{
-                color: {color.name()};
-                font-size: 14px;
-                font-weight: bold;
-                border: none;
-                background: transparent;
-            }}
-            QPushButton {{
-                background-color: {color.name()};
-                color: black;
-                border: none;
-                border-radius: 4px;
-                padding: 4px 12px;
-                font-weight: bold;
-                font-size: 16px;
-            }}
-            QPushButton:hover {{
-                background-color: white;
-            }}
-        """)
-        container_layout = QVBoxLayout(container)
+        self.container = QWidget()
+        container_layout = QVBoxLayout(self.container)
         container_layout.setContentsMargins(15, 15, 15, 15)
         container_layout.setSpacing(10)
-        
+
         # Message
-        self.label = QLabel(message)
+        self.label = QLabel()
         self.label.setWordWrap(True)
         container_layout.addWidget(self.label)
-        
+
         # Restart Button (Symbol)
         self.btn_restart = QPushButton("↻")
         self.btn_restart.setCursor(Qt.PointingHandCursor)
         self.btn_restart.setToolTip("Restart Timer")
-        
-        # Callback wrapper
-        def handle_click():
-            on_restart()
-            self.close()
-            
-        self.btn_restart.clicked.connect(handle_click)
+        self.btn_restart.clicked.connect(self._handle_restart)
         container_layout.addWidget(self.btn_restart, 0, Qt.AlignRight)
-        
-        layout.addWidget(container)
-        
-        # Position: Top-Right relative to parent widget
-        self.move(parent_pos.x() + parent_width + 15, parent_pos.y())
+
+        layout.addWidget(self.container)
+
+        self._dismiss_timer = QTimer(self)
+        self._dismiss_timer.setSingleShot(True)
+        self._dismiss_timer.setInterval(dismiss_ms)
+        self._dismiss_timer.timeout.connect(self.close)
+
+    def present(self, message: str, color: QColor, on_restart):
+        self.label.setText(message)
+        if color.name() != self._color:
+            # Restyling re-polishes every child; skip it when the color is unchanged
+            self._color = color.name()
+            self.container.setStyleSheet(_NOTIFICATION_STYLE.format(color=self._color))
+        self._on_restart = on_restart
+        if self._dismiss_timer.interval() > 0:
+            self._dismiss_timer.start()
+
+    def _handle_restart(self):
+        on_restart = self._on_restart
+        self.close()
+        if on_restart is not None:
+            on_restart()
+
+    def hideEvent(self, event):
+        self._dismiss_timer.stop()
+        # Drop the callback so a pooled window holds no clocks alive
+        self._on_restart = None
+        super().hideEvent(event)
+        self.dismissed.emit()
+
+class NotificationManager:
+    """Small pool of notification windows stacked beside the widget.
+
+    At most `max_windows` are visible; when all are in use the oldest one is
+    reused for the newest message. Hidden windows go back to the pool, so a
+    long session keeps a constant number of windows alive.
+    """
+    SPACING = 10
+
+    def __init__(self, anchor: QWidget, max_windows: int = 3, dismiss_ms: int = 60000):
+        self.anchor = anchor
+        self.max_windows = max_windows
+        self.dismiss_ms = dismiss_ms
+        self._live: List[NotificationWindow] = []
+        self._idle: List[NotificationWindow] = []
+
+    @property
+    def live_count(self) -> int:
+        return len(self._live)
+
+    @property
+    def window_count(self) -> int:
+        return len(self._live) + len(self._idle)
+
+    def show(self, message: str, color: QColor, on_restart) -> NotificationWindow:
+        if self._idle:
+            window = self._idle.pop()
+        elif len(self._live) < self.max_windows:
+            window = NotificationWindow(self.dismiss_ms)
+            window.dismissed.connect(lambda w=window: self._on_dismissed(w))
+        else:
+            window = self._live.pop(0)
+        window.present(message, color, on_restart)
+        self._live.append(window)
+        self._restack()
+        window.show()
+        return window
+
+    def close_all(self):
+        for window in list(self._live):
+            window.close()
+
+    def clear(self):
+        """Close and destroy every window (when the widget goes away)."""
+        self.close_all()
+        for window in self._idle:
+            window.dismissed.disconnect()
+            window.deleteLater()
+        self._idle.clear()
+
+    def _on_dismissed(self, window):
+        if window in self._live:
+            self._live.remove(window)
+            self._idle.append(window)
+            self._restack()
+
+    def _restack(self):
+        # Newest on top, right of the widget
+        x = self.anchor.x() + self.anchor.width() + 15
+        y = self.anchor.y()
+        for window in reversed(self._live):
+            window.adjustSize()
+            window.move(x, y)
+            y += window.height() + self.SPACING
 
 from ..core.sound import SoundManager
 from ..core.history import HistoryManager
+from ..core.dispatcher import NotificationDispatcher
 
 class WidgetMode(QWidget):
     restore_requested = Signal()
     
-    def __init__(self, clocks: List[ClockUnit], sound_preference: str = "System Exclamation"):
+    def __init__(self, model: ClockListModel, sound_preference: str = "System Exclamation",
+                 journal=None, history_manager=None):
         super().__init__()
+        self.model = model
         self.sound_preference = sound_preference
-        self.history_manager = HistoryManager()
+        self.journal = journal
+        self.history_manager = history_manager or HistoryManager()
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.resize(220, 220)
@@ -91,7 +186,7 @@ class WidgetMode(QWidget):
         self.layout.setContentsMargins(10, 10, 10, 10)
         
         # Concentric Rings
-        self.rings = ConcentricRings(clocks)
+        self.rings = ConcentricRings(model)
         self.layout.addWidget(self.rings)
         
         # Resize Controls (Top Right)
@@ -129,46 +224,85 @@ class WidgetMode(QWidget):
         """)
         self.btn_minus.clicked.connect(lambda: self.scale_window(-20))
         
-        # Connect Clocks
-        for i, clock in enumerate(clocks):
-            # Use closure to capture index/clock
-            clock.finished.connect(lambda c=clock, idx=i: self.show_notification(c, idx))
+        # Completions come through the shared model (disconnected on close)
+        model.clock_finished.connect(self.show_notification)
         
         # Initial position update
         self.update_button_positions()
         
         # Drag Logic
         self._drag_pos = QPoint()
-        self._active_notifications = []
+        self.notifications = NotificationManager(self)
+
+        # Completions close together share one sound and one window
+        self.dispatcher = NotificationDispatcher()
+        self._dispatch_timer = QTimer(self)
+        self._dispatch_timer.setSingleShot(True)
+        self._dispatch_timer.timeout.connect(self._flush_notifications)
+
+        if metrics.enabled:
+            from .components.metrics_overlay import MetricsOverlay
+            self.metrics_overlay = MetricsOverlay(self)
+
+    def event(self, event):
+        # One UpdateRequest repaints the whole window: time it as a frame
+        if event.type() == QEvent.UpdateRequest:
+            with metrics.paint("Widget"):
+                return super().event(event)
+        return super().event(event)
 
     def show_notification(self, clock, index):
-        # Play Sound
-        SoundManager.play_sound(self.sound_preference)
-        
-        # Log History
-        self.history_manager.log_session(clock.label, clock._interval_minutes)
-        
+        # Log History (with exact pause time when the journal tracked the run)
+        paused_minutes = None
+        if self.journal is not None:
+            paused_minutes = self.journal.paused_seconds(clock.identifier) / 60
+        self.history_manager.log_session(clock.label, clock._interval_minutes, paused_minutes)
+
+        self.dispatcher.submit(clock.identifier, clock.label, clock.completion_message,
+                               payload=(clock, index))
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        deadline = self.dispatcher.next_deadline()
+        if deadline is None:
+            return
+        delay = max(0.0, deadline - self.dispatcher.clock())
+        self._dispatch_timer.start(int(delay * 1000) + 1)
+
+    def _flush_notifications(self):
+        batch = self.dispatcher.flush()
+        if batch is not None:
+            self._show_batch(batch)
+        self._schedule_flush()
+
+    def _show_batch(self, batch):
+        first_clock, first_index = batch.completions[0].payload
+
+        # Play Sound (synthesized sounds are pitched per clock)
+        SoundManager.play_sound(self.sound_preference, pitch=SoundManager.clock_pitch(first_index))
+
         # Get color from rings component
         colors = self.rings.colors
-        color = colors[index % len(colors)]
-        
-        # Define restart callback
-        def restart_clock():
-            clock.reset()
-            clock.start()
-
-        # Spawn detached window
-        notif = NotificationWindow(
-            clock.completion_message, 
-            color, 
-            self.pos(), 
-            self.width(),
-            restart_clock
-        )
-        notif.show()
-        
-        # Keep reference to prevent GC
-        self._active_notifications.append(notif)
+        color = colors[first_index % len(colors)]
+
+        # Restart every clock the notification covers
+        clocks = [completion.payload[0] for completion in batch.completions]
+
+        def restart_clocks():
+            for clock in clocks:
+                clock.reset()
+                clock.start()
+
+        self.notifications.show(batch.message, color, restart_clocks)
+
+    def closeEvent(self, event):
+        if self.model is not None:
+            self.model.clock_finished.disconnect(self.show_notification)
+            self.rings.detach()
+            self.model = None
+        self._dispatch_timer.stop()
+        self.notifications.clear()
+        super().closeEvent(event)
 
     def resizeEvent(self, event):
         self.update_button_positions()
@@ -0,0 +1,34 @@
+import unittest
+from src.kensho.core.anchors import anchor_for, restore_elapsed
+from src.kensho.core.journal import apply_event
+
+class TestAnchors(unittest.TestCase):
+    def test_anchor_for(self):
+        self.assertEqual(anchor_for(30.0, now=1000.0), 970.0)
+
+    def test_restore_still_running(self):
+        elapsed, completed = restore_elapsed(970.0, 30.0, 600, now=1100.0)
+        self.assertEqual(elapsed, 130.0)
+        self.assertFalse(completed)
+
+    def test_restore_completed_while_closed(self):
+        # Closed for a week: still a single completion, clamped to the interval
+        elapsed, completed = restore_elapsed(970.0, 30.0, 600, now=1000.0 + 7 * 86400)
+        self.assertEqual(elapsed, 600.0)
+        self.assertTrue(completed)
+
+    def test_restore_wall_clock_went_backwards(self):
+        elapsed, completed = restore_elapsed(970.0, 30.0, 600, now=900.0)
+        self.assertEqual(elapsed, 30.0)
+        self.assertFalse(completed)
+
+    def test_journal_start_sets_anchor(self):
+        state = {"clocks": [{"identifier": "c1", "interval_minutes": 10,
+                             "elapsed_seconds": 0.0, "paused": True}]}
+        apply_event(state, {"c": "c1", "op": "start", "e": 20.0, "t": 1000.0})
+        self.assertEqual(state["clocks"][0]["started_at"], 980.0)
+        apply_event(state, {"c": "c1", "op": "pause", "e": 50.0, "t": 1030.0})
+        self.assertIsNone(state["clocks"][0]["started_at"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from src.kensho.core.catalog import SoundCatalog, display_name, lookup_key
+
+SOUNDS_DIR = Path(__file__).resolve().parent.parent / "src" / "kensho" / "resources" / "sounds"
+
+class TestDisplayName(unittest.TestCase):
+    def test_instrument_notes(self):
+        self.assertEqual(display_name("piano_c4"), "Piano - C4")
+        self.assertEqual(display_name("guitar_e3"), "Guitar - E3")
+
+    def test_plain_names(self):
+        self.assertEqual(display_name("soft_chime"), "Soft Chime")
+        self.assertEqual(display_name("zen_bell"), "Zen Bell")
+
+    def test_lookup_key_ignores_spelling(self):
+        self.assertEqual(lookup_key("Soft - CHIME"), lookup_key("soft_chime"))
+        self.assertEqual(lookup_key("Piano - C4"), lookup_key("piano_c4"))
+
+class TestSoundCatalog(unittest.TestCase):
+    def setUp(self):
+        self.catalog = SoundCatalog(SOUNDS_DIR)
+
+    def test_bundled_sounds(self):
+        names = self.catalog.names()
+        self.assertIn("Piano - C4", names)
+        self.assertIn("Soft Chime", names)
+
+    def test_lookup_by_any_spelling(self):
+        for name in ("Soft Chime", "soft_chime", "Soft - CHIME"):
+            info = self.catalog.get(name)
+            self.assertIsNotNone(info, name)
+            self.assertEqual(info.path.name, "soft_chime.wav")
+
+    def test_reads_format_from_header(self):
+        info = self.catalog.get("Piano - C4")
+        self.assertEqual(info.sample_rate, 44100)
+        self.assertEqual(info.channels, 1)
+        self.assertEqual(info.sample_width, 2)
+        self.assertAlmostEqual(info.duration, 2.0, places=2)
+        self.assertIs(self.catalog.for_path(info.path), info)
+
+    def test_unknown_sound(self):
+        self.assertIsNone(self.catalog.get("System Exclamation"))
+        self.assertIsNone(self.catalog.get(""))
+
+    def test_picks_up_added_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            shutil.copy(SOUNDS_DIR / "zen_bell.wav", tmp)
+            catalog = SoundCatalog(Path(tmp), check_interval=0)
+            self.assertEqual(catalog.names(), ["Zen Bell"])
+
+            shutil.copy(SOUNDS_DIR / "koto_g4.wav", tmp)
+            catalog.invalidate()
+            self.assertEqual(catalog.names(), ["Koto - G4", "Zen Bell"])
+
+    def test_uses_manifest_of_processed_set(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            shutil.copy(SOUNDS_DIR / "zen_bell.wav", tmp)
+            shutil.copy(SOUNDS_DIR / "koto_g4.wav", tmp)
+            manifest = {"version": 1, "sounds": {
+                "zen_bell": {"file": "zen_bell.wav", "duration": 1.5, "sample_rate": 22050,
+                             "channels": 1, "sample_width": 2},
+            }}
+            (Path(tmp) / "manifest.json").write_text(json.dumps(manifest))
+            catalog = SoundCatalog(Path(tmp))
+            bell = catalog.get("Zen Bell")
+            self.assertEqual((bell.duration, bell.sample_rate), (1.5, 22050))
+            # Files missing from the manifest still come from their header
+            self.assertEqual(catalog.get("Koto - G4").sample_rate, 44100)
+
+if __name__ == '__main__':
+    unittest.main()
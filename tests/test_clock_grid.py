@@ -0,0 +1,70 @@
+import os
+import unittest
+
+try:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+    from src.kensho.core.models import ClockUnit
+    from src.kensho.ui.clock_model import ClockListModel
+    from src.kensho.ui.components.clock_grid import ClockGrid
+except ImportError:
+    QApplication = None
+
+@unittest.skipIf(QApplication is None, "PySide6 not installed")
+class TestClockGrid(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication([])
+        self.model = ClockListModel()
+        self.grid = ClockGrid(self.model)
+        self.grid.resize(700, 500)
+        self.grid.show()
+
+    def tearDown(self):
+        self.grid.close()
+        self.grid.deleteLater()
+
+    def test_duplicate_identifiers_each_get_a_card(self):
+        clocks = [ClockUnit("C2", "a", 25), ClockUnit("C2", "b", 25), ClockUnit("C3", "c", 25)]
+        self.model.set_clocks(clocks)
+        cards = [self.grid.card_for(clock) for clock in clocks]
+        self.assertNotIn(None, cards)
+        self.assertEqual(len({id(card) for card in cards}), 3)
+        self.assertEqual([card.clock for card in cards], clocks)
+
+    def test_scrolling_keeps_cards_bounded(self):
+        clocks = [ClockUnit(f"C{n}", f"Clock {n}", n + 1) for n in range(200)]
+        self.model.set_clocks(clocks)
+        first = self.grid.live_cards()
+        self.assertLess(first, 20)
+
+        bar = self.grid.verticalScrollBar()
+        for value in range(0, bar.maximum() + 1, 90):
+            bar.setValue(value)
+            self.assertLessEqual(self.grid.live_cards(), first + 2 * ClockGrid.COLUMNS)
+        bar.setValue(bar.maximum())
+        self.assertIsNone(self.grid.card_for(clocks[0]))
+        self.assertIsNotNone(self.grid.card_for(clocks[-1]))
+
+    def test_recycled_card_shows_its_new_clock(self):
+        clocks = [ClockUnit(f"C{n}", f"Clock {n}", n + 1) for n in range(40)]
+        self.model.set_clocks(clocks)
+        card = self.grid.card_for(clocks[0])
+        clocks[-1].start()
+        self.addCleanup(clocks[-1].pause)
+
+        bar = self.grid.verticalScrollBar()
+        bar.setValue(bar.maximum())
+        rebound = [c for c in clocks if self.grid.card_for(c) is card]
+        self.assertEqual(len(rebound), 1)
+        clock = rebound[0]
+        self.assertIsNot(clock, clocks[0])
+        self.assertEqual(card.title_label.text(), clock.label)
+        self.assertEqual(card.time_label.text(), clock.time_text)
+        self.assertEqual(card.btn_toggle.text(), "Start" if clock._paused else "Pause")
+
+        running = self.grid.card_for(clocks[-1])
+        self.assertEqual(running.btn_toggle.text(), "Pause")
+        self.assertTrue(running.property("running"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import os
+import unittest
+
+try:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtCore import Qt
+    from PySide6.QtWidgets import QApplication
+    from src.kensho.core.models import ClockUnit
+    from src.kensho.ui.clock_model import ClockListModel, STATE_ROLES, TICK_ROLES
+except ImportError:
+    QApplication = None
+
+@unittest.skipIf(QApplication is None, "PySide6 not installed")
+class TestClockListModel(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication([])
+        self.model = ClockListModel()
+        self.changes = []
+        self.model.dataChanged.connect(
+            lambda top, bottom, roles: self.changes.append((top.row(), bottom.row(), list(roles))))
+
+    def make_clocks(self, *specs):
+        return [ClockUnit(identifier, label, 25) for identifier, label in specs]
+
+    def test_duplicate_identifiers_keep_their_own_rows(self):
+        clocks = self.make_clocks(("C2", "a"), ("C2", "b"), ("C3", "c"))
+        self.model.set_clocks(clocks)
+        self.assertEqual([self.model.row_of(c) for c in clocks], [0, 1, 2])
+
+        finished = []
+        self.model.clock_finished.connect(lambda clock, row: finished.append((clock.label, row)))
+        clocks[1].finished.emit()
+        clocks[0].finished.emit()
+        self.assertEqual(finished, [("b", 1), ("a", 0)])
+
+        self.assertTrue(self.model.remove_clock(clocks[0]))
+        self.assertEqual(self.model.row_of(clocks[1]), 0)
+        self.assertEqual(self.model.row_of(clocks[0]), -1)
+
+    def load(self, count):
+        clocks = self.make_clocks(*((f"C{n}", f"Clock {n}") for n in range(count)))
+        self.model.set_clocks(clocks)
+        return clocks
+
+    def test_adjacent_rows_merge_into_one_change(self):
+        clocks = self.load(5)
+        for row in (3, 0, 1):
+            clocks[row].ticked.emit(0.5)
+        clocks[1].ticked.emit(0.6)
+        self.model.flush()
+        ticks = sorted(TICK_ROLES)
+        self.assertEqual(self.changes, [(0, 1, ticks), (3, 3, ticks)])
+
+        self.model.flush()  # nothing pending
+        self.assertEqual(len(self.changes), 2)
+
+    def test_only_changed_roles_are_reported(self):
+        clocks = self.load(3)
+        clocks[2].label = "Reading"
+        self.model.flush()
+        self.assertEqual(self.changes, [(2, 2, [Qt.DisplayRole])])
+
+        clocks[0].paused_changed.emit(True)
+        self.model.flush()
+        self.assertEqual(self.changes[-1], (0, 0, sorted(STATE_ROLES)))
+
+    def test_remove_shifts_pending_rows(self):
+        clocks = self.load(5)
+        for row in (1, 2, 3):
+            clocks[row].ticked.emit(0.5)
+        self.model.remove_clock(clocks[2])
+        self.model.flush()
+        # Old rows 1 and 3 are now adjacent; the removed row is dropped
+        self.assertEqual(self.changes, [(1, 2, sorted(TICK_ROLES))])
+
+    def test_set_clocks_disconnects_old_clocks(self):
+        old = self.load(2)
+        old[0].label = "Pending"
+        self.assertEqual(old[0].receivers("2ticked(double)"), 1)
+
+        new = self.make_clocks(("N1", "New"))
+        self.model.set_clocks(new)
+        for clock in old:
+            self.assertEqual(clock.receivers("2ticked(double)"), 0)
+            self.assertEqual(clock.receivers("2finished()"), 0)
+        old[1].ticked.emit(0.5)
+        self.model.flush()
+        self.assertEqual(self.changes, [])
+
+        # Roles marked before the reset don't leak into the next change
+        new[0].ticked.emit(0.5)
+        self.model.flush()
+        self.assertEqual(self.changes, [(0, 0, sorted(TICK_ROLES))])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+from src.kensho.core.dispatcher import NotificationDispatcher, TokenBucket
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_rate(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=0.5, capacity=2, clock=clock)
+        self.assertTrue(bucket.take())
+        self.assertTrue(bucket.take())
+        self.assertFalse(bucket.take())
+        self.assertAlmostEqual(bucket.wait_time(), 2.0)
+        clock.advance(2.0)
+        self.assertTrue(bucket.take())
+
+class TestNotificationDispatcher(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.dispatcher = NotificationDispatcher(window=0.5, rate=0.1, burst=2, dedup_seconds=5,
+                                                 max_pending=3, clock=self.clock)
+
+    def test_single_completion(self):
+        self.dispatcher.submit("C1", "Focus", "Time to stretch")
+        self.assertIsNone(self.dispatcher.flush())
+        self.assertEqual(self.dispatcher.next_deadline(), 100.5)
+        self.clock.advance(0.5)
+        batch = self.dispatcher.flush()
+        self.assertEqual(batch.count, 1)
+        self.assertEqual(batch.title, "Focus is ready")
+        self.assertEqual(batch.message, "Time to stretch")
+        self.assertIsNone(self.dispatcher.next_deadline())
+
+    def test_completions_within_window_batch(self):
+        for key in ("C1", "C2", "C3"):
+            self.dispatcher.submit(key, key)
+            self.clock.advance(0.1)
+        self.clock.advance(0.3)
+        batch = self.dispatcher.flush()
+        self.assertEqual(batch.count, 3)
+        self.assertEqual(batch.message, "3 clocks ready: C1, C2, C3")
+
+    def test_dedup_per_clock(self):
+        self.assertTrue(self.dispatcher.submit("C1", "Focus"))
+        self.assertFalse(self.dispatcher.submit("C1", "Focus"))
+        self.clock.advance(1)
+        self.dispatcher.flush()
+        self.assertFalse(self.dispatcher.submit("C1", "Focus"))
+        self.clock.advance(5)
+        self.assertTrue(self.dispatcher.submit("C1", "Focus"))
+
+    def test_rate_limit_merges_into_pending_batch(self):
+        delivered = []
+        for key in ("C1", "C2", "C3", "C4"):
+            self.dispatcher.submit(key, key)
+            self.clock.advance(1)
+            batch = self.dispatcher.flush()
+            if batch:
+                delivered.append(batch.count)
+        # Burst of two spent; the rest wait for a token as one batch
+        self.assertEqual(delivered, [1, 1])
+        self.assertEqual(self.dispatcher.pending, 2)
+        self.assertGreater(self.dispatcher.next_deadline(), self.clock.now + 1)
+        self.clock.now = self.dispatcher.next_deadline()
+        self.assertEqual(self.dispatcher.flush().count, 2)
+
+    def test_pending_batch_is_bounded(self):
+        for i in range(50):
+            self.dispatcher.submit(f"C{i}", f"Clock {i}")
+        self.clock.advance(1)
+        batch = self.dispatcher.flush()
+        self.assertEqual(len(batch.completions), 3)
+        self.assertEqual(batch.count, 50)
+        self.assertTrue(batch.message.endswith("and 47 more"))
+
+if __name__ == "__main__":
+    unittest.main()
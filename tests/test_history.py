@@ -0,0 +1,67 @@
+import unittest
+from datetime import date
+from src.kensho.core.history import HistoryManager, SESSION_LOGGED, HISTORY_CLEARED
+from src.kensho.storage import MemoryBackend
+
+class TestHistoryManager(unittest.TestCase):
+    def setUp(self):
+        self.backend = MemoryBackend()
+        self.history = HistoryManager(self.backend)
+
+    def test_log_session(self):
+        self.history.log_session("Deep Work", 45)
+        self.history.log_session("Rest", 15)
+
+        sessions = self.history.get_today_sessions()
+        self.assertEqual([s["clock_name"] for s in sessions], ["Deep Work", "Rest"])
+        self.assertEqual(self.history.get_total_time_today(), 60)
+
+    def test_ignores_other_days(self):
+        self.backend.save("history", [
+            {"timestamp": "2000-01-01T10:00:00", "date": "2000-01-01",
+             "clock_name": "Old", "duration_minutes": 25}
+        ])
+        self.assertEqual(self.history.get_today_sessions(), [])
+
+    def test_clear_history(self):
+        self.history.log_session("Deep Work", 45)
+        self.history.clear_history()
+        self.assertEqual(self.history.get_today_sessions(), [])
+
+    def test_listeners_see_logged_and_cleared(self):
+        events = []
+        listener = lambda event, record: events.append((event, record and record["clock_name"]))
+        self.history.add_listener(listener)
+        self.history.log_session("Deep Work", 45)
+        self.history.clear_history()
+        self.history.remove_listener(listener)
+        self.history.log_session("Rest", 15)
+        self.assertEqual(events, [(SESSION_LOGGED, "Deep Work"), (HISTORY_CLEARED, None)])
+
+    def test_sessions_are_appended_not_rewritten(self):
+        saves = []
+        self.backend.save = lambda key, value: saves.append(key)
+        self.history.log_session("Deep Work", 45)
+        self.history.log_session("Rest", 15)
+        self.assertEqual(saves, [])
+        self.assertEqual([r["clock_name"] for r in self.backend.read_log("history")],
+                         ["Deep Work", "Rest"])
+
+        reloaded = HistoryManager(self.backend).get_today_sessions()
+        self.assertEqual([s["clock_name"] for s in reloaded], ["Deep Work", "Rest"])
+
+    def test_reads_legacy_document_before_log(self):
+        today = date.today().isoformat()
+        self.backend.save("history", [
+            {"timestamp": f"{today}T08:00:00", "date": today,
+             "clock_name": "Old", "duration_minutes": 25}
+        ])
+        self.history.log_session("New", 15)
+        names = [s["clock_name"] for s in HistoryManager(self.backend).get_today_sessions()]
+        self.assertEqual(names, ["Old", "New"])
+
+        self.history.clear_history()
+        self.assertEqual(HistoryManager(self.backend).get_today_sessions(), [])
+
+if __name__ == '__main__':
+    unittest.main()
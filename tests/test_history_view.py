@@ -0,0 +1,64 @@
+import os
+import unittest
+
+try:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtCore import Qt
+    from PySide6.QtWidgets import QApplication
+    from src.kensho.core.history import SESSION_LOGGED, HISTORY_CLEARED
+    from src.kensho.ui.views.history import SessionListModel, SessionRole
+except ImportError:
+    QApplication = None
+
+DAY = "2026-03-14"
+
+def session(name, time, day=DAY, minutes=25):
+    return {"timestamp": f"{day}T{time}", "date": day, "clock_name": name,
+            "duration_minutes": minutes}
+
+@unittest.skipIf(QApplication is None, "PySide6 not installed")
+class TestSessionListModel(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication([])
+        self.model = SessionListModel()
+        self.model.set_sessions([session("b", "10:00:00"), session("a", "09:00:00")], DAY)
+        self.inserted = []
+        self.model.rowsInserted.connect(lambda parent, first, last: self.inserted.append(first))
+
+    def names(self):
+        return [self.model.index(row).data(Qt.DisplayRole)
+                for row in range(self.model.rowCount())]
+
+    def test_newest_first(self):
+        self.assertEqual(self.names(), ["b", "a"])
+        self.assertEqual(self.model.index(0).data(SessionRole)["clock_name"], "b")
+        self.assertEqual(self.model.total_minutes, 50)
+
+    def test_new_session_is_inserted_at_top(self):
+        self.model.add_session(session("c", "11:00:00"))
+        self.assertEqual(self.inserted, [0])
+        self.assertEqual(self.names(), ["c", "b", "a"])
+
+    def test_out_of_order_session_lands_by_time(self):
+        self.model.add_session(session("early", "08:00:00"))
+        self.model.add_session(session("middle", "09:30:00"))
+        self.assertEqual(self.inserted, [2, 1])
+        self.assertEqual(self.names(), ["b", "middle", "a", "early"])
+        self.assertEqual(self.model.total_minutes, 100)
+
+    def test_other_days_are_ignored(self):
+        self.model.on_history_event(SESSION_LOGGED, session("old", "12:00:00", day="2026-03-13"))
+        self.assertEqual(self.inserted, [])
+        self.assertEqual(self.model.rowCount(), 2)
+
+    def test_cleared_resets(self):
+        resets = []
+        self.model.modelReset.connect(lambda: resets.append(True))
+        self.model.on_history_event(HISTORY_CLEARED, None)
+        self.assertEqual(resets, [True])
+        self.assertEqual(self.model.rowCount(), 0)
+        self.assertEqual(self.model.total_minutes, 0)
+        self.assertEqual(self.model.day, DAY)
+
+if __name__ == '__main__':
+    unittest.main()
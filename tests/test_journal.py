@@ -0,0 +1,171 @@
+import os
+import sqlite3
+import unittest
+from src.kensho.core.journal import ClockJournal, apply_event, JOURNAL_KEY
+from src.kensho.storage import MemoryBackend
+
+try:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+    from src.kensho.core.models import ClockUnit
+except ImportError:
+    QApplication = None
+
+class LockedBackend(MemoryBackend):
+    def append(self, key, record):
+        raise sqlite3.OperationalError("database is locked")
+
+def make_state():
+    return {
+        "clocks": [{"identifier": "c1", "label": "Deep Work", "interval_minutes": 45,
+                    "elapsed_seconds": 0.0, "paused": True, "due": False}],
+        "sound": "Piano - C4",
+    }
+
+class TestApplyEvent(unittest.TestCase):
+    def test_start_pause(self):
+        state = make_state()
+        apply_event(state, {"c": "c1", "op": "start", "e": 0.0})
+        self.assertFalse(state["clocks"][0]["paused"])
+        apply_event(state, {"c": "c1", "op": "pause", "e": 12.5})
+        self.assertTrue(state["clocks"][0]["paused"])
+        self.assertEqual(state["clocks"][0]["elapsed_seconds"], 12.5)
+
+    def test_edits(self):
+        state = make_state()
+        apply_event(state, {"c": "c1", "op": "label", "v": "Reading"})
+        apply_event(state, {"c": "c1", "op": "interval", "v": 30.0})
+        apply_event(state, {"c": "", "op": "sound", "v": "Zen - BELL"})
+        self.assertEqual(state["clocks"][0]["label"], "Reading")
+        self.assertEqual(state["clocks"][0]["interval_minutes"], 30.0)
+        self.assertEqual(state["sound"], "Zen - BELL")
+
+    def test_add_remove(self):
+        state = make_state()
+        apply_event(state, {"c": "c2", "op": "add", "d": {"label": "Rest", "interval_minutes": 15}})
+        self.assertEqual([c["identifier"] for c in state["clocks"]], ["c1", "c2"])
+        apply_event(state, {"c": "c1", "op": "remove"})
+        self.assertEqual([c["identifier"] for c in state["clocks"]], ["c2"])
+
+    def test_unknown_clock_is_ignored(self):
+        state = make_state()
+        apply_event(state, {"c": "missing", "op": "start", "e": 1.0})
+        self.assertEqual(state, make_state())
+
+class TestClockJournal(unittest.TestCase):
+    def setUp(self):
+        self.backend = MemoryBackend()
+        self.journal = ClockJournal(self.backend)
+
+    def test_record_appends_compact_event(self):
+        event = self.journal.record("c1", "start", {"e": 0.0})
+        self.assertEqual(event["s"], 1)
+        self.assertIn("t", event)
+        self.assertIn("m", event)
+        self.assertEqual(self.backend.read_log(JOURNAL_KEY), [event])
+
+    def test_replay_after_snapshot(self):
+        self.journal.record("c1", "start", {"e": 0.0})
+        snapshot = make_state()
+        snapshot["journal_seq"] = 1
+        self.journal.record("c1", "pause", {"e": 30.0})
+
+        restored = ClockJournal(self.backend).replay(snapshot)
+        clock = restored["clocks"][0]
+        self.assertTrue(clock["paused"])
+        self.assertEqual(clock["elapsed_seconds"], 30.0)
+        self.assertEqual(restored["journal_seq"], 2)
+
+    def test_compact_clears_log(self):
+        self.journal.record("c1", "start", {"e": 0.0})
+        self.journal.compact(self.journal.seq)
+        self.assertEqual(self.backend.read_log(JOURNAL_KEY), [])
+        # Sequence numbers keep growing after compaction
+        self.assertEqual(self.journal.record("c1", "pause", {"e": 1.0})["s"], 2)
+
+    def test_compact_keeps_newer_events(self):
+        self.journal.record("c1", "start", {"e": 0.0})
+        self.journal.compact(0)
+        self.assertEqual(len(self.backend.read_log(JOURNAL_KEY)), 1)
+
+    def test_snapshot_due_callback(self):
+        calls = []
+        journal = ClockJournal(self.backend, snapshot_every=3)
+        journal.on_snapshot_due = lambda: calls.append(journal.seq)
+        for _ in range(3):
+            journal.record("c1", "label", {"v": "x"})
+        self.assertEqual(calls, [3])
+
+    def test_failed_snapshot_does_not_fire_on_every_event(self):
+        calls = []
+        journal = ClockJournal(self.backend, snapshot_every=3)
+        # A snapshot that never gets saved, so compact() is never called
+        journal.on_snapshot_due = lambda: calls.append(journal.seq)
+        for _ in range(7):
+            journal.record("c1", "label", {"v": "x"})
+        self.assertEqual(calls, [3, 6])
+
+    def test_pause_segments(self):
+        self.backend.append(JOURNAL_KEY, {"s": 1, "t": 100.0, "c": "c1", "op": "start", "e": 0.0})
+        self.backend.append(JOURNAL_KEY, {"s": 2, "t": 110.0, "c": "c1", "op": "pause", "e": 10.0})
+        self.backend.append(JOURNAL_KEY, {"s": 3, "t": 140.0, "c": "c1", "op": "start", "e": 10.0})
+        self.backend.append(JOURNAL_KEY, {"s": 4, "t": 150.0, "c": "c1", "op": "pause", "e": 20.0})
+        self.journal.replay(make_state())
+
+        self.assertEqual(self.journal.pause_segments("c1"), [(110.0, 140.0), (150.0, None)])
+        self.assertEqual(self.journal.paused_seconds("c1", now=160.0), 40.0)
+
+        self.journal.record("c1", "reset")
+        self.assertEqual(self.journal.pause_segments("c1"), [])
+
+    def test_write_error_is_not_raised(self):
+        journal = ClockJournal(LockedBackend())
+        event = journal.record("c1", "start", {"e": 0.0})
+        self.assertEqual(event["s"], 1)
+        self.assertEqual(journal.seq, 1)
+
+@unittest.skipIf(QApplication is None, "PySide6 not installed")
+class TestClockUnitEvents(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication([])
+        self.clock = ClockUnit("c1", "Deep Work", 45)
+        self.ops = []
+        self.clock.operation.connect(lambda _id, op, fields: self.ops.append(op))
+        self.clock.start()
+        self.ops.clear()
+
+    def tearDown(self):
+        self.clock.deleteLater()
+
+    def test_reset_running_clock_is_one_event(self):
+        self.clock.reset()
+        self.assertEqual(self.ops, ["reset"])
+        self.assertTrue(self.clock._paused)
+
+    def test_interval_change_is_one_event(self):
+        self.clock.update_interval(30)
+        self.assertEqual(self.ops, ["interval"])
+        self.assertEqual(self.clock.time_text, "30:00")
+
+    def test_default_clocks_replay_onto_empty_state(self):
+        # What MainWindow does on a fresh install: journal the defaults as
+        # added, then record their operations; no snapshot is ever saved
+        backend = MemoryBackend()
+        journal = ClockJournal(backend)
+        defaults = [ClockUnit("c1", "Deep Work", 45), ClockUnit("c2", "Rest", 15)]
+        for clock in defaults:
+            journal.record(clock.identifier, "add", {"d": clock.to_dict()})
+            clock.operation.connect(journal.record)
+        defaults[1].label = "Long Rest"
+        defaults[0].start()
+        defaults[0].pause()
+
+        state = ClockJournal(backend).replay({"clocks": [], "sound": "System Exclamation"})
+        restored = {d["identifier"]: d for d in state["clocks"]}
+        self.assertEqual(sorted(restored), ["c1", "c2"])
+        self.assertEqual(restored["c2"]["label"], "Long Rest")
+        self.assertTrue(restored["c1"]["paused"])
+        self.assertEqual(state["journal_seq"], 5)
+
+if __name__ == '__main__':
+    unittest.main()
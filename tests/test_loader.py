@@ -0,0 +1,64 @@
+import os
+import sqlite3
+import unittest
+from src.kensho.core.history import HistoryManager
+from src.kensho.core.journal import ClockJournal, JOURNAL_KEY
+from src.kensho.core.state import AppState
+from src.kensho.storage import MemoryBackend
+
+try:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+    from src.kensho.core.loader import StateLoader
+except ImportError:
+    QApplication = None
+
+class FailingBackend(MemoryBackend):
+    """Raises on the reads the loader does, like a locked or corrupt store."""
+
+    def __init__(self, fail_log=True, fail_load=False):
+        super().__init__()
+        self.fail_log = fail_log
+        self.fail_load = fail_load
+
+    def load(self, key, default=None):
+        if self.fail_load:
+            raise sqlite3.DatabaseError("file is not a database")
+        return super().load(key, default)
+
+    def read_log(self, key):
+        if self.fail_log and key == JOURNAL_KEY:
+            raise ValueError("unsupported journal record")
+        return super().read_log(key)
+
+@unittest.skipIf(QApplication is None, "PySide6 not installed")
+class TestStateLoader(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication([])
+
+    def run_loader(self, backend):
+        loader = StateLoader(AppState(backend), ClockJournal(backend), HistoryManager(backend))
+        results = []
+        loader.loaded.connect(lambda state, sessions: results.append((state, sessions)))
+        loader._run()
+        return results
+
+    def test_loads_state_and_sessions(self):
+        backend = MemoryBackend()
+        HistoryManager(backend).log_session("Deep Work", 45)
+        [(state, sessions)] = self.run_loader(backend)
+        self.assertIn("clocks", state)
+        self.assertEqual([s["clock_name"] for s in sessions], ["Deep Work"])
+
+    def test_journal_failure_still_emits(self):
+        backend = FailingBackend(fail_log=True)
+        HistoryManager(backend).log_session("Deep Work", 45)
+        [(state, sessions)] = self.run_loader(backend)
+        self.assertEqual(state, {})
+        self.assertEqual(len(sessions), 1)
+
+    def test_unreadable_store_emits_empty(self):
+        self.assertEqual(self.run_loader(FailingBackend(fail_load=True)), [({}, [])])
+
+if __name__ == '__main__':
+    unittest.main()
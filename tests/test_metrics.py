@@ -0,0 +1,98 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from src.kensho.core.metrics import Histogram, MetricsCollector
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+class TestHistogram(unittest.TestCase):
+    def test_buckets_and_summary(self):
+        hist = Histogram(bounds=(1, 2, 4))
+        for value in (0.5, 1.5, 1.5, 3, 10):
+            hist.record(value)
+        self.assertEqual(hist.counts, [1, 2, 1, 1])
+        self.assertEqual(hist.count, 5)
+        self.assertEqual(hist.max, 10)
+        self.assertAlmostEqual(hist.mean, 16.5 / 5)
+
+    def test_percentile_stays_in_bucket(self):
+        hist = Histogram(bounds=(1, 2, 4, 8))
+        for _ in range(90):
+            hist.record(1.5)
+        for _ in range(10):
+            hist.record(6)
+        self.assertTrue(1 <= hist.percentile(50) <= 2)
+        self.assertTrue(4 <= hist.percentile(99) <= 6)
+        self.assertEqual(Histogram().percentile(95), 0.0)
+
+class TestMetricsCollector(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.metrics = MetricsCollector(clock=self.clock)
+
+    def test_disabled_records_nothing(self):
+        with self.metrics.paint("Rings"):
+            self.clock.now += 0.01
+        self.metrics.timer_tick("Rings.pulse", 80)
+        self.assertEqual(self.metrics.paints, {})
+        self.assertEqual(self.metrics.timers, {})
+
+    def test_paint_duration_fps_and_late(self):
+        self.metrics.enable()
+        for duration in (0.002, 0.002, 0.030):
+            with self.metrics.paint("Rings"):
+                self.clock.now += duration
+            self.clock.now += 0.1
+
+        stats = self.metrics.report()["widgets"]["Rings"]
+        self.assertEqual(stats["paints"], 3)
+        self.assertEqual(stats["late"], 1)
+        self.assertEqual(stats["fps"], 3)
+        self.assertAlmostEqual(stats["paint_ms"]["max"], 30, places=3)
+
+        # Paints older than a second drop out of the fps window
+        self.clock.now += 2
+        self.assertEqual(self.metrics.report()["widgets"]["Rings"]["fps"], 0)
+
+    def test_timer_lateness_and_dropped_frames(self):
+        self.metrics.enable()
+        self.metrics.timer_tick("Rings.pulse", 80)  # first tick has nothing to compare
+        self.clock.now += 0.081
+        self.metrics.timer_tick("Rings.pulse", 80)
+        self.clock.now += 0.250  # 170 ms late: two whole intervals missed
+        self.metrics.timer_tick("Rings.pulse", 80)
+
+        stats = self.metrics.report()["timers"]["Rings.pulse"]
+        self.assertEqual(stats["ticks"], 3)
+        self.assertEqual(stats["lateness_ms"]["count"], 2)
+        self.assertEqual(stats["late"], 1)
+        self.assertEqual(stats["dropped"], 2)
+
+    def test_restart_ignores_the_stopped_gap(self):
+        self.metrics.enable()
+        self.metrics.timer_tick("History.refresh", 5000)
+        self.clock.now += 60
+        self.metrics.timer_restarted("History.refresh")
+        self.metrics.timer_tick("History.refresh", 5000)
+        stats = self.metrics.report()["timers"]["History.refresh"]
+        self.assertEqual(stats["lateness_ms"]["count"], 0)
+        self.assertEqual(stats["dropped"], 0)
+
+    def test_dump_writes_report(self):
+        self.metrics.enable()
+        with self.metrics.paint("Card"):
+            self.clock.now += 0.001
+        with tempfile.TemporaryDirectory() as tmp:
+            path = self.metrics.dump(Path(tmp) / "out" / "metrics.json")
+            report = json.loads(path.read_text())
+        self.assertEqual(report["widgets"]["Card"]["paints"], 1)
+        self.assertIn("frame_budget_ms", report)
+
+if __name__ == '__main__':
+    unittest.main()
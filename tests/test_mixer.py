@@ -0,0 +1,134 @@
+import tempfile
+import threading
+import unittest
+import wave
+from pathlib import Path
+from src.kensho.core.mixer import Mixer, decode_wav, np
+
+def write_wav(path, samples, rate=44100, channels=1):
+    data = (np.asarray(samples) * 32767).astype("<i2").tobytes()
+    with wave.open(str(path), "wb") as handle:
+        handle.setnchannels(channels)
+        handle.setsampwidth(2)
+        handle.setframerate(rate)
+        handle.writeframes(data)
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestMixer(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_decode_downmixes_and_resamples(self):
+        path = self.dir / "stereo.wav"
+        stereo = np.column_stack([np.full(22050, 0.5), np.full(22050, -0.5)]).ravel()
+        write_wav(path, stereo, rate=22050, channels=2)
+        samples = decode_wav(path)
+        self.assertEqual(samples.dtype, np.float32)
+        self.assertEqual(len(samples), 44100)
+        self.assertTrue(np.allclose(samples, 0.0, atol=1e-3))
+
+    def test_unsupported_file_raises_value_error(self):
+        path = self.dir / "float.wav"
+        path.write_bytes(b"RIFF\x00\x00\x00\x00WAVEfmt ")
+        with self.assertRaises(ValueError):
+            decode_wav(path)
+
+    def test_single_voice_renders_buffer_unchanged(self):
+        mixer = Mixer()
+        tone = np.linspace(-0.5, 0.5, 1000, dtype=np.float32)
+        mixer.add_buffer("tone", tone)
+        mixer.play("tone")
+        out = mixer.render_offline(1200, block=256)
+        self.assertTrue(np.allclose(out[:1000], tone))
+        self.assertTrue(np.all(out[1000:] == 0))
+        self.assertEqual(mixer.active_voices, 0)
+
+    def test_overlapping_voices_use_normalized_gain(self):
+        mixer = Mixer()
+        mixer.add_buffer("a", np.full(100, 0.4, dtype=np.float32))
+        mixer.add_buffer("b", np.full(100, 0.2, dtype=np.float32))
+        mixer.play("a")
+        mixer.play("b")
+        out = mixer.render(100)
+        self.assertTrue(np.allclose(out, 0.6 / np.sqrt(2)))
+
+    def test_voice_gain_and_clipping(self):
+        mixer = Mixer()
+        mixer.add_buffer("loud", np.full(100, 0.9, dtype=np.float32))
+        mixer.play("loud", gain=0.5)
+        self.assertTrue(np.allclose(mixer.render(100), 0.45))
+        mixer.play("loud", gain=3.0)
+        self.assertEqual(float(mixer.render(100).max()), 1.0)
+
+    def test_oldest_voice_is_stolen_when_full(self):
+        mixer = Mixer(max_voices=2)
+        for key in ("a", "b", "c"):
+            mixer.add_buffer(key, np.ones(10, dtype=np.float32))
+            mixer.play(key)
+        self.assertEqual(mixer.active_voices, 2)
+        self.assertEqual([v.buffer is mixer._buffers["a"] for v in mixer._voices], [False, False])
+
+    def test_retrigger_replaces_playing_copy(self):
+        mixer = Mixer()
+        mixer.add_buffer("a", np.ones(100, dtype=np.float32))
+        mixer.play("a")
+        mixer.render(50)
+        mixer.play("a", retrigger=True)
+        self.assertEqual(mixer.active_voices, 1)
+        self.assertEqual(mixer._voices[0].position, 0)
+
+    def test_load_decodes_once_and_int16_output(self):
+        path = self.dir / "chime.wav"
+        write_wav(path, np.full(441, 0.25))
+        mixer = Mixer()
+        first = mixer.load("chime", path)
+        self.assertIs(mixer.load("chime", path), first)
+        mixer.play("chime")
+        pcm = np.frombuffer(mixer.render_int16(441), dtype="<i2")
+        self.assertTrue(np.all(np.abs(pcm - 8191) <= 2))
+        self.assertEqual(len(mixer.latencies_ms), 1)
+
+    def test_concurrent_loads_decode_once(self):
+        mixer = Mixer()
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def render():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return np.ones(10, dtype=np.float32)
+
+        workers = [threading.Thread(target=mixer.load, args=("tone", render)) for _ in range(2)]
+        workers[0].start()
+        self.assertTrue(started.wait(5))
+        workers[1].start()
+        # Rendering the mixer is not held up by the load in progress
+        self.assertEqual(len(mixer.render(16)), 16)
+        release.set()
+        for worker in workers:
+            worker.join(5)
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(mixer.has("tone"))
+
+    def test_undecodable_source_is_tried_once(self):
+        mixer = Mixer()
+        calls = []
+
+        def broken():
+            calls.append(1)
+            raise ValueError("unsupported")
+
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                mixer.load("bad", broken)
+        self.assertEqual(len(calls), 1)
+        self.assertFalse(mixer.has("bad"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import threading
+import unittest
+from unittest.mock import patch
+from src.kensho import notifications
+from src.kensho.core.dispatcher import NotificationDispatcher
+from src.kensho.notifications import AudioWorker, notify_clock_due
+
+class BlockingBackend:
+    """Records beeps; the first one waits until released."""
+
+    def __init__(self):
+        self.beeps = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self, frequency, duration):
+        self.started.set()
+        self.release.wait(5)
+        self.beeps.append((frequency, duration))
+
+class TestAudioWorker(unittest.TestCase):
+    def setUp(self):
+        self.backend = BlockingBackend()
+        self.worker = AudioWorker(self.backend, maxsize=3)
+
+    def tearDown(self):
+        self.backend.release.set()
+        self.worker.close(timeout=5)
+
+    def test_submit_returns_before_playback(self):
+        self.assertTrue(self.worker.submit("chime"))
+        self.assertTrue(self.backend.started.wait(5))
+        self.assertEqual(self.backend.beeps, [])
+        self.backend.release.set()
+        self.worker.wait_idle()
+        self.assertEqual(self.backend.beeps, [(880, 300)])
+
+    def test_metronome_pattern(self):
+        self.backend.release.set()
+        self.worker.submit("metronome")
+        self.worker.wait_idle()
+        self.assertEqual(self.backend.beeps, [(880, 150), (660, 150)])
+
+    def test_queued_duplicates_coalesce(self):
+        self.worker.submit("chime")
+        self.assertTrue(self.backend.started.wait(5))
+        # The worker is busy; ten more clocks finishing queue one pattern
+        results = [self.worker.submit("chime") for _ in range(10)]
+        self.assertEqual(results.count(True), 1)
+        self.backend.release.set()
+        self.worker.wait_idle()
+        self.assertEqual(len(self.backend.beeps), 2)
+
+    def test_full_queue_drops_requests(self):
+        self.worker.submit("busy")
+        self.assertTrue(self.backend.started.wait(5))
+        accepted = [self.worker.submit(f"sound{i}") for i in range(5)]
+        self.assertEqual(accepted, [True, True, True, False, False])
+        self.backend.release.set()
+        self.worker.wait_idle()
+        self.assertEqual(len(self.backend.beeps), 4)
+
+    def test_backend_errors_do_not_stop_worker(self):
+        calls = []
+
+        def flaky(frequency, duration):
+            calls.append(frequency)
+            if len(calls) == 1:
+                raise RuntimeError("device busy")
+
+        worker = AudioWorker(flaky)
+        worker.submit("metronome")
+        worker.wait_idle()
+        worker.submit("chime")
+        worker.wait_idle()
+        worker.close(timeout=5)
+        self.assertEqual(calls, [880, 880])
+
+class TestNotifyClockDue(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(notifications, "_dispatcher", NotificationDispatcher())
+        self.dispatcher = patcher.start()
+        self.addCleanup(patcher.stop)
+        schedule = patch.object(notifications, "_schedule_dispatch")
+        schedule.start()
+        self.addCleanup(schedule.stop)
+
+    def pending_labels(self):
+        return [c.label for c in self.dispatcher._pending.completions]
+
+    def test_same_label_different_clocks_both_notify(self):
+        notify_clock_due("Focus", "chime", clock_id="c1")
+        notify_clock_due("Focus", "chime", clock_id="c2")
+        self.assertEqual(self.pending_labels(), ["Focus", "Focus"])
+
+    def test_same_clock_is_deduplicated(self):
+        notify_clock_due("Focus", "chime", clock_id="c1")
+        notify_clock_due("Renamed", "chime", clock_id="c1")
+        self.assertEqual(self.pending_labels(), ["Focus"])
+
+if __name__ == "__main__":
+    unittest.main()
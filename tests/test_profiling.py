@@ -0,0 +1,40 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from src.kensho.profiling import StartupProfiler
+
+class TestStartupProfiler(unittest.TestCase):
+    def test_report_orders_phases(self):
+        profiler = StartupProfiler()
+        profiler.mark("imports")
+        profiler.mark("qapplication")
+
+        report = profiler.report()
+        names = [p["phase"] for p in report["phases"]]
+        self.assertEqual(names, ["imports", "qapplication"])
+        first, second = report["phases"]
+        self.assertGreaterEqual(second["at_ms"], first["at_ms"])
+        self.assertAlmostEqual(second["delta_ms"], second["at_ms"] - first["at_ms"], places=2)
+        self.assertEqual(report["total_ms"], second["at_ms"])
+
+    def test_finish_is_noop_when_disabled(self):
+        profiler = StartupProfiler()
+        profiler.mark("imports")
+        self.assertIsNone(profiler.finish())
+
+    def test_finish_writes_once(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            report_path = Path(tmp) / "profile.json"
+            profiler = StartupProfiler()
+            profiler.enable(report_path, Path(tmp) / "startup.pstats")
+            profiler.mark("first_paint")
+
+            self.assertEqual(profiler.finish(), report_path)
+            self.assertIsNone(profiler.finish())
+            report = json.loads(report_path.read_text())
+            self.assertEqual(report["phases"][0]["phase"], "first_paint")
+            self.assertTrue((Path(tmp) / "startup.pstats").exists())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+from src.kensho.core.pulse import PulseFrames, pulse_frames
+
+class TestPulseFrames(unittest.TestCase):
+    def test_widths_breathe_between_base_and_max(self):
+        frames = PulseFrames(8, 3.0, period=2.0, frames=24)
+        self.assertEqual(len(frames), 24)
+        self.assertEqual(frames[0], 8)
+        self.assertAlmostEqual(frames[12], 11.0)
+        self.assertEqual(frames.max_width, 11.0)
+        self.assertTrue(all(8 <= width <= 11 for width in frames.widths))
+        # Symmetric swell and release
+        for k in range(1, 12):
+            self.assertAlmostEqual(frames[k], frames[24 - k])
+
+    def test_lookup_by_time(self):
+        frames = PulseFrames(0, 4.0, period=2.0, frames=8)
+        self.assertAlmostEqual(frames.frame_interval, 0.25)
+        self.assertEqual(frames.index_at(0.0), 0)
+        self.assertEqual(frames.index_at(0.26), 1)
+        self.assertEqual(frames.index_at(1.0), 4)
+        self.assertEqual(frames.index_at(2.1), 0)
+        self.assertAlmostEqual(frames.width_at(1.0), 4.0)
+
+    def test_tables_are_shared(self):
+        self.assertIs(pulse_frames(8, 3.0), pulse_frames(8, 3.0))
+        self.assertIsNot(pulse_frames(8, 3.0), pulse_frames(10, 4.0))
+
+    def test_rejects_empty_table(self):
+        with self.assertRaises(ValueError):
+            PulseFrames(8, 3.0, frames=0)
+
+if __name__ == "__main__":
+    unittest.main()
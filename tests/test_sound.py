@@ -0,0 +1,163 @@
+import os
+import sys
+import tempfile
+import threading
+import types
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+from src.kensho.core.voices import VoicePool
+from src.kensho.core.mixer import Mixer, decode_wav, np
+
+try:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from src.kensho.core.sound import SoundManager
+except ImportError:
+    SoundManager = None
+
+class FakeEffect:
+    def __init__(self):
+        self.source = None
+        self.playing = False
+        self.loads = 0
+
+    def isPlaying(self):
+        return self.playing
+
+    def play(self):
+        self.playing = True
+
+    def stop(self):
+        self.playing = False
+
+    def setVolume(self, volume):
+        pass
+
+def load(effect, source):
+    effect.source = source
+    effect.loads += 1
+
+class FakeSignal:
+    def __init__(self):
+        self.slots = []
+
+    def connect(self, slot):
+        self.slots.append(slot)
+
+    def emit(self):
+        for slot in self.slots:
+            slot()
+
+class FakeMediaDevices:
+    """Stands in for QMediaDevices on a machine without audio outputs."""
+    queries = 0
+
+    def __init__(self):
+        self.audioOutputsChanged = FakeSignal()
+
+    @staticmethod
+    def defaultAudioOutput():
+        FakeMediaDevices.queries += 1
+        return None
+
+def fake_multimedia():
+    module = types.ModuleType("PySide6.QtMultimedia")
+    module.QMediaDevices = FakeMediaDevices
+    module.QAudioFormat = module.QAudioSink = None
+    return module
+
+@unittest.skipIf(SoundManager is None, "PySide6 not installed")
+class TestSoundCache(unittest.TestCase):
+    def setUp(self):
+        self.decodes = 0
+        self.saved = (SoundManager._pool, SoundManager._mixer, SoundManager._sink,
+                      SoundManager._no_output, SoundManager._media_devices)
+
+    def tearDown(self):
+        (SoundManager._pool, SoundManager._mixer, SoundManager._sink,
+         SoundManager._no_output, SoundManager._media_devices) = self.saved
+
+    def decode(self):
+        self.decodes += 1
+        return np.zeros(64, dtype=np.float32)
+
+    def test_effect_voice_is_decoded_once(self):
+        SoundManager._pool = VoicePool(FakeEffect, load, size=3, polyphony=2)
+        with patch.object(SoundManager, "_use_mixer", return_value=False), \
+             patch.object(SoundManager, "_source", return_value=("bell.wav", self.decode)):
+            first = SoundManager.preload("Bell")
+            self.assertIs(SoundManager.preload("Bell"), first)
+            voice = SoundManager._voices().play("bell.wav")
+        self.assertIs(voice, first)
+        self.assertEqual(first.effect.loads, 1)
+        self.assertEqual(len(SoundManager._pool.voices), 1)
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_mixer_buffer_is_decoded_once(self):
+        SoundManager._mixer = Mixer()
+        with patch.object(SoundManager, "_use_mixer", return_value=True), \
+             patch.object(SoundManager, "_source", return_value=("bell.wav", self.decode)):
+            SoundManager.preload("Bell")
+            SoundManager.preload("Bell")
+        self.assertEqual(self.decodes, 1)
+        self.assertTrue(SoundManager._mixer.has("bell.wav"))
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_undecodable_wav_falls_back_to_effects(self):
+        SoundManager._mixer = Mixer()
+        SoundManager._pool = VoicePool(FakeEffect, load, size=3, polyphony=2)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "float.wav"
+            path.write_bytes(b"RIFX not a wav I can read")
+            source = (path, path)
+            with patch.object(SoundManager, "_use_mixer", return_value=True), \
+                 patch.object(SoundManager, "_source", return_value=source):
+                SoundManager.play_sound("Float")
+                SoundManager.play_sound("Float")
+        self.assertFalse(SoundManager._mixer.has(path))
+        self.assertEqual(SoundManager._mixer.active_voices, 0)
+        self.assertEqual([v.effect.source for v in SoundManager._pool.voices], [path, path])
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_warm_decodes_off_thread_without_opening_output(self):
+        SoundManager._mixer = None
+        with patch.dict(os.environ, {"KENSHO_AUDIO": "mixer"}), \
+             patch.object(SoundManager, "_mixer_output") as output, \
+             patch.object(SoundManager, "_source", return_value=("bell.wav", self.decode)):
+            SoundManager.warm("Bell")
+            for thread in threading.enumerate():
+                if thread.name == "kensho-sound-warm":
+                    thread.join(5)
+        output.assert_not_called()
+        self.assertEqual(self.decodes, 1)
+        self.assertTrue(SoundManager._mixer.has("bell.wav"))
+
+    def test_missing_output_is_remembered(self):
+        SoundManager._sink = None
+        SoundManager._no_output = False
+        SoundManager._media_devices = None
+        FakeMediaDevices.queries = 0
+        with patch.dict(sys.modules, {"PySide6.QtMultimedia": fake_multimedia()}):
+            self.assertIsNone(SoundManager._mixer_output())
+            self.assertIsNone(SoundManager._mixer_output())
+            self.assertEqual(FakeMediaDevices.queries, 1)
+
+            # Plugging in a device makes the next chime look again
+            SoundManager._media_devices.audioOutputsChanged.emit()
+            self.assertIsNone(SoundManager._mixer_output())
+            self.assertEqual(FakeMediaDevices.queries, 2)
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_synth_file_is_written_whole(self):
+        with tempfile.TemporaryDirectory() as tmp, \
+             patch("src.kensho.core.sound.tempfile.gettempdir", return_value=tmp):
+            path = SoundManager._synth_file(("bell", 2))
+            self.assertGreater(len(decode_wav(path)), 0)
+            self.assertEqual(sorted(p.name for p in path.parent.iterdir()), [path.name])
+            # Cached: a second call does not render again
+            with patch("src.kensho.core.synth.render") as render:
+                self.assertEqual(SoundManager._synth_file(("bell", 2)), path)
+            render.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,54 +1,154 @@
 import unittest
 import json
 import os
+import tempfile
 from pathlib import Path
-from unittest.mock import patch, mock_open
-from src.kensho.storage import load_app_state, save_app_state, APP_STATE_FILENAME
+from unittest.mock import patch
+from src.kensho.storage import (JsonFileBackend, MemoryBackend, SqliteBackend,
+                                StorageBackend, create_backend)
+
+class TestStorageBackend(unittest.TestCase):
+    def test_base_class_is_abstract(self):
+        with self.assertRaises(TypeError):
+            StorageBackend()
+
+    def test_incomplete_backend_cannot_be_built(self):
+        class HalfBackend(StorageBackend):
+            def load(self, key, default=None):
+                return default
+
+        with self.assertRaises(TypeError):
+            HalfBackend()
+
+class BackendContract:
+    """Behaviour every StorageBackend must share."""
+
+    def make_backend(self):
+        raise NotImplementedError
 
-class TestStorage(unittest.TestCase):
     def setUp(self):
-        self.sample_state = {"window": {"pinned": True}}
-
-    @patch("src.kensho.storage.APP_STATE_FILE")
-    @patch("src.kensho.storage.ensure_data_dir")
-    def test_load_app_state_success(self, mock_ensure, mock_file_path):
-        mock_file_path.exists.return_value = True
-        
-        # Mock the file opening and reading
-        m = mock_open(read_data=json.dumps(self.sample_state))
-        mock_file_path.open = m
-        
-        state = load_app_state()
-        self.assertEqual(state, self.sample_state)
-        mock_ensure.assert_called_once()
-
-    @patch("src.kensho.storage.APP_STATE_FILE")
-    @patch("src.kensho.storage.ensure_data_dir")
-    def test_load_app_state_no_file(self, mock_ensure, mock_file_path):
-        mock_file_path.exists.return_value = False
-        
-        state = load_app_state()
-        self.assertEqual(state, {})
-
-    @patch("src.kensho.storage.APP_STATE_FILE")
-    @patch("src.kensho.storage.ensure_data_dir")
-    def test_save_app_state(self, mock_ensure, mock_file_path):
-        # Setup mock for temporary file
-        mock_tmp = unittest.mock.MagicMock()
-        mock_file_path.with_suffix.return_value = mock_tmp
-        
-        m = mock_open()
-        mock_tmp.open = m
-        
-        save_app_state(self.sample_state)
-        
-        # Verify write
-        handle = m()
-        written = "".join(call.args[0] for call in handle.write.call_args_list)
-        self.assertEqual(json.loads(written), self.sample_state)
-        
-        # Verify rename
-        mock_tmp.replace.assert_called_with(mock_file_path)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.backend = self.make_backend()
+
+    def tearDown(self):
+        if hasattr(self.backend, "close"):
+            self.backend.close()
+        self.tmp.cleanup()
+
+    def test_missing_key_returns_default(self):
+        self.assertEqual(self.backend.load("state", {"clocks": []}), {"clocks": []})
+
+    def test_round_trip(self):
+        payload = {"clocks": [{"identifier": "c1"}], "sound": "Piano - C4"}
+        self.backend.save("state", payload)
+        self.assertEqual(self.backend.load("state"), payload)
+
+    def test_loaded_value_is_a_copy(self):
+        self.backend.save("history", [])
+        loaded = self.backend.load("history")
+        loaded.append({"clock_name": "x"})
+        self.assertEqual(self.backend.load("history"), [])
+
+    def test_delete(self):
+        self.backend.save("history", [1, 2])
+        self.backend.delete("history")
+        self.assertIsNone(self.backend.load("history"))
+        # Deleting twice is harmless
+        self.backend.delete("history")
+
+    def test_log_append_and_read(self):
+        self.assertEqual(self.backend.read_log("journal"), [])
+        self.backend.append("journal", {"s": 1, "op": "start"})
+        self.backend.append("journal", {"s": 2, "op": "pause"})
+        self.assertEqual([r["s"] for r in self.backend.read_log("journal")], [1, 2])
+
+    def test_log_clear(self):
+        self.backend.append("journal", {"s": 1})
+        self.backend.clear_log("journal")
+        self.assertEqual(self.backend.read_log("journal"), [])
+
+
+class TestMemoryBackend(BackendContract, unittest.TestCase):
+    def make_backend(self):
+        return MemoryBackend()
+
+
+class TestJsonFileBackend(BackendContract, unittest.TestCase):
+    def make_backend(self):
+        return JsonFileBackend(self.root / "data")
+
+    def test_writes_one_file_per_key(self):
+        self.backend.save("state", {"sound": "x"})
+        path = self.root / "data" / "state.json"
+        self.assertTrue(path.exists())
+        self.assertFalse(path.with_suffix(".tmp").exists())
+
+    def test_corrupt_file_returns_default(self):
+        (self.root / "data").mkdir()
+        (self.root / "data" / "state.json").write_text("{not json")
+        self.assertEqual(self.backend.load("state", {}), {})
+
+    def test_reads_legacy_location(self):
+        legacy = self.root / "legacy"
+        legacy.mkdir()
+        (legacy / "history.json").write_text(json.dumps([{"a": 1}]))
+        backend = JsonFileBackend(self.root / "data", legacy_root=legacy)
+        self.assertEqual(backend.load("history"), [{"a": 1}])
+
+    def test_log_skips_torn_line(self):
+        self.backend.append("journal", {"s": 1})
+        with (self.root / "data" / "journal.jsonl").open("a") as handle:
+            handle.write('{"s": 2, "op')
+        self.assertEqual(self.backend.read_log("journal"), [{"s": 1}])
+
+
+    def test_log_with_bad_bytes_reads_empty(self):
+        (self.root / "data").mkdir()
+        (self.root / "data" / "journal.jsonl").write_bytes(b'{"s": 1}\n\xff\xfe\n')
+        self.assertEqual(self.backend.read_log("journal"), [])
+
+
+class TestSqliteBackend(BackendContract, unittest.TestCase):
+    def make_backend(self):
+        return SqliteBackend(self.root / "kensho.db")
+
+    def test_log_skips_corrupt_row(self):
+        self.backend.append("journal", {"s": 1})
+        with self.backend._conn:
+            self.backend._conn.execute(
+                "INSERT INTO logs (key, value) VALUES ('journal', '{not json')")
+        self.assertEqual(self.backend.read_log("journal"), [{"s": 1}])
+
+    def test_load_error_returns_default(self):
+        self.backend.save("state", {"sound": "x"})
+        with self.backend._conn:
+            self.backend._conn.execute("DROP TABLE documents")
+        self.assertEqual(self.backend.load("state", {}), {})
+
+    def test_log_read_error_reads_empty(self):
+        with self.backend._conn:
+            self.backend._conn.execute("DROP TABLE logs")
+        self.assertEqual(self.backend.read_log("journal"), [])
+
+
+class TestCreateBackend(unittest.TestCase):
+    def test_selects_by_name(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertIsInstance(create_backend("memory"), MemoryBackend)
+            self.assertIsInstance(create_backend("json", Path(tmp)), JsonFileBackend)
+            backend = create_backend("sqlite", Path(tmp))
+            self.assertIsInstance(backend, SqliteBackend)
+            backend.close()
+
+    @patch.dict(os.environ, {"KENSHO_STORAGE": "memory"})
+    def test_reads_environment(self):
+        self.assertIsInstance(create_backend(), MemoryBackend)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            create_backend("floppy")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+from src.kensho.core.synth import PEAK, PRESETS, SAMPLE_RATE, np, render, transpose
+
+def spectrum(samples):
+    magnitudes = np.abs(np.fft.rfft(samples * np.hanning(len(samples))))
+    freqs = np.fft.rfftfreq(len(samples), 1.0 / SAMPLE_RATE)
+    return freqs, magnitudes
+
+def strongest(samples):
+    freqs, magnitudes = spectrum(samples)
+    return freqs[np.argmax(magnitudes)]
+
+def energy_near(samples, frequency, width=8.0):
+    freqs, magnitudes = spectrum(samples)
+    band = np.abs(freqs - frequency) <= width
+    return magnitudes[band].max()
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestSynth(unittest.TestCase):
+    def test_presets_render_normalized_float32(self):
+        for name, preset in PRESETS.items():
+            samples = render(name)
+            self.assertEqual(samples.dtype, np.float32, name)
+            self.assertEqual(len(samples), int(preset.duration * SAMPLE_RATE), name)
+            self.assertAlmostEqual(float(np.abs(samples).max()), PEAK, places=4)
+            # Starts and ends at silence so playback never clicks
+            self.assertEqual(samples[0], 0.0)
+            self.assertEqual(samples[-1], 0.0)
+
+    def test_fundamental_is_strongest_partial(self):
+        self.assertAlmostEqual(strongest(render("kalimba")), 523.25, delta=2.0)
+        self.assertAlmostEqual(strongest(render("chime")), 880.0, delta=2.0)
+
+    def test_bell_contains_inharmonic_partials(self):
+        samples = render("bell")
+        noise = energy_near(samples, 700.0)
+        for partial in PRESETS["bell"].partials:
+            self.assertGreater(energy_near(samples, 440.0 * partial.ratio), 10 * noise)
+
+    def test_pitch_shift_moves_spectrum(self):
+        self.assertAlmostEqual(strongest(render("chime", semitones=12)), 1760.0, delta=3.0)
+        self.assertAlmostEqual(strongest(render("kalimba", frequency=300.0)), 300.0, delta=2.0)
+        self.assertAlmostEqual(transpose(440.0, 7), 659.26, places=2)
+
+    def test_partials_above_nyquist_are_dropped(self):
+        samples = render("kalimba", frequency=4200.0)
+        freqs, magnitudes = spectrum(samples)
+        self.assertLess(magnitudes[freqs > 20000].max(), magnitudes.max() * 1e-3)
+
+    def test_decays_over_time(self):
+        samples = render("bell")
+        quarter = len(samples) // 4
+        head = np.sqrt(np.mean(samples[:quarter] ** 2))
+        tail = np.sqrt(np.mean(samples[-quarter:] ** 2))
+        self.assertLess(tail, head / 3)
+
+    def test_renders_are_cached_and_read_only(self):
+        first = render("chime", semitones=4)
+        self.assertIs(render("chime", semitones=4), first)
+        self.assertFalse(first.flags.writeable)
+
+if __name__ == "__main__":
+    unittest.main()
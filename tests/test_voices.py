@@ -0,0 +1,90 @@
+import unittest
+from src.kensho.core.voices import VoicePool
+
+class FakeEffect:
+    created = 0
+
+    def __init__(self):
+        FakeEffect.created += 1
+        self.source = None
+        self.playing = False
+        self.volume = None
+        self.loads = 0
+
+    def isPlaying(self):
+        return self.playing
+
+    def play(self):
+        self.playing = True
+
+    def stop(self):
+        self.playing = False
+
+    def setVolume(self, volume):
+        self.volume = volume
+
+def load(effect, source):
+    effect.source = source
+    effect.loads += 1
+
+class TestVoicePool(unittest.TestCase):
+    def setUp(self):
+        FakeEffect.created = 0
+        self.now = 0.0
+        self.pool = VoicePool(FakeEffect, load, size=3, polyphony=2, clock=self.tick)
+
+    def tick(self):
+        self.now += 1.0
+        return self.now
+
+    def test_reuses_decoded_voice(self):
+        voice = self.pool.play("bell")
+        voice.effect.stop()
+        again = self.pool.play("bell")
+        self.assertIs(again, voice)
+        self.assertEqual(voice.effect.loads, 1)
+
+    def test_simultaneous_sounds_use_separate_voices(self):
+        a = self.pool.play("bell")
+        b = self.pool.play("bell")
+        self.assertIsNot(a, b)
+        self.assertTrue(a.effect.playing and b.effect.playing)
+
+    def test_polyphony_limit_steals_oldest(self):
+        first = self.pool.play("a")
+        self.pool.play("b")
+        stolen = self.pool.play("c")
+        self.assertIs(stolen, first)
+        self.assertEqual(stolen.effect.source, "c")
+        self.assertEqual(self.pool.playing_count(), 2)
+
+    def test_pool_never_grows_past_size(self):
+        for i in range(50):
+            voice = self.pool.play(f"s{i % 5}")
+            if i % 2:
+                voice.effect.stop()
+        self.assertEqual(len(self.pool.voices), 3)
+        self.assertEqual(FakeEffect.created, 3)
+
+    def test_retrigger_restarts_same_voice(self):
+        voice = self.pool.play("chime", retrigger=True)
+        again = self.pool.play("chime", retrigger=True)
+        self.assertIs(again, voice)
+        self.assertEqual(len(self.pool.voices), 1)
+
+    def test_per_voice_volume(self):
+        quiet = self.pool.play("a", volume=0.25)
+        loud = self.pool.play("b", volume=3.0)
+        self.assertEqual(quiet.effect.volume, 0.25)
+        self.assertEqual(loud.effect.volume, 1.0)
+
+    def test_preload_does_not_interrupt_playback(self):
+        for source in ("a", "b"):
+            self.pool.play(source)
+        self.pool.preload("c")
+        self.pool.preload("d")  # only the idle "c" voice may be reloaded
+        self.assertEqual(self.pool.playing_count(), 2)
+        self.assertEqual(sorted(v.source for v in self.pool.voices), ["a", "b", "d"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import unittest
+
+try:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtCore import QCoreApplication, QEvent
+    from PySide6.QtGui import QColor
+    from PySide6.QtWidgets import QApplication, QWidget
+    from src.kensho.core.history import HistoryManager
+    from src.kensho.core.models import ClockUnit
+    from src.kensho.storage import MemoryBackend
+    from src.kensho.ui.clock_model import ClockListModel
+    from src.kensho.ui.widget_mode import NotificationManager, WidgetMode
+except ImportError:
+    QApplication = None
+
+@unittest.skipIf(QApplication is None, "PySide6 not installed")
+class TestNotificationManager(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication([])
+        self.anchor = QWidget()
+        self.manager = NotificationManager(self.anchor, max_windows=3, dismiss_ms=0)
+        self.color = QColor("#8b5cf6")
+
+    def tearDown(self):
+        self.manager.clear()
+        self.anchor.deleteLater()
+
+    def show(self, message):
+        return self.manager.show(message, self.color, None)
+
+    def test_pool_stays_bounded(self):
+        for n in range(10):
+            self.show(f"Clock {n} is ready")
+            self.assertLessEqual(self.manager.window_count, 3)
+        self.assertEqual(self.manager.live_count, 3)
+
+    def test_oldest_window_is_reused(self):
+        first = self.show("one")
+        self.show("two")
+        self.show("three")
+        reused = self.show("four")
+        self.assertIs(reused, first)
+        self.assertEqual(reused.label.text(), "four")
+        self.assertEqual(self.manager.window_count, 3)
+
+    def test_dismissed_window_returns_to_pool(self):
+        first = self.show("one")
+        first.close()
+        self.assertEqual(self.manager.live_count, 0)
+        self.assertIs(self.show("two"), first)
+        self.assertEqual(self.manager.window_count, 1)
+
+@unittest.skipIf(QApplication is None, "PySide6 not installed")
+class TestWidgetModeConnections(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication([])
+        self.model = ClockListModel()
+        self.clocks = [ClockUnit("c1", "Deep Work", 45), ClockUnit("c2", "Rest", 15)]
+        self.model.set_clocks(self.clocks)
+
+    def receivers(self):
+        counts = [self.model.receivers("2clock_finished(PyObject,int)"),
+                  self.model.receivers("2dataChanged(QModelIndex,QModelIndex,QList<int>)")]
+        for clock in self.clocks:
+            counts += [clock.receivers("2ticked(double)"), clock.receivers("2finished()"),
+                       clock.receivers("2paused_changed(bool)")]
+        return counts
+
+    def test_open_close_cycles_leave_connections_unchanged(self):
+        before = self.receivers()
+        for _ in range(3):
+            widget = WidgetMode(self.model, history_manager=HistoryManager(MemoryBackend()))
+            widget.show()
+            self.assertGreater(self.receivers()[0], before[0])
+            widget.close()
+            widget.deleteLater()
+            QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+            self.assertEqual(self.receivers(), before)
+
+if __name__ == '__main__':
+    unittest.main()